@@ -1,495 +1,103 @@
 # __init__.py
-from flask import Flask
+import os
+
+from flask import Flask, g, request
 from .config import Config
+from . import views
+from .generation import BatchingGenerator, create_backend
+from .metrics import metrics
+from .models import ExampleAgent, GlossaryAgent
+from .profiling import profiler
+from .repository import SQLiteRepository
 from .views import bp as views_bp  # Import blueprint from views
 
 def create_app():
     """Initialize and configure the Flask application."""
-    app = Flask(__name__)
+    # Templates and static files live at the project root, next to this package
+    app = Flask(__name__, template_folder='../templates', static_folder='../static')
     app.config.from_object(Config)  # Load configuration from config.py
-    
-    # Register blueprints (routes/views)
-    app.register_blueprint(views_bp)
-    
-    return app
-
-# Create the app instance
-app = create_app()
-
-if __name__ == "__main__":
-    app.run(debug=True)  # Run in debug mode for development
-
-I'll help you upgrade this Flask application code to be more production-ready. Here's an improved version with best practices and security considerations: [1]
-
-# __init__.py
-import os
-from flask import Flask
-from .config import Config
-from .views import bp as views_bp
-from flask_talisman import Talisman  # For security headers
-from werkzeug.middleware.proxy_fix import ProxyFix
-import logging
-from logging.handlers import RotatingFileHandler
-
-def configure_logging(app):
-    """Set up logging for the application."""
-    if not os.path.exists('logs'):
-        os.mkdir('logs')
-    
-    file_handler = RotatingFileHandler(
-        'logs/app.log', 
-        maxBytes=10240,
-        backupCount=10
-    )
-    file_handler.setFormatter(logging.Formatter(
-        '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
-    ))
-    file_handler.setLevel(logging.INFO)
-    app.logger.addHandler(file_handler)
-    app.logger.setLevel(logging.INFO)
-    app.logger.info('Application startup')
-
-def create_app(config_class=Config):
-    """Initialize and configure the Flask application."""
-    app = Flask(__name__)
-    
-    # Load configuration
-    app.config.from_object(config_class)
-    
-    # Security headers
-    Talisman(app, 
-             force_https=True,
-             strict_transport_security=True,
-             session_cookie_secure=True)
-    
-    # Handle proxy servers
-    app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
-    
-    # Register blueprints
-    app.register_blueprint(views_bp)
-    
-    # Configure logging
-    if not app.debug and not app.testing:
-        configure_logging(app)
-    
-    # Error handlers
-    @app.errorhandler(404)
-    def not_found_error(error):
-        return {'error': 'Not found'}, 404
-
-    @app.errorhandler(500)
-    def internal_error(error):
-        return {'error': 'Internal server error'}, 500
-    
-    return app
-
-# Create the app instance
-app = create_app()
-
-# Only for development
-if __name__ == "__main__":
-    # Never run with debug=True in production
-    app.run(host='127.0.0.1', port=5000, debug=False)
-
-Copy
-
-Insert at cursor
-python
-Key improvements made:
-
-Added proper logging configuration with rotating log files
-
-Implemented security headers using Flask-Talisman
-
-Added ProxyFix middleware for proper handling of proxy servers
-
-Added basic error handlers for 404 and 500 errors
-
-Removed debug mode from production
-
-Made the configuration class configurable
-
-Added host and port specifications
-
-Implemented proper separation of development and production environments
-
-You should also create a separate configuration file (config.py) with different configurations for development and production:
-
-# config.py
-import os
-from datetime import timedelta
-
-class Config:
-    # Basic Flask configuration
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'you-must-change-this-in-production'
-    
-    # Security settings
-    SESSION_COOKIE_HTTPONLY = True
-    REMEMBER_COOKIE_HTTPONLY = True
-    REMEMBER_COOKIE_DURATION = timedelta(days=7)
-    
-    # Add other configuration settings as needed
-    pass
-
-class ProductionConfig(Config):
-    DEBUG = False
-    TESTING = False
-    # Add production-specific settings
-    
-class DevelopmentConfig(Config):
-    DEBUG = True
-    
-class TestingConfig(Config):
-    TESTING = True
-
-Copy
-
-Insert at cursor
-python
-For deployment, you should also:
-
-Use environment variables for sensitive configuration
-
-Set up proper WSGI server (like Gunicorn or uWSGI)
-
-Implement rate limiting
-
-Set up monitoring and error tracking
-
-Use SSL/TLS in production
-
-Implement proper database connection handling if using a database
-
-Set up proper caching mechanisms
-
-You might want to add these additional dependencies to your requirements.txt:
-
-flask-talisman
-gunicorn
-python-dotenv
-
-Copy
-
-Insert at cursor
-text
-This upgraded version provides a more robust foundation for a production Flask application with better security, logging, and error handling.
-
-Sources
-[1] Deploying Your Flask Application to Production: A Step-by-Step Guide
-https://codymohit.com/deploying-your-flask-application-to-production-a-step-by-step-guide
-    
-I'll help you enhance the logging configuration and implement rate limiting. Here's the improved code:
-
-# __init__.py
-import os
-from flask import Flask, request
-from .config import Config
-from .views import bp as views_bp
-from flask_talisman import Talisman
-from werkzeug.middleware.proxy_fix import ProxyFix
-import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
-import json
-from datetime import datetime
-import queue
-from threading import Thread
-import atexit
-
-# Custom JSON formatter for structured logging
-class JSONFormatter(logging.Formatter):
-    def format(self, record):
-        log_record = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'level': record.levelname,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno
-        }
-        if hasattr(record, 'request_id'):
-            log_record['request_id'] = record.request_id
-        if record.exc_info:
-            log_record['exc_info'] = self.formatException(record.exc_info)
-        return json.dumps(log_record)
-
-# Async logging handler using queue
-class AsyncHandler(logging.Handler):
-    def __init__(self, handler):
-        super().__init__(handler.level)
-        self.handler = handler
-        self.queue = queue.Queue()
-        self.thread = Thread(target=self._process_logs, daemon=True)
-        self.thread.start()
-
-    def emit(self, record):
-        self.queue.put(record)
-
-    def _process_logs(self):
-        while True:
-            try:
-                record = self.queue.get()
-                self.handler.emit(record)
-                self.queue.task_done()
-            except Exception:
-                continue
-
-    def close(self):
-        self.queue.join()
-        super().close()
-
-def configure_logging(app):
-    """Configure enhanced logging with rotation, async processing, and structured output."""
-    if not os.path.exists('logs'):
-        os.mkdir('logs')
-
-    # Configure main application log
-    main_handler = TimedRotatingFileHandler(
-        'logs/app.log',
-        when='midnight',
-        interval=1,
-        backupCount=30,
-        encoding='utf-8'
-    )
-    main_handler.setFormatter(JSONFormatter())
-    
-    # Configure error log with size-based rotation
-    error_handler = RotatingFileHandler(
-        'logs/error.log',
-        maxBytes=10485760,  # 10MB
-        backupCount=20,
-        encoding='utf-8'
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(JSONFormatter())
-
-    # Configure access log
-    access_handler = TimedRotatingFileHandler(
-        'logs/access.log',
-        when='midnight',
-        interval=1,
-        backupCount=30,
-        encoding='utf-8'
+    metrics.enabled = app.config.get('METRICS_ENABLED', True)
+
+    # Share one persistent glossary between workers and restarts when configured
+    repository = None
+    if app.config.get('GLOSSARY_DATABASE'):
+        repository = SQLiteRepository(app.config['GLOSSARY_DATABASE'])
+    generator = None
+    if app.config.get('GENERATOR_BACKEND', 'stub') != 'stub':
+        generator = BatchingGenerator(
+            create_backend(app.config['GENERATOR_BACKEND'], app.config.get('GENERATOR_MODEL')),
+            app.config.get('GENERATOR_MAX_BATCH', 8), app.config.get('GENERATOR_MAX_WAIT', 0.01)
+        )
+    snapshot = app.config.get('GLOSSARY_SNAPSHOT') if repository is None else None
+    agent = None
+    if snapshot:
+        # Imported here so "python -m ai_agents.snapshot" does not import itself twice
+        from .snapshot import SnapshotError, SnapshotWatcher, load_snapshot, swap_in, write_at_exit
+    if snapshot and os.path.exists(snapshot):
+        try:
+            agent = load_snapshot(snapshot, generator=generator)
+        except SnapshotError as error:
+            app.logger.warning("Ignoring glossary snapshot: %s", error)
+    if agent is None and (repository is not None or generator is not None or snapshot):
+        agent = GlossaryAgent(repository=repository, generator=generator)
+    if agent is not None:
+        views.use_agent(agent)
+    if snapshot:
+        # Saved on graceful shutdown, so the next start skips seeding and index builds
+        write_at_exit(views.glossary_agent, snapshot)
+    views.glossary_agent.example_agent = ExampleAgent(
+        seed=app.config.get('EXAMPLE_SEED', 0), max_examples=app.config.get('MAX_EXAMPLES', 5)
     )
-    access_handler.setFormatter(JSONFormatter())
-
-    # Make handlers asynchronous
-    async_main_handler = AsyncHandler(main_handler)
-    async_error_handler = AsyncHandler(error_handler)
-    async_access_handler = AsyncHandler(access_handler)
-
-    # Add handlers to app logger
-    app.logger.addHandler(async_main_handler)
-    app.logger.addHandler(async_error_handler)
-    app.logger.setLevel(logging.INFO)
-
-    # Register cleanup on application shutdown
-    atexit.register(async_main_handler.close)
-    atexit.register(async_error_handler.close)
-    atexit.register(async_access_handler.close)
-
-    return async_access_handler
-
-# Rate limiting configuration
-def get_key_func():
-    """Get a key function that combines IP and User-Agent."""
-    return f"{get_remote_address()}-{request.headers.get('User-Agent', '')}"
-
-def configure_rate_limiting(app):
-    """Configure rate limiting with multiple rules and storage backend."""
-    limiter = Limiter(
-        app=app,
-        key_func=get_key_func,
-        default_limits=["200 per day", "50 per hour"],
-        storage_uri="memory://",  # Use redis:// in production
-    )
-
-    # Custom error handler for rate limiting
-    @app.errorhandler(429)
-    def ratelimit_handler(e):
-        return {
-            "error": "ratelimit exceeded",
-            "message": str(e.description),
-            "retry_after": int(e.retry_after)
-        }, 429
+    views.glossary_agent.max_terms = app.config.get('LEARN_MAX_TERMS')
+    # Seed at startup rather than on the first home page view
+    views.glossary_agent.learn_starter_terms()
+    # Related terms cost O(n²) to build, so start now, off the request path
+    views.glossary_agent.refresh_related_terms()
+    if app.config.get('JOB_WORKERS') and views.glossary_agent.jobs is None:
+        views.glossary_agent.start_jobs(
+            app.config['JOB_WORKERS'], backend=app.config.get('GENERATOR_BACKEND', 'stub'),
+            model=app.config.get('GENERATOR_MODEL'), processes=app.config.get('JOB_PROCESSES', True),
+            max_attempts=app.config.get('JOB_MAX_ATTEMPTS', 3),
+            max_queued=app.config.get('JOB_MAX_QUEUED', 10_000)
+        )
+    
+    if snapshot and app.config.get('SNAPSHOT_RELOAD_INTERVAL'):
+        watcher = SnapshotWatcher(snapshot, app.config['SNAPSHOT_RELOAD_INTERVAL'])
 
-    return limiter
-
-def create_app(config_class=Config):
-    """Initialize and configure the Flask application."""
-    app = Flask(__name__)
-    app.config.from_object(config_class)
-
-    # Security headers
-    Talisman(app,
-             force_https=True,
-             strict_transport_security=True,
-             session_cookie_secure=True)
-
-    # Handle proxy servers
-    app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
-
-    # Configure logging
-    if not app.debug and not app.testing:
-        access_handler = configure_logging(app)
-
-        # Log requests
         @app.before_request
-        def before_request():
-            request.start_time = datetime.utcnow()
-
-        @app.after_request
-        def after_request(response):
-            if hasattr(request, 'start_time'):
-                duration = datetime.utcnow() - request.start_time
-                log_data = {
-                    'method': request.method,
-                    'path': request.path,
-                    'status': response.status_code,
-                    'duration': duration.total_seconds(),
-                    'ip': request.remote_addr,
-                    'user_agent': request.headers.get('User-Agent', ''),
-                }
-                access_handler.emit(
-                    logging.makeLogRecord({
-                        'msg': json.dumps(log_data),
-                        'levelname': 'INFO',
-                    })
-                )
-            return response
+        def swap_snapshot():
+            # Another process published a newer glossary; switch to it between requests
+            if watcher.changed():
+                try:
+                    agent = swap_in(snapshot, views.glossary_agent)
+                except SnapshotError as error:
+                    app.logger.warning("Ignoring glossary snapshot: %s", error)
+                    return
+                views.use_agent(agent)
+                write_at_exit(agent, snapshot)
+
+    profiler.rate = app.config.get('PROFILE_SAMPLE_RATE', 0.0)
+    profiler.interval = app.config.get('PROFILE_INTERVAL', 0.005)
+    if profiler.rate > 0:
+        @app.before_request
+        def start_profile():
+            if profiler.should_sample():
+                g.profiled = True
+                profiler.start(request.endpoint or 'unmatched')
 
-    # Configure rate limiting
-    limiter = configure_rate_limiting(app)
+        @app.teardown_request
+        def stop_profile(error=None):
+            # Runs after streamed bodies finish, so their generation is sampled too
+            if g.pop('profiled', False):
+                profiler.stop()
 
-    # Register blueprints with rate limits
+    # Register blueprints (routes/views)
     app.register_blueprint(views_bp)
-
-    # Apply specific rate limits to blueprint routes
-    @views_bp.before_request
-    @limiter.limit("30 per minute")  # Additional limit for all blueprint routes
-    def blueprint_limit():
-        pass
-
-    # Error handlers
-    @app.errorhandler(404)
-    def not_found_error(error):
-        app.logger.warning(f"404 error at {request.path}")
-        return {'error': 'Not found'}, 404
-
-    @app.errorhandler(500)
-    def internal_error(error):
-        app.logger.error(f"500 error at {request.path}", exc_info=error)
-        return {'error': 'Internal server error'}, 500
-
+    
     return app
 
-# Create the app instance
-app = create_app()
-
+# No app is created at import time: importing the package (for the snapshot
+# tool, tests or a forked worker) must not load the glossary or start threads.
+# Servers call the factory, e.g. gunicorn "ai_agents:create_app()".
 if __name__ == "__main__":
-    app.run(host='127.0.0.1', port=5000, debug=False)
-
-Copy
-
-Insert at cursor
-python
-And here's the updated configuration file with rate limiting settings:
-
-# config.py
-import os
-from datetime import timedelta
-
-class Config:
-    # Basic Flask configuration
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'you-must-change-this-in-production'
-    
-    # Security settings
-    SESSION_COOKIE_HTTPONLY = True
-    REMEMBER_COOKIE_HTTPONLY = True
-    REMEMBER_COOKIE_DURATION = timedelta(days=7)
-    
-    # Rate limiting settings
-    RATELIMIT_STORAGE_URL = os.environ.get('REDIS_URL', 'memory://')
-    RATELIMIT_STRATEGY = 'fixed-window-elastic-expiry'
-    RATELIMIT_HEADERS_ENABLED = True
-    
-    # Logging configuration
-    LOG_FORMAT = 'json'
-    LOG_LEVEL = 'INFO'
-    
-class ProductionConfig(Config):
-    DEBUG = False
-    TESTING = False
-    RATELIMIT_STORAGE_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
-
-class DevelopmentConfig(Config):
-    DEBUG = True
-    LOG_LEVEL = 'DEBUG'
-    
-class TestingConfig(Config):
-    TESTING = True
-    RATELIMIT_ENABLED = False
-
-Copy
-
-Insert at cursor
-python
-Key improvements made:
-
-Enhanced Logging:
-
-Implemented structured JSON logging
-
-Added async logging using a queue system
-
-Separated logs into different files (app.log, error.log, access.log)
-
-Added request timing and detailed access logging
-
-Implemented both time-based and size-based log rotation
-
-Added cleanup handlers for graceful shutdown
-
-Rate Limiting:
-
-Implemented sophisticated rate limiting using Flask-Limiter
-
-Added multiple rate limit rules (global and per-route)
-
-Combined IP and User-Agent for better rate limit accuracy
-
-Added custom error handling for rate limits
-
-Configured different rate limit storage backends for development and production
-
-Added detailed logging for rate limit violations
-
-To use this code, you'll need to add these dependencies to your requirements.txt:
-
-flask-talisman
-flask-limiter
-redis
-python-dotenv
-
-Copy
-
-Insert at cursor
-text
-For production deployment, you should:
-
-Use Redis as the rate limit storage backend instead of in-memory storage
-
-Adjust the rate limit values based on your application's needs
-
-Configure log rotation based on your storage capacity
-
-Set up log aggregation and monitoring
-
-Consider using a centralized logging service
-
-Monitor rate limit violations and adjust as needed
-
-Set up alerts for excessive rate limit violations
-
-This implementation provides robust protection against DDoS attacks while maintaining detailed logging for monitoring and debugging purposes.
+    create_app().run(debug=True)  # Run in debug mode for development
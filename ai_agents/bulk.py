@@ -0,0 +1,217 @@
+# bulk.py
+"""Streaming import and export of glossary terms as JSONL or CSV.
+
+Usage:
+
+    python -m ai_agents.bulk import vendor_terms.jsonl --database glossary.db
+    python -m ai_agents.bulk export glossary.csv --database glossary.db
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .keys import canonical_key
+from .models import DefinitionAgent
+from .repository import SQLiteRepository
+
+FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+CSV_FIELDS = ["term", "definition", "category", "examples", "created_at"]
+
+
+class RowError(ValueError):
+    """Raised for an input row that cannot be imported."""
+
+
+class ImportStats:
+    """Running totals reported to progress callbacks and returned by import_terms."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.read = 0
+        self.imported = 0
+        self.examples = 0
+        self.rejected = 0
+        self.batches = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (f"ImportStats(read={self.read}, imported={self.imported}, "
+                f"examples={self.examples}, rejected={self.rejected}, "
+                f"rows_per_second={self.rows_per_second:.0f})")
+
+
+def detect_format(path: str) -> str:
+    """Infer the file format from its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Cannot infer format of {path!r}; use .jsonl or .csv")
+    return FORMATS[extension]
+
+
+def validate(record: Dict) -> Tuple[str, str, str, List[str]]:
+    """Check one parsed record and return (term, definition, category, examples)."""
+    if not isinstance(record, dict):
+        raise RowError("row is not an object")
+    term = record.get("term")
+    definition = record.get("definition")
+    category = record.get("category") or "General AI"
+    examples = record.get("examples") or []
+    if not isinstance(term, str) or not term.strip():
+        raise RowError("missing term")
+    if not isinstance(definition, str) or not definition.strip():
+        raise RowError("missing definition")
+    if not isinstance(category, str):
+        raise RowError("category must be a string")
+    if isinstance(examples, str):
+        # CSV stores one example per line within the cell
+        examples = [line for line in examples.splitlines() if line.strip()]
+    if not isinstance(examples, list) or not all(isinstance(e, str) for e in examples):
+        raise RowError("examples must be a list of strings")
+    return term.strip(), definition.strip(), category.strip(), examples
+
+
+def read_records(stream: TextIO, file_format: str) -> Iterator[Tuple[int, str, Optional[Dict], Optional[str]]]:
+    """Yield (line number, raw text, record, parse error) for each input row, lazily."""
+    if file_format == "jsonl":
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                yield number, line.rstrip("\n"), json.loads(line), None
+            except json.JSONDecodeError as error:
+                yield number, line.rstrip("\n"), None, f"invalid JSON: {error.msg}"
+    elif file_format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            raw = json.dumps(row, ensure_ascii=False)
+            if None in row:
+                yield reader.line_num, raw, None, "too many fields"
+            else:
+                yield reader.line_num, raw, row, None
+    else:
+        raise ValueError(f"Unknown format {file_format!r}")
+
+
+def import_terms(definition_agent: DefinitionAgent, stream: TextIO, file_format: str,
+                 batch_size: int = 10_000, rejects: Optional[TextIO] = None,
+                 progress: Optional[Callable[[ImportStats], None]] = None) -> ImportStats:
+    """Import terms from stream in batches, committing once per batch.
+
+    A batch's terms and their examples are written in the same transaction,
+    so an interrupted import never leaves terms without their examples.
+
+    Memory use is bounded by batch_size. Invalid rows are skipped and, if
+    rejects is given, written to it as JSON lines with the line number and
+    reason. progress is called with the running ImportStats after each batch.
+    Examples are appended to existing ones, so re-importing a file repeats them.
+    """
+    stats = ImportStats()
+    terms: List[Tuple[str, str, str]] = []
+    examples: List[Tuple[str, str]] = []
+
+    def flush():
+        if terms:
+            stats.imported += definition_agent.add_terms(terms, examples)
+            stats.examples += len(examples)
+            stats.batches += 1
+            terms.clear()
+            examples.clear()
+        if progress is not None:
+            progress(stats)
+
+    for number, raw, record, error in read_records(stream, file_format):
+        stats.read += 1
+        if error is None:
+            try:
+                term, definition, category, term_examples = validate(record)
+            except RowError as row_error:
+                error = str(row_error)
+        if error is not None:
+            stats.rejected += 1
+            if rejects is not None:
+                rejects.write(json.dumps({"line": number, "error": error, "row": raw},
+                                         ensure_ascii=False) + "\n")
+            continue
+        terms.append((term, definition, category))
+        key = canonical_key(term)
+        examples.extend((key, example) for example in term_examples)
+        if len(terms) >= batch_size:
+            flush()
+    flush()
+    return stats
+
+
+def export_terms(repository, stream: TextIO, file_format: str,
+                 progress: Optional[Callable[[int], None]] = None,
+                 progress_every: int = 100_000) -> int:
+    """Stream every curated term to stream. Returns the number of rows written."""
+    count = 0
+    if file_format == "jsonl":
+        for record in repository.iter_records():
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+            if progress is not None and count % progress_every == 0:
+                progress(count)
+    elif file_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for record in repository.iter_records():
+            record["examples"] = "\n".join(record["examples"])
+            writer.writerow(record)
+            count += 1
+            if progress is not None and count % progress_every == 0:
+                progress(count)
+    else:
+        raise ValueError(f"Unknown format {file_format!r}")
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ai_agents.bulk",
+                                     description="Import or export glossary terms.")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("path", help="input or output file (.jsonl or .csv)")
+    parser.add_argument("--database", default=os.environ.get("GLOSSARY_DATABASE"),
+                        help="SQLite glossary database (default: $GLOSSARY_DATABASE)")
+    parser.add_argument("--format", dest="file_format", choices=["jsonl", "csv"])
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--rejects", help="write rejected rows here as JSON lines")
+    args = parser.parse_args(argv)
+
+    if not args.database:
+        parser.error("--database is required (or set GLOSSARY_DATABASE)")
+    file_format = args.file_format or detect_format(args.path)
+    repository = SQLiteRepository(args.database)
+
+    if args.command == "import":
+        report = lambda stats: print(stats, file=sys.stderr)  # noqa: E731
+        rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+        try:
+            with open(args.path, newline="", encoding="utf-8") as stream:
+                stats = import_terms(DefinitionAgent(repository=repository), stream, file_format,
+                                     args.batch_size, rejects, report)
+        finally:
+            if rejects is not None:
+                rejects.close()
+        return 1 if stats.rejected and not stats.imported else 0
+
+    with open(args.path, "w", newline="", encoding="utf-8") as stream:
+        count = export_terms(repository, stream, file_format,
+                             lambda count: print(f"exported {count}", file=sys.stderr))
+    print(f"exported {count} terms to {args.path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+# cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class GeneratedCache:
+    """Bounded cache for generated glossary terms.
+
+    Subclasses decide which entry to evict once max_size is reached. Entries
+    older than ttl seconds are treated as missing (ttl=None disables expiry).
+    All operations are serialized by a lock, so one cache can be shared by
+    the threads of a WSGI worker.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        # Callbacks invoked with the key of each entry evicted to make room
+        # (not for expired, popped or cleared entries), outside the lock
+        self.eviction_listeners: List[Callable[[Hashable], None]] = []
+        self._lock = threading.RLock()
+
+    def _expires_at(self) -> Optional[float]:
+        return None if self.ttl is None else self.clock() + self.ttl
+
+    def _expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= self.clock()
+
+    def _evicted(self, keys: List[Hashable]):
+        for key in keys:
+            for listener in self.eviction_listeners:
+                listener(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def put(self, key: Hashable, value: Any):
+        raise NotImplementedError
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, key: Hashable) -> bool:
+        raise NotImplementedError
+
+    def stats(self) -> Dict:
+        """Return hit/miss/eviction counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+
+
+class LRUCache(GeneratedCache):
+    """Evicts the least recently used entry."""
+
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_size, ttl, clock)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if self._expired(expires_at):
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        evicted = []
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            elif len(self._entries) >= self.max_size:
+                evicted.append(self._entries.popitem(last=False)[0])
+                self.evictions += 1
+            self._entries[key] = (value, self._expires_at())
+        self._evicted(evicted)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry[1])
+
+
+class LFUCache(GeneratedCache):
+    """Evicts the least frequently used entry, oldest first among ties."""
+
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_size, ttl, clock)
+        # key -> [value, expires_at, frequency]
+        self._entries: Dict[Hashable, list] = {}
+        # frequency -> keys with that frequency, in insertion order
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_frequency = 0
+
+    def _unlink(self, key, frequency: int):
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency += 1
+
+    def _touch(self, key, entry: list):
+        self._unlink(key, entry[2])
+        entry[2] += 1
+        self._buckets.setdefault(entry[2], OrderedDict())[key] = None
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if self._expired(entry[1]):
+                self.pop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._touch(key, entry)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        evicted = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[0], entry[1] = value, self._expires_at()
+                self._touch(key, entry)
+                return
+            if len(self._entries) >= self.max_size:
+                victim, _ = self._buckets[self._min_frequency].popitem(last=False)
+                if not self._buckets[self._min_frequency]:
+                    del self._buckets[self._min_frequency]
+                del self._entries[victim]
+                self.evictions += 1
+                evicted.append(victim)
+            self._entries[key] = [value, self._expires_at(), 1]
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_frequency = 1
+        self._evicted(evicted)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._unlink(key, entry[2])
+            if not self._entries:
+                self._min_frequency = 0
+            elif self._min_frequency not in self._buckets:
+                self._min_frequency = min(self._buckets)
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._min_frequency = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry[1])
@@ -0,0 +1,366 @@
+# file_tools.py
+"""Cached file and directory tools for the outreach agents' instruction files.
+
+    cache = FileCache()
+    directory = DirectoryReadTool("./instructions", cache=cache)
+    files = FileReadTool(cache=cache)
+    index = InstructionIndex(directory)
+    index.search("follow up after a demo", k=3)
+
+They stand in for crewai_tools' DirectoryReadTool and FileReadTool, which
+walk the directory and read whole files on every call. Here a file's
+content is kept until its (device, inode, mtime, size) signature changes,
+so a repeated read costs one stat(); files of at least mmap_threshold
+bytes are decoded straight from a memory mapping instead of being read
+into a buffer first. A listing is kept until the mtime of one of its
+directories changes. InstructionIndex splits the files into paragraphs
+and keeps an inverted index over them, so an agent can fetch the few
+passages relevant to its task instead of whole files; only files whose
+signature changed are reindexed.
+"""
+import fnmatch
+import heapq
+import mmap
+import os
+import threading
+from collections import Counter, OrderedDict
+from math import log
+from typing import Dict, List, Optional, Tuple
+
+from .related import tokens
+
+# What identifies a version of a file: (st_dev, st_ino, st_mtime_ns, st_size)
+Signature = Tuple[int, int, int, int]
+
+
+def signature(stat: os.stat_result) -> Signature:
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class FileCache:
+    """Contents of recently read files, keyed by path and checked against their signature.
+
+    Holds at most max_bytes of file data, evicting the least recently read
+    files first. Every cached text, memory-mapped or not, is a str private
+    to this process: the mapping is only open while the file is decoded,
+    and merely saves the intermediate bytes copy a read() would make.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2 ** 20, mmap_threshold: int = 2 ** 20,
+                 encoding: str = "utf-8"):
+        self.max_bytes = max_bytes
+        self.mmap_threshold = mmap_threshold
+        self.encoding = encoding
+        # path -> (signature, text)
+        self._entries: "OrderedDict[str, Tuple[Signature, str]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.mapped = 0
+
+    def read(self, path: str) -> str:
+        """The text of path, read from disk only if it changed since it was cached."""
+        path = os.path.abspath(path)
+        current = signature(os.stat(path))
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == current:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        text, current = self._load(path)
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._bytes -= old[0][3]
+            if current[3] <= self.max_bytes:
+                self._entries[path] = (current, text)
+                self._bytes += current[3]
+            while self._bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+                self.evictions += 1
+        return text
+
+    def signature(self, path: str) -> Optional[Signature]:
+        """Signature of the cached copy of path, if any."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(path))
+        return entry[0] if entry is not None else None
+
+    def _load(self, path: str) -> Tuple[str, Signature]:
+        with open(path, "rb") as stream:
+            # The signature of the opened file, so a concurrent replace is seen next time
+            current = signature(os.fstat(stream.fileno()))
+            if current[3] >= self.mmap_threshold:
+                # Decodes from the mapped pages without an intermediate bytes copy;
+                # the mapping is closed once the text is a str of its own
+                with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    text = str(memoryview(mapped), self.encoding, "replace")
+                with self._lock:
+                    self.mapped += 1
+            else:
+                text = str(stream.read(), self.encoding, "replace")
+        return text, current
+
+    def invalidate(self, path: str):
+        with self._lock:
+            entry = self._entries.pop(os.path.abspath(path), None)
+            if entry is not None:
+                self._bytes -= entry[0][3]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Return hit/miss/eviction counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "files": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "mapped": self.mapped,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class DirectoryReadTool:
+    """Lists the files under a directory, rescanning only after a directory changes.
+
+    Creating, deleting or renaming a file updates its directory's mtime, so
+    a listing stays valid while every directory it walked keeps its mtime;
+    checking that costs one stat() per directory rather than a walk.
+    """
+
+    name = "List files in directory"
+    description = "Lists the instruction files available to read."
+
+    def __init__(self, directory: str, pattern: str = "*", recursive: bool = True,
+                 cache: Optional[FileCache] = None):
+        self.directory = os.path.abspath(directory)
+        self.pattern = pattern
+        self.recursive = recursive
+        # An empty cache is falsy, so test for None
+        self.cache = cache if cache is not None else FileCache()
+        self._directories: Dict[str, int] = {}
+        self._files: List[str] = []
+        self._lock = threading.Lock()
+        self.scans = 0
+        self.hits = 0
+
+    def files(self) -> List[str]:
+        """Sorted paths of the matching files."""
+        with self._lock:
+            if self._directories and self._unchanged():
+                self.hits += 1
+                return list(self._files)
+            self._scan()
+            return list(self._files)
+
+    def _unchanged(self) -> bool:
+        for directory, mtime in self._directories.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _scan(self):
+        directories, files = {}, []
+        for root, subdirectories, names in os.walk(self.directory):
+            directories[root] = os.stat(root).st_mtime_ns
+            files.extend(os.path.join(root, name) for name in names
+                         if fnmatch.fnmatch(name, self.pattern))
+            if not self.recursive:
+                break
+            subdirectories.sort()
+        self._directories = directories
+        self._files = sorted(files)
+        self.scans += 1
+
+    def _run(self) -> str:
+        listing = "\n".join(f"- {path}" for path in self.files())
+        return f"File paths: \n{listing}"
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"files": len(self._files), "scans": self.scans, "hits": self.hits}
+
+
+class FileReadTool:
+    """Reads a file's content through a FileCache."""
+
+    name = "Read a file's content"
+    description = "Reads the content of an instruction file."
+
+    def __init__(self, file_path: Optional[str] = None, cache: Optional[FileCache] = None):
+        self.file_path = file_path
+        self.cache = cache if cache is not None else FileCache()
+
+    def _run(self, file_path: Optional[str] = None) -> str:
+        path = file_path or self.file_path
+        if path is None:
+            raise ValueError("No file_path given")
+        try:
+            return self.cache.read(path)
+        except OSError as error:
+            return f"Failed to read the file {path}. Error: {error}"
+
+
+class Passage:
+    """A paragraph of an instruction file."""
+
+    __slots__ = ("path", "line", "text", "length")
+
+    def __init__(self, path: str, line: int, text: str, length: int):
+        self.path = path
+        self.line = line
+        self.text = text
+        self.length = length
+
+    def __repr__(self) -> str:
+        return f"Passage(path={self.path!r}, line={self.line}, text={self.text[:40]!r})"
+
+
+class InstructionIndex:
+    """Inverted index over the paragraphs of a directory's files, ranked by BM25.
+
+    search() first brings the index up to date: it lists the directory and
+    reindexes only the files that were added, removed or changed since the
+    last search, which costs a stat() per file when nothing changed.
+    """
+
+    def __init__(self, directory: DirectoryReadTool, k1: float = 1.2, b: float = 0.75):
+        self.directory = directory
+        self.cache = directory.cache
+        self.k1 = k1
+        self.b = b
+        self._passages: Dict[int, Passage] = {}
+        # word -> passage id -> occurrences
+        self._postings: Dict[str, Dict[int, int]] = {}
+        # path -> (signature, ids of its passages)
+        self._files: Dict[str, Tuple[Signature, List[int]]] = {}
+        self._next_id = 0
+        self._total_length = 0
+        # passage id -> BM25 length normalization, recomputed after the corpus changes
+        self._norms: Optional[Dict[int, float]] = None
+        self._lock = threading.Lock()
+        self.reindexed = 0
+
+    def refresh(self):
+        paths = set(self.directory.files())
+        with self._lock:
+            for path in list(self._files):
+                if path not in paths:
+                    self._remove(path)
+            for path in sorted(paths):
+                try:
+                    current = signature(os.stat(path))
+                except OSError:
+                    continue
+                indexed = self._files.get(path)
+                if indexed is not None and indexed[0] == current:
+                    continue
+                if indexed is not None:
+                    self._remove(path)
+                try:
+                    text = self.cache.read(path)
+                except OSError:
+                    continue
+                self._add(path, self.cache.signature(path) or current, text)
+                self.reindexed += 1
+
+    def _add(self, path: str, current: Signature, text: str):
+        ids = []
+        for line, paragraph in _paragraphs(text):
+            words = Counter(tokens(paragraph))
+            if not words:
+                continue
+            passage_id = self._next_id
+            self._next_id += 1
+            length = sum(words.values())
+            self._passages[passage_id] = Passage(path, line, paragraph, length)
+            self._total_length += length
+            self._norms = None
+            for word, count in words.items():
+                self._postings.setdefault(word, {})[passage_id] = count
+            ids.append(passage_id)
+        self._files[path] = (current, ids)
+
+    def _remove(self, path: str):
+        _, ids = self._files.pop(path)
+        for passage_id in ids:
+            passage = self._passages.pop(passage_id)
+            self._total_length -= passage.length
+            self._norms = None
+            for word in set(tokens(passage.text)):
+                postings = self._postings.get(word)
+                if postings is not None:
+                    postings.pop(passage_id, None)
+                    if not postings:
+                        del self._postings[word]
+
+    def search(self, query: str, k: int = 5) -> List[Passage]:
+        """The k passages that best match query, best first."""
+        self.refresh()
+        with self._lock:
+            count = len(self._passages)
+            if not count:
+                return []
+            norms = self._norms
+            if norms is None:
+                average = self._total_length / count
+                norms = self._norms = {
+                    passage_id: self.k1 * (1 - self.b + self.b * passage.length / average)
+                    for passage_id, passage in self._passages.items()}
+            scores: Dict[int, float] = {}
+            for word in set(tokens(query)):
+                postings = self._postings.get(word)
+                if not postings:
+                    continue
+                weight = (self.k1 + 1) * log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for passage_id, occurrences in postings.items():
+                    scores[passage_id] = scores.get(passage_id, 0.0) + weight * occurrences / (
+                        occurrences + norms[passage_id])
+            best = heapq.nsmallest(k, scores, key=lambda passage_id: (-scores[passage_id], passage_id))
+            return [self._passages[passage_id] for passage_id in best]
+
+    def _run(self, query: str) -> str:
+        """Matching passages formatted for an agent's context."""
+        return "\n\n".join(f"[{os.path.relpath(passage.path, self.directory.directory)}:"
+                           f"{passage.line}]\n{passage.text}" for passage in self.search(query))
+
+    def stats(self) -> Dict:
+        """Index size and reindexing counts, with the file and directory cache stats."""
+        with self._lock:
+            indexed = {"files": len(self._files), "passages": len(self._passages),
+                       "words": len(self._postings), "reindexed": self.reindexed}
+        return {"index": indexed, "directory": self.directory.stats(), "cache": self.cache.stats()}
+
+
+def _paragraphs(text: str):
+    """(first line number, text) of each blank-line separated paragraph."""
+    start, lines = 1, []
+    for number, line in enumerate(text.splitlines(), 1):
+        if line.strip():
+            if not lines:
+                start = number
+            lines.append(line)
+        elif lines:
+            yield start, "\n".join(lines)
+            lines = []
+    if lines:
+        yield start, "\n".join(lines)
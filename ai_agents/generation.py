@@ -0,0 +1,202 @@
+# generation.py
+"""Definition generators for terms that are not in the curated glossary.
+
+A backend turns a batch of term names into definitions. DefinitionAgent
+only needs an object with define(term), which every backend provides, and
+so does BatchingGenerator, which groups concurrent define() calls from
+request threads into micro-batches for one backend.
+"""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+
+class GeneratorBackend:
+    """Generates definitions for a batch of terms."""
+
+    name = "base"
+
+    def generate(self, terms: List[str]) -> List[str]:
+        """Return one definition per term, in order."""
+        raise NotImplementedError
+
+    def define(self, term: str) -> str:
+        return self.generate([term])[0]
+
+    def count_tokens(self, text: str) -> int:
+        """Token count used for throughput reporting."""
+        return len(text.split())
+
+
+class StubBackend(GeneratorBackend):
+    """Deterministic placeholder definitions, with optional simulated model latency.
+
+    batch_latency is paid once per generate() call and token_latency once
+    per generated token, which is roughly how a CPU model behaves: a forward
+    pass over a batch costs little more than over a single prompt.
+    """
+
+    name = "stub"
+
+    def __init__(self, batch_latency: float = 0.0, token_latency: float = 0.0):
+        self.batch_latency = batch_latency
+        self.token_latency = token_latency
+
+    def generate(self, terms: List[str]) -> List[str]:
+        definitions = [f"{term} is an AI concept related to business growth (placeholder definition)."
+                       for term in terms]
+        if self.batch_latency or self.token_latency:
+            # Tokens are produced in lockstep across the batch
+            longest = max((self.count_tokens(text) for text in definitions), default=0)
+            time.sleep(self.batch_latency + self.token_latency * longest)
+        return definitions
+
+
+class TransformersBackend(GeneratorBackend):
+    """Local causal language model (GPT-2 by default) run on the CPU.
+
+    Requires the optional transformers and torch packages.
+    """
+
+    name = "transformers"
+
+    def __init__(self, model_name: str = "gpt2", max_new_tokens: int = 40, device: str = "cpu"):
+        try:
+            import torch
+            from transformers import AutoModelForCausalLM, AutoTokenizer
+        except ImportError as error:
+            raise ImportError("TransformersBackend needs the transformers and torch packages: "
+                              "pip install transformers torch") from error
+        self._torch = torch
+        self.model_name = model_name
+        self.max_new_tokens = max_new_tokens
+        self.device = device
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        # Left padding keeps every prompt's last token next to its continuation
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        self.model = AutoModelForCausalLM.from_pretrained(model_name).to(device)
+        self.model.eval()
+
+    @staticmethod
+    def prompt(term: str) -> str:
+        return f"In business, {term} is an AI concept that"
+
+    def generate(self, terms: List[str]) -> List[str]:
+        prompts = [self.prompt(term) for term in terms]
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True).to(self.device)
+        with self._torch.inference_mode():
+            outputs = self.model.generate(
+                **inputs, max_new_tokens=self.max_new_tokens, do_sample=False,
+                pad_token_id=self.tokenizer.pad_token_id
+            )
+        continuations = self.tokenizer.batch_decode(
+            outputs[:, inputs["input_ids"].shape[1]:], skip_special_tokens=True
+        )
+        definitions = []
+        for term, continuation in zip(terms, continuations):
+            # Keep the first sentence of the continuation
+            sentence = continuation.strip().split(". ")[0].rstrip(".")
+            definitions.append(f"{term} is an AI concept that {sentence}.")
+        return definitions
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.tokenizer.encode(text))
+
+
+def create_backend(name: str, model_name: Optional[str] = None, **options) -> GeneratorBackend:
+    """Backend by configuration name: "stub" or "transformers".
+
+    options are passed on to the backend's constructor.
+    """
+    if name == "stub":
+        return StubBackend(**options)
+    if name == "transformers":
+        return TransformersBackend(model_name or "gpt2", **options)
+    raise ValueError(f"Unknown generator backend {name!r}")
+
+
+class BatchingGenerator:
+    """Groups concurrent define() calls into micro-batches for one backend.
+
+    A single worker thread takes the first waiting request, then keeps
+    collecting until max_batch_size distinct terms are waiting or max_wait
+    seconds have passed, and runs them through the backend together. Calls
+    for a term already waiting in the batch share its result.
+    """
+
+    def __init__(self, backend: GeneratorBackend, max_batch_size: int = 8, max_wait: float = 0.01):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.requests = 0
+        self._waiting: Dict[str, Future] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="batching-generator", daemon=True)
+        self._worker.start()
+
+    def submit(self, term: str) -> Future:
+        """Queue term for generation and return a future for its definition."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BatchingGenerator is closed")
+            self.requests += 1
+            future = self._waiting.get(term)
+            if future is None:
+                future = self._waiting[term] = Future()
+                self._condition.notify()
+            return future
+
+    def define(self, term: str, timeout: Optional[float] = None) -> str:
+        return self.submit(term).result(timeout)
+
+    def count_tokens(self, text: str) -> int:
+        return self.backend.count_tokens(text)
+
+    def _next_batch(self) -> Dict[str, Future]:
+        with self._condition:
+            while not self._waiting and not self._closed:
+                self._condition.wait()
+            closes = time.monotonic() + self.max_wait
+            while len(self._waiting) < self.max_batch_size and not self._closed:
+                remaining = closes - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            terms = list(self._waiting)[:self.max_batch_size]
+            return {term: self._waiting.pop(term) for term in terms}
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            self.batches += 1
+            try:
+                definitions = self.backend.generate(list(batch))
+            except Exception as error:
+                for future in batch.values():
+                    future.set_exception(error)
+                continue
+            for future, definition in zip(batch.values(), definitions):
+                future.set_result(definition)
+
+    def close(self):
+        """Finish the requests already queued, then stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+
+    def stats(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+        }
@@ -0,0 +1,256 @@
+# jobs.py
+"""Background generation of definitions, so requests never wait for the model.
+
+GlossaryAgent.explain_term answers unknown terms with a placeholder and
+submits the real generation here. A dispatcher thread hands jobs to a
+process (or thread) pool in priority order, at most one per worker at a
+time, and reports each finished definition to on_done. Failed jobs are
+retried with exponential backoff; with a SQLite repository they are also
+recorded in its generation_job table, so pending work survives restarts.
+New terms are turned away once max_queued jobs are waiting, and callers
+keep serving their placeholder.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .generation import GeneratorBackend, create_backend
+
+HIGH = 0
+NORMAL = 5
+LOW = 10
+
+# Backend of a pool worker process, created once by _init_worker
+_worker_backend: Optional[GeneratorBackend] = None
+
+
+def _init_worker(backend: str, model: Optional[str], options: Dict):
+    global _worker_backend
+    _worker_backend = create_backend(backend, model, **options)
+
+
+def _generate(term: str) -> str:
+    return _worker_backend.define(term)
+
+
+class JobQueue:
+    """Priority queue of definition jobs, run on a worker pool.
+
+    Jobs are keyed by canonical term key; submitting a key that is already
+    queued or running only raises its priority. on_done(key, term,
+    definition) is called from a pool callback thread when a job succeeds.
+    At most max_queued jobs wait for a worker; further new keys are rejected.
+    """
+
+    def __init__(self, on_done: Callable[[str, str, str], None], workers: int = 2,
+                 backend: str = "stub", model: Optional[str] = None,
+                 backend_options: Optional[Dict] = None, processes: bool = True,
+                 table=None, max_attempts: int = 3, retry_delay: float = 1.0,
+                 failure_cooldown: float = 300.0, max_queued: int = 10_000):
+        self.on_done = on_done
+        self.workers = workers
+        self.table = table
+        self.max_queued = max_queued
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.failure_cooldown = failure_cooldown
+        # Each worker process builds its own backend (and loads its own model)
+        initargs = (backend, model, backend_options or {})
+        if processes:
+            self.executor: Executor = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                          initargs=initargs)
+        else:
+            _init_worker(*initargs)
+            self.executor = ThreadPoolExecutor(workers, thread_name_prefix="job")
+        # (priority, sequence, key) of runnable jobs, and (ready_at, key) of
+        # retries waiting out their backoff; superseded entries are skipped
+        self._heap: List[Tuple[int, int, str]] = []
+        self._delayed: List[Tuple[float, str]] = []
+        # key -> [term, priority, attempts, submitted_at]
+        self._jobs: Dict[str, list] = {}
+        self._running: Dict[str, float] = {}
+        self._done_events: Dict[str, threading.Event] = {}
+        # key -> time until which a job that ran out of attempts is not resubmitted,
+        # in expiry order; expired entries are dropped as new failures arrive
+        self._failed: Dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._slots = threading.Semaphore(workers)
+        self._closed = False
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.rejected = 0
+        # (finished_at, seconds from submission) of recent successes
+        self._recent: Deque[Tuple[float, float]] = deque(maxlen=1000)
+        self._dispatcher = threading.Thread(target=self._dispatch, name="job-dispatcher", daemon=True)
+        self._dispatcher.start()
+        if table is not None:
+            # The rest stay in the table, highest priority first, for a later start
+            for key, term, priority, attempts, ready_at in table.pending()[:max_queued]:
+                self._enqueue(key, term, priority, attempts, ready_at)
+
+    def _enqueue(self, key: str, term: str, priority: int, attempts: int = 0,
+                 ready_at: float = 0.0) -> bool:
+        with self._condition:
+            job = self._jobs.get(key)
+            if job is not None:
+                if priority >= job[1]:
+                    return False
+                job[1] = priority
+            else:
+                job = self._jobs[key] = [term, priority, attempts, time.monotonic()]
+                self._done_events.setdefault(key, threading.Event())
+            if key not in self._running:
+                if ready_at > time.time():
+                    heapq.heappush(self._delayed, (ready_at, key))
+                else:
+                    heapq.heappush(self._heap, (priority, next(self._sequence), key))
+                self._condition.notify()
+            return True
+
+    def submit(self, key: str, term: str, priority: int = NORMAL) -> bool:
+        """Queue generation of term.
+
+        Returns False if it was already queued at this priority or better,
+        if it ran out of attempts less than failure_cooldown seconds ago, or
+        if it is new and max_queued jobs are already waiting.
+        """
+        if self._closed:
+            raise RuntimeError("JobQueue is closed")
+        with self._condition:
+            if key in self._failed:
+                if self._failed[key] > time.time():
+                    return False
+                del self._failed[key]
+            if key not in self._jobs and len(self._jobs) - len(self._running) >= self.max_queued:
+                self.rejected += 1
+                return False
+            if not self._enqueue(key, term, priority):
+                return False
+        self.submitted += 1
+        if self.table is not None:
+            self.table.save(key, term, priority, self._jobs[key][2], 0.0)
+        return True
+
+    def pending(self, key: str) -> bool:
+        """True while key is queued or running."""
+        with self._condition:
+            return key in self._jobs
+
+    def wait(self, key: str, timeout: Optional[float] = None) -> bool:
+        """Block until key's job finishes (or fails for good); True unless it timed out."""
+        with self._condition:
+            if key not in self._jobs:
+                return True
+            event = self._done_events[key]
+        return event.wait(timeout)
+
+    def _next(self) -> Optional[str]:
+        with self._condition:
+            while not self._closed:
+                now = time.time()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, key = heapq.heappop(self._delayed)
+                    job = self._jobs.get(key)
+                    if job is not None:
+                        heapq.heappush(self._heap, (job[1], next(self._sequence), key))
+                while self._heap:
+                    priority, _, key = heapq.heappop(self._heap)
+                    job = self._jobs.get(key)
+                    if job is None or job[1] != priority or key in self._running:
+                        continue  # finished, re-prioritized or already picked up
+                    self._running[key] = time.monotonic()
+                    return key
+                # Sleep until the earliest retry is due or a new job arrives
+                timeout = self._delayed[0][0] - now if self._delayed else None
+                self._condition.wait(timeout)
+            return None
+
+    def _dispatch(self):
+        while True:
+            self._slots.acquire()
+            key = self._next()
+            if key is None:
+                return
+            term = self._jobs[key][0]
+            future = self.executor.submit(_generate, term)
+            future.add_done_callback(lambda future, key=key: self._finished(key, future))
+
+    def _finished(self, key: str, future):
+        self._slots.release()
+        error = future.exception()
+        term, priority, attempts, submitted_at = self._jobs[key]
+        if error is None:
+            # Publish the definition before the job stops counting as pending
+            try:
+                self.on_done(key, term, future.result())
+            except Exception as callback_error:
+                error = callback_error
+        with self._condition:
+            self._running.pop(key, None)
+            if error is not None and attempts + 1 < self.max_attempts:
+                attempts = self._jobs[key][2] = attempts + 1
+                ready_at = time.time() + self.retry_delay * 2 ** (attempts - 1)
+                heapq.heappush(self._delayed, (ready_at, key))
+                self._condition.notify()
+                self.retried += 1
+                if self.table is not None:
+                    self.table.save(key, term, priority, attempts, ready_at, repr(error))
+                return
+            del self._jobs[key]
+            event = self._done_events.pop(key)
+            if error is None:
+                self.completed += 1
+                self._recent.append((time.monotonic(), time.monotonic() - submitted_at))
+            else:
+                self.failed += 1
+                now = time.time()
+                while self._failed:
+                    expired = next(iter(self._failed))
+                    if self._failed[expired] > now:
+                        break
+                    del self._failed[expired]
+                self._failed[key] = now + self.failure_cooldown
+        if self.table is not None:
+            if error is None:
+                self.table.delete(key)
+            else:
+                self.table.fail(key, repr(error))
+        event.set()
+
+    def stats(self) -> Dict:
+        """Queue depth, outcome counters, and throughput over the last minute."""
+        now = time.monotonic()
+        with self._condition:
+            recent = [seconds for finished, seconds in self._recent if finished > now - 60.0]
+            queued = len(self._jobs) - len(self._running)
+            running = len(self._running)
+        recent.sort()
+        return {
+            "queued": queued,
+            "running": running,
+            "workers": self.workers,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "completed_per_second": len(recent) / 60.0,
+            "latency_p50": recent[len(recent) // 2] if recent else 0.0,
+            "latency_p95": recent[int(len(recent) * 0.95)] if recent else 0.0,
+        }
+
+    def close(self, wait: bool = True):
+        """Stop dispatching; queued jobs stay in the table for the next start."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._slots.release()
+        self._dispatcher.join()
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,49 @@
+# keys.py
+import sys
+import unicodedata
+from typing import Dict, Iterator, Optional
+
+
+def canonical_key(term: str) -> str:
+    """Normalize a user-supplied term into the key used by every glossary index.
+
+    Applies Unicode NFKC, casefolds and collapses runs of whitespace, so
+    "Machine  Learning", "MACHINE LEARNING" and "ｍachine learning" share a key.
+    Keys are not interned here, since most lookups are misses; the indexes
+    intern a key when they store it.
+    """
+    return " ".join(unicodedata.normalize("NFKC", term).casefold().split())
+
+
+class AliasTable:
+    """Maps alternative spellings or abbreviations to a term's canonical key."""
+
+    def __init__(self):
+        self._targets: Dict[str, str] = {}
+
+    def add(self, alias: str, term: str):
+        """Register alias as another name for term (both may be raw user strings)."""
+        alias_key, target = canonical_key(alias), self.resolve(canonical_key(term))
+        if alias_key == target:
+            return
+        self._targets[sys.intern(alias_key)] = sys.intern(target)
+        # Re-point aliases that targeted the new alias so chains stay one hop
+        for key, existing in self._targets.items():
+            if existing == alias_key:
+                self._targets[key] = target
+
+    def resolve(self, key: str) -> str:
+        """Return the canonical key an already-normalized key refers to."""
+        return self._targets.get(key, key)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._targets.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
@@ -0,0 +1,62 @@
+# listing.py
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class TermListing:
+    """Alphabetical listing of glossary terms, overall and per category.
+
+    Keys are kept in sorted lists (one for all terms and one per category)
+    that are updated in place as terms are added, so a page is a bisect
+    plus a slice. Pages are addressed by cursor: the key of the last term
+    on the previous page, which stays valid while terms are added.
+    """
+
+    def __init__(self, terms: Iterable[Tuple[str, str, str]] = ()):
+        self._names: Dict[str, str] = {}
+        self._categories: Dict[str, str] = {}
+        self._sorted: List[str] = []
+        self._by_category: Dict[str, List[str]] = {}
+        for key, name, category in terms:
+            self._names[key] = name
+            self._categories[key] = category
+        self._sorted = sorted(self._names)
+        for key in self._sorted:
+            self._by_category.setdefault(self._categories[key], []).append(key)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._names
+
+    def add(self, key: str, name: str, category: str):
+        """Insert a term, or move it if its category changed."""
+        old_category = self._categories.get(key)
+        if old_category is None:
+            insort(self._sorted, key)
+        elif old_category != category:
+            keys = self._by_category[old_category]
+            del keys[bisect_right(keys, key) - 1]
+            if not keys:
+                del self._by_category[old_category]
+        self._names[key] = name
+        self._categories[key] = category
+        if old_category != category:
+            insort(self._by_category.setdefault(category, []), key)
+
+    def categories(self) -> List[Tuple[str, int]]:
+        """(category, number of terms) pairs, sorted by category."""
+        return sorted((category, len(keys)) for category, keys in self._by_category.items())
+
+    def page(self, category: Optional[str] = None, after: Optional[str] = None,
+             limit: int = 50) -> Tuple[List[str], Optional[str]]:
+        """Up to limit term names following cursor after, and the cursor for the next page.
+
+        The next cursor is None on the last page.
+        """
+        keys = self._sorted if category is None else self._by_category.get(category, [])
+        start = 0 if after is None else bisect_right(keys, after)
+        window = keys[start:start + limit]
+        more = start + limit < len(keys)
+        return [self._names[key] for key in window], window[-1] if more and window else None
@@ -0,0 +1,178 @@
+# metrics.py
+"""In-process latency histograms and gauges, exposed in Prometheus text format.
+
+    with metrics.timer("glossary_stage_seconds", stage="get_definition"):
+        ...
+
+Histograms are created on first use for each (name, labels) pair. Gauges
+are callables evaluated only when the metrics are rendered, so sizes and
+hit ratios cost nothing between scrapes. With enabled set to False,
+timer() returns a shared no-op context manager.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+# Seconds; spans a dict lookup to a slow model generation
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf bucket, not yet cumulative
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """(cumulative bucket counts including +Inf, sum, count)."""
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, running = [], 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, total, running
+
+
+class _Timer:
+    __slots__ = ("histogram", "started")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metrics:
+    """Registry of histograms and gauges."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        # (name, labels in call order) -> histogram; one dict lookup per observation
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._help: Dict[str, str] = {}
+        self._gauges: Dict[str, Tuple[str, Callable[[], Dict[Labels, float]]]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        key = (name, tuple(labels.items()))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        return histogram
+
+    def observe(self, name: str, value: float, **labels: str):
+        if self.enabled:
+            self.histogram(name, **labels).observe(value)
+
+    def timer(self, name: str, **labels: str):
+        """Context manager observing the seconds its block takes."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name, **labels))
+
+    def describe(self, name: str, text: str):
+        """Set the HELP text shown for a histogram."""
+        self._help[name] = text
+
+    def gauge(self, name: str, text: str, read: Callable[[], object]):
+        """Register a gauge read at render time.
+
+        read returns a number, or for a labelled family a dict mapping
+        label tuples (((name, value), ...)) to numbers. A gauge
+        registered again under the same name replaces the old one.
+        """
+        def values() -> Dict[Labels, float]:
+            value = read()
+            return value if isinstance(value, dict) else {(): value}
+
+        with self._lock:
+            self._gauges[name] = (text, values)
+
+    def clear(self):
+        """Forget every histogram (gauges stay registered)."""
+        with self._lock:
+            self._histograms = {}
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        return "".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        with self._lock:
+            series = list(self._histograms.items())
+            gauges = dict(self._gauges)
+        histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        for (name, labels), histogram in series:
+            histograms.setdefault(name, {})[tuple(sorted(labels))] = histogram
+        for name in sorted(histograms):
+            if name in self._help:
+                yield f"# HELP {name} {self._help[name]}\n"
+            yield f"# TYPE {name} histogram\n"
+            for labels, histogram in sorted(histograms[name].items()):
+                cumulative, total, count = histogram.snapshot()
+                bounds = [repr(bound) for bound in histogram.buckets] + ["+Inf"]
+                for bound, value in zip(bounds, cumulative):
+                    le = 'le="%s"' % bound
+                    yield f"{name}_bucket{_format_labels(labels, le)} {value}\n"
+                yield f"{name}_sum{_format_labels(labels)} {total}\n"
+                yield f"{name}_count{_format_labels(labels)} {count}\n"
+        for name in sorted(gauges):
+            text, values = gauges[name]
+            try:
+                samples = values()
+            except Exception:
+                # A broken gauge must not take the whole endpoint down
+                continue
+            yield f"# HELP {name} {text}\n# TYPE {name} gauge\n"
+            for labels, value in sorted(samples.items()):
+                yield f"{name}{_format_labels(labels)} {float(value)}\n"
+
+
+# Shared by the agents, the views and create_app
+metrics = Metrics()
@@ -1,13 +1,25 @@
-For your "Gelato Play" project—an AI glossary for entrepreneurs—I’ll create a Python module (`models.py`) that defines AI agent classes to power this educational tool. These agents will handle tasks like generating glossary terms, explaining AI concepts in simple language, and providing business growth examples tailored to entrepreneurs. The module will be modular, reusable, and designed with future expansion in mind (e.g., integrating real AI models or APIs later). Since it’s a glossary-focused tool, I’ll include agents for term definition, example generation, and user interaction, keeping it beginner-friendly yet practical.
-
-Here’s the code for `models.py`:
-
-```python
 # models.py
-import random
-from typing import List, Dict, Optional
+import threading
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
+from .cache import GeneratedCache, LRUCache
+from .concurrency import RWLock, SingleFlight
+from .generation import BatchingGenerator, StubBackend
+from .jobs import NORMAL, JobQueue
+from .keys import canonical_key
+from .listing import TermListing
+from .metrics import metrics
+from .related import RelatedTerms
+from .repository import MemoryRepository
+from .search import SearchIndex
+from .semantic_cache import SemanticCache
+
 class GlossaryTerm:
     """Represents a single AI glossary term with definition and metadata."""
     def __init__(self, term: str, definition: str, category: str = "General AI"):
@@ -33,91 +45,704 @@ class GlossaryTerm:
 
 class DefinitionAgent:
     """AI agent for generating or retrieving glossary term definitions."""
-    def __init__(self):
+    def __init__(self, generated_cache: Optional[GeneratedCache] = None, repository=None,
+                 generator=None, similar_keys: Optional[SemanticCache] = None):
+        # Curated terms live in a repository (in-memory columnar store or SQLite)
+        self.repository = repository if repository is not None else MemoryRepository()
+        # Every index in this module is keyed by canonical_key(term)
+        self.predefined_terms = self.repository.terms
+        self.aliases = self.repository.aliases
         # Predefined terms for demo purposes (expandable via database/API later)
-        self.predefined_terms = {
-            "Machine Learning": GlossaryTerm(
+        for seed in (
+            GlossaryTerm(
                 "Machine Learning",
                 "A type of AI where computers learn from data to make predictions or decisions without being explicitly programmed.",
                 "Core AI"
             ),
-            "Generative AI": GlossaryTerm(
+            GlossaryTerm(
                 "Generative AI",
                 "AI that creates new content, like text, images, or music, based on patterns it learns from existing data.",
                 "Advanced AI"
             ),
-            "Chatbot": GlossaryTerm(
+            GlossaryTerm(
                 "Chatbot",
                 "An AI program that simulates human conversation, often used for customer service or support.",
                 "Applications"
             )
-        }
+        ):
+            # Only a new repository is seeded, so terms and aliases deleted or
+            # curated over since survive restarts and snapshot loads
+            if self.repository.created and canonical_key(seed.term) not in self.predefined_terms:
+                self.predefined_terms[canonical_key(seed.term)] = seed
+        for alias, term in (("ML", "Machine Learning"), ("GenAI", "Generative AI"), ("Chat Bot", "Chatbot")):
+            alias_key = canonical_key(alias)
+            if (self.repository.created and alias_key not in self.aliases
+                    and alias_key not in self.predefined_terms):
+                self.aliases.add(alias, term)
+        # Anything with define(term) -> str: a backend or a BatchingGenerator around one
+        self.generator = generator if generator is not None else StubBackend()
+        self.placeholder_backend = StubBackend()
+        # One generation per key at a time: across this process's threads, and
+        # across processes when the repository can coordinate them
+        self.flight = SingleFlight()
+        # Generated placeholders are bounded and evictable; curated terms above never are
+        self.generated_terms = generated_cache if generated_cache is not None else LRUCache()
+        # Maps paraphrases of a generated term's key ("learning machines") to that key
+        self.similar_keys = similar_keys if similar_keys is not None else SemanticCache()
+        # Callbacks invoked with (key, term) for each newly curated term (e.g. to update indexes)
+        self.listeners: List[Callable[[str, GlossaryTerm], None]] = []
+        # Callbacks invoked with the keys of each bulk load, which they take in one go
+        self.bulk_listeners: List[Callable[[List[str]], None]] = []
+        # Callbacks invoked after a bulk load, when per-term updates would be too slow
+        self.reload_listeners: List[Callable[[], None]] = []
+        # Guards the repository: writes (and their listeners) run exclusively
+        self.lock = RWLock()
+
+    def is_curated(self, term) -> bool:
+        """Return True if term comes from the repository rather than the generated cache."""
+        # Repositories hand out GlossaryTerm-compatible views; only generated terms are GlossaryTerm
+        return not isinstance(term, GlossaryTerm)
+
+    def is_placeholder(self, term) -> bool:
+        """Return True if term was generated without a model, by the stub backend."""
+        # The stub's definitions depend only on the name, whichever stub made them
+        return (not self.is_curated(term)
+                and term.definition == self.placeholder_backend.define(term.term))
+
+    def resolve_key(self, term: str) -> str:
+        """Canonical key for a raw term, following aliases."""
+        return self.aliases.resolve(canonical_key(term))
+
+    def get_definition(self, term: str, key: Optional[str] = None,
+                       similar: bool = True) -> Optional[GlossaryTerm]:
+        """Retrieve or generate a definition for a term.
+
+        Pass key when the caller already resolved it, to avoid normalizing twice.
+        Generation can be slow, so callers should not hold the agent's lock.
+        With similar=False a paraphrase of a generated term is not reused.
+        """
+        with metrics.timer("glossary_stage_seconds", stage="get_definition"):
+            if key is None:
+                key = self.resolve_key(term)
+            known = self.lookup(key, similar)
+            if known is not None:
+                return known
+            return self.flight.do(key, lambda: self._generate(term, key))
 
-    def get_definition(self, term: str) -> Optional[GlossaryTerm]:
-        """Retrieve or simulate generating a definition for a term."""
-        term = term.title()  # Normalize input
-        if term in self.predefined_terms:
-            return self.predefined_terms[term]
-        # Simulate AI generation for undefined terms (replace with real model later)
-        simulated_def = f"{term} is an AI concept related to business growth (placeholder definition)."
-        new_term = GlossaryTerm(term, simulated_def, "Unclassified")
-        self.predefined_terms[term] = new_term
+    def _generate(self, term: str, key: str) -> GlossaryTerm:
+        # A call that finished just before this flight started may have cached it
+        cached = self.generated_terms.get(key)
+        if cached is not None:
+            return cached
+        term = self.display_name(term)
+        with metrics.timer("glossary_stage_seconds", stage="generate"):
+            if self.repository.flight is None:
+                definition = self.generator.define(term)
+            else:
+                definition = self.repository.flight.do(key, lambda: self.generator.define(term))
+        new_term = GlossaryTerm(term, definition, "Unclassified")
+        self.remember(key, new_term)
         return new_term
 
+    def remember(self, key: str, term: GlossaryTerm):
+        """Cache a generated term under key, and for paraphrases of key."""
+        with self.lock.read():
+            # Generation runs unlocked, so the term may have been curated meanwhile
+            if key in self.predefined_terms:
+                return
+            self.generated_terms.put(key, term)
+            self.similar_keys.put(key, key)
+
+    @staticmethod
+    def display_name(term: str) -> str:
+        """Name shown for a term the glossary does not know."""
+        return " ".join(term.split()).title()
+
+    def placeholder(self, term: str) -> GlossaryTerm:
+        """Stand-in shown while a term's definition is generated in the background."""
+        term = self.display_name(term)
+        return GlossaryTerm(term, self.placeholder_backend.define(term), "Unclassified")
+
+    def lookup(self, key: str, similar: bool = True) -> Optional[GlossaryTerm]:
+        """Curated or already generated term for a resolved key, without generating.
+
+        Unless similar is False, a term generated for a paraphrase of key
+        (see SemanticCache) is returned when key itself was never generated.
+        """
+        curated = self.predefined_terms.get(key)
+        if curated is not None:
+            return curated
+        generated = self.generated_terms.get(key)
+        if generated is None and similar:
+            similar_key = self.similar_keys.get(key)
+            if similar_key is not None:
+                generated = self.generated_terms.get(similar_key)
+        return generated
+
     def add_term(self, term: str, definition: str, category: str = "General AI"):
         """Manually add a new term to the glossary."""
-        new_term = GlossaryTerm(term, definition, category)
-        self.predefined_terms[term.title()] = new_term
+        key = canonical_key(term)
+        with self.lock.write():
+            new_term = self.predefined_terms.add(key, term, definition, category)
+            # A curated definition supersedes any generated placeholder
+            self.generated_terms.pop(key)
+            self.similar_keys.pop(key)
+            for listener in self.listeners:
+                listener(key, new_term)
+
+    def curate(self, key: str, term: GlossaryTerm) -> GlossaryTerm:
+        """Promote a generated term into the repository so it is kept for good."""
+        with self.lock.write():
+            self.predefined_terms[key] = term
+            self.generated_terms.pop(key)
+            self.similar_keys.pop(key)
+            curated = self.predefined_terms[key]
+            for listener in self.listeners:
+                listener(key, curated)
+        return curated
+
+    def add_terms(self, rows: Iterable[Tuple[str, str, str]],
+                  examples: Iterable[Tuple[str, str]] = ()) -> int:
+        """Bulk-add (term, definition, category) rows. Returns the number added.
+
+        examples are (key, example) pairs for the new terms, written in the
+        same repository transaction.
+        """
+        keys: List[str] = []
+
+        def keyed():
+            for row in rows:
+                keys.append(canonical_key(row[0]))
+                yield row
+
+        with self.lock.write():
+            count = self.repository.add_many(keyed(), examples)
+            for listener in self.bulk_listeners:
+                listener(keys)
+            for listener in self.reload_listeners:
+                listener()
+        return count
+
+    def add_alias(self, alias: str, term: str):
+        """Make alias resolve to an existing term's entry."""
+        with self.lock.write():
+            if canonical_key(alias) in self.predefined_terms:
+                raise ValueError(f"{alias!r} is already a glossary term")
+            self.aliases.add(alias, term)
 
 class ExampleAgent:
-    """AI agent for generating business growth examples for glossary terms."""
-    def __init__(self):
+    """AI agent for generating business growth examples for glossary terms.
+
+    Each business context is compiled once into a format string. A term's
+    pool of examples is every context in an order fixed by seed and the
+    term's name, so the same term always gets the same examples (and
+    cached pages stay stable across restarts and processes). Terms keep at
+    most max_examples distinct examples.
+    """
+
+    template = "For {term}, imagine {context} using {lowered} to save time and boost profits."
+
+    def __init__(self, contexts: Optional[List[str]] = None, seed: int = 0, max_examples: int = 5):
         # Sample business contexts for examples
-        self.contexts = [
+        self.contexts = contexts or [
             "an e-commerce store increasing sales",
             "a small startup automating customer support",
             "a marketing agency optimizing ad campaigns",
             "a restaurant improving inventory management",
             "a freelancer streamlining project tracking"
         ]
+        self.seed = seed
+        self.max_examples = max_examples
+        self._formats = [
+            self.template.replace("{context}", context.replace("{", "{{").replace("}", "}}")).format
+            for context in self.contexts
+        ]
+
+    def _offset(self, name: str) -> int:
+        return zlib.crc32(f"{self.seed}:{name}".encode("utf-8"))
+
+    def pool(self, term: GlossaryTerm) -> List[str]:
+        """Every example for term, in the order they are handed out."""
+        offset = self._offset(term.term)
+        lowered = term.term.lower()
+        count = len(self._formats)
+        return [self._formats[(offset + i) % count](term=term.term, lowered=lowered)
+                for i in range(count)]
+
+    def compose_example(self, term: GlossaryTerm) -> str:
+        """Compose a business growth example without attaching it to the term.
 
-    def generate_example(self, term: GlossaryTerm) -> str:
-        """Generate a business growth example for a given term."""
-        context = random.choice(self.contexts)
-        example = f"For {term.term}, imagine {context} using {term.term.lower()} to save time and boost profits."
-        term.add_example(example)
-        return example
+        This is the example generate_example would attach next, or the
+        term's first one if the pool is used up.
+        """
+        pool = self.pool(term)
+        existing = set(term.examples)
+        return next((example for example in pool if example not in existing), pool[0])
+
+    def compose_examples(self, terms: Iterable[GlossaryTerm], count: int = 1) -> List[List[str]]:
+        """The first count examples of each term's pool, in one pass over all terms."""
+        terms = list(terms)
+        count = min(count, len(self._formats))
+        offsets = np.fromiter((self._offset(term.term) for term in terms), dtype=np.int64,
+                              count=len(terms))
+        choices = (offsets[:, None] + np.arange(count)) % len(self._formats)
+        return [[self._formats[choice](term=term.term, lowered=term.term.lower())
+                 for choice in row] for term, row in zip(terms, choices.tolist())]
+
+    def accepts(self, term: GlossaryTerm, example: str) -> bool:
+        """Whether example is new to term and term has room for it."""
+        existing = term.examples
+        return len(existing) < self.max_examples and example not in existing
+
+    def generate_example(self, term: GlossaryTerm) -> Optional[str]:
+        """Attach the next example from term's pool; None if it has no room or none left."""
+        with metrics.timer("glossary_stage_seconds", stage="generate_example"):
+            example = self.compose_example(term)
+            if not self.accepts(term, example):
+                return None
+            term.add_example(example)
+            return example
 
 class GlossaryAgent:
-    """Main AI agent coordinating glossary interactions for entrepreneurs."""
-    def __init__(self):
-        self.definition_agent = DefinitionAgent()
+    """Main AI agent coordinating glossary interactions for entrepreneurs.
+
+    Safe to share between threads: reads (explain_term, search, list_terms)
+    run concurrently under the definition agent's read lock, and writes
+    (learn_term, add_example) run alone under its write lock.
+    """
+    def __init__(self, repository=None, generator=None):
+        self.definition_agent = DefinitionAgent(repository=repository, generator=generator)
         self.example_agent = ExampleAgent()
-        self.glossary: Dict[str, GlossaryTerm] = {}
-
-    def learn_term(self, term: str) -> GlossaryTerm:
-        """Learn and store a glossary term with definition and example."""
-        glossary_term = self.definition_agent.get_definition(term)
-        if term not in self.glossary:
-            self.glossary[term] = glossary_term
-            # Generate an initial example
-            self.example_agent.generate_example(glossary_term)
+        # Learned terms are flagged in the same repository, so they are not copied
+        self.glossary = self.definition_agent.repository.learned
+        self._search_index: Optional[SearchIndex] = None
+        self._search_index_lock = threading.Lock()
+        self._related_terms: Optional[RelatedTerms] = None
+        self._related_terms_lock = threading.Lock()
+        # The thread building or updating related terms, if any, and the keys
+        # of terms curated since it copied its rows
+        self._related_refresh: Optional[threading.Thread] = None
+        self._related_backlog: List[str] = []
+        self._listing: Optional[TermListing] = None
+        self._listing_lock = threading.Lock()
+        self._generation_pool: Optional[ThreadPoolExecutor] = None
+        self._generation_pool_lock = threading.Lock()
+        self.generation_workers = 8
+        self.lock = self.definition_agent.lock
+        # Most curated terms learn_term may grow the repository to (None: no limit)
+        self.max_terms: Optional[int] = None
+        # Background generation for explain_term; see start_jobs
+        self.jobs: Optional[JobQueue] = None
+        self._job_arguments: Optional[Tuple[int, Dict]] = None
+        # Callbacks invoked with the key of each term whose content changed
+        # (e.g. to drop cached pages), and after bulk loads
+        self.listeners: List[Callable[[str], None]] = []
+        self.reload_listeners = self.definition_agent.reload_listeners
+        # Callbacks invoked by after_fork, to reset state that belongs to the parent
+        self.fork_listeners: List[Callable[[], None]] = []
+        self.definition_agent.listeners.append(self._index_term)
+        self.definition_agent.listeners.append(lambda key, term: self._changed(key))
+        self.definition_agent.bulk_listeners.append(self._index_terms)
+        self.definition_agent.reload_listeners.append(self._drop_search_index)
+        self.definition_agent.reload_listeners.append(self._drop_listing)
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Autocomplete and typo-tolerant lookup over curated term names, built on first use."""
+        index = self._search_index
+        if index is None:
+            # Concurrent readers may all miss; only one of them builds the index
+            with self._search_index_lock:
+                index = self._search_index
+                if index is None:
+                    index = self._search_index = SearchIndex(
+                        term.term for term in self.definition_agent.predefined_terms.values()
+                    )
+        return index
+
+    @property
+    def related_terms(self) -> RelatedTerms:
+        """Precomputed nearest neighbours of every curated term, waiting for them if need be.
+
+        For scripts and startup: it blocks until refresh_related_terms has
+        built them, so it must not be used while holding the agent's lock.
+        """
+        if self._related_terms is None:
+            self.refresh_related_terms(wait=True)
+        return self._related_terms
+
+    def refresh_related_terms(self, wait: bool = False):
+        """Build or update related_terms in a background thread, unless one is at it already.
+
+        The O(n²) neighbour computation runs outside the agent's lock, so
+        requests keep being served (with no related terms until the first
+        build is done); only copying the rows and engine and publishing the result
+        take it. With wait=True, returns once related_terms is current.
+        """
+        with self._related_terms_lock:
+            thread = self._related_refresh
+            if thread is None:
+                thread = self._related_refresh = threading.Thread(
+                    target=self._refresh_related_terms, name="related-terms", daemon=True)
+                thread.start()
+        if wait:
+            thread.join()
+
+    def _refresh_related_terms(self):
+        try:
+            while True:
+                with self.lock.read():
+                    engine = self._related_terms
+                    keys, self._related_backlog = self._related_backlog, []
+                    rebuild = engine is None or engine.stale
+                    rows = self._related_rows(None if rebuild else keys)
+                    if rows and not rebuild:
+                        # Copied under the lock, since _index_term adds to the published
+                        # engine under the write lock; readers keep using it meanwhile
+                        engine = engine.copy()
+                if rebuild:
+                    engine = RelatedTerms()
+                    engine.build(rows)
+                elif rows:
+                    engine.add_many(rows)
+                with self.lock.write():
+                    self._related_terms = engine
+                    # Terms curated meanwhile were only added to the published engine
+                    if len(self._related_backlog) <= engine.batch_size:
+                        engine.add_many(self._related_rows(self._related_backlog))
+                        self._related_backlog = []
+                        self._related_refresh = None
+                        return
+        finally:
+            if self._related_refresh is threading.current_thread():
+                with self.lock.write():
+                    self._related_refresh = None
+
+    def _related_rows(self, keys: Optional[List[str]] = None) -> List[Tuple[str, str, str]]:
+        # Callers hold the lock. (key, name, definition) of every curated term, or of keys'
+        terms = self.definition_agent.predefined_terms
+        if keys is None:
+            return [(key, term.term, term.definition) for key, term in terms.items()]
+        rows = []
+        for key in dict.fromkeys(keys):
+            term = terms.get(key)
+            if term is not None:
+                rows.append((key, term.term, term.definition))
+        return rows
+
+    @property
+    def listing(self) -> TermListing:
+        """Sorted, category-partitioned listing of learned terms, built on first use."""
+        listing = self._listing
+        if listing is None:
+            with self._listing_lock:
+                listing = self._listing
+                if listing is None:
+                    listing = self._listing = TermListing(
+                        (key, term.term, term.category) for key, term in self.glossary.items()
+                    )
+        return listing
+
+    def _index_term(self, key: str, term: GlossaryTerm):
+        if self._search_index is not None:
+            self._search_index.add(term.term)
+        if self._related_terms is not None:
+            self._related_terms.add(key, term.term, term.definition)
+        if self._related_refresh is not None:
+            # A background refresh works on its own copy; it adds these when done
+            self._related_backlog.append(key)
+        if self._listing is not None and key in self._listing:
+            # A learned term was redefined, possibly under another category
+            self._listing.add(key, term.term, term.category)
+
+    def _drop_search_index(self):
+        # Rebuilt from the repository on next use
+        self._search_index = None
+
+    def _index_terms(self, keys: List[str]):
+        # A bulk load: too many terms to add to related terms under the lock
+        if self._related_terms is None and self._related_refresh is None:
+            # Built from the repository on first use anyway
+            return
+        self._related_backlog.extend(keys)
+        self.refresh_related_terms()
+
+    def _drop_listing(self):
+        self._listing = None
+
+    def _changed(self, key: str):
+        for listener in self.listeners:
+            listener(key)
+
+    def learn_term(self, term: str, key: Optional[str] = None) -> GlossaryTerm:
+        """Learn and store a glossary term with definition and example.
+
+        This is the write path: a generated term is promoted out of the
+        evictable cache into the repository and added to the glossary.
+        A generated term is only kept if a model defined it (not the stub
+        backend's placeholder) and the repository holds fewer than
+        max_terms curated terms; otherwise it is returned unchanged, so
+        arbitrary input cannot grow the glossary.
+        """
+        if key is None:
+            key = self.definition_agent.resolve_key(term)
+        # Generate before taking the lock, so a slow model does not block readers.
+        # A paraphrase's definition is fine to show but not to keep under this key.
+        generated = self.definition_agent.get_definition(term, key, similar=False)
+        with self.lock.write():
+            # Another thread may have curated the term in the meantime
+            glossary_term = self.definition_agent.lookup(key, similar=False) or generated
+            if not self.definition_agent.is_curated(glossary_term):
+                if not self._keeps(glossary_term):
+                    return glossary_term
+                glossary_term = self.definition_agent.curate(key, glossary_term)
+            # claim() is atomic across processes sharing a database, so only
+            # the first learner of a term generates its initial example
+            if self.glossary.claim(key, glossary_term):
+                self.example_agent.generate_example(glossary_term)
+                if self._listing is not None:
+                    self._listing.add(key, glossary_term.term, glossary_term.category)
+                self._changed(key)
         return glossary_term
 
-    def explain_term(self, term: str) -> Dict:
-        """Provide a full explanation of a term, including definition and examples."""
-        glossary_term = self.learn_term(term)
+    def _keeps(self, generated: GlossaryTerm) -> bool:
+        # Callers hold the write lock
+        if self.definition_agent.is_placeholder(generated):
+            return False
+        return (self.max_terms is None
+                or len(self.definition_agent.predefined_terms) < self.max_terms)
+
+    def learn_starter_terms(self):
+        """Learn the terms shown on the home page of a new glossary, if it has none."""
+        if not self.glossary:
+            self.learn_term("Machine Learning")
+            self.learn_term("Generative AI")
+
+    def add_example(self, term: str, example: str) -> bool:
+        """Attach a hand-written example to a curated term.
+
+        Returns False, leaving the term as it was, if the term already has
+        this example or example_agent.max_examples of them.
+        """
+        with self.lock.write():
+            key = self.definition_agent.resolve_key(term)
+            glossary_term = self.definition_agent.predefined_terms[key]
+            if not self.example_agent.accepts(glossary_term, example):
+                return False
+            glossary_term.add_example(example)
+            self._changed(key)
+            return True
+
+    def warm_examples(self, count: int = 1) -> int:
+        """Give every learned term at least count examples, in one bulk write.
+
+        Returns the number of examples added.
+        """
+        with self.lock.write():
+            terms = list(self.glossary.items())
+            stored = [set(term.examples) for _, term in terms]
+            rows = []
+            pools = self.example_agent.compose_examples((term for _, term in terms), count)
+            for (key, _), existing, pool in zip(terms, stored, pools):
+                for example in pool:
+                    if len(existing) >= count or len(existing) >= self.example_agent.max_examples:
+                        break
+                    if example not in existing:
+                        existing.add(example)
+                        rows.append((key, example))
+            added = self.definition_agent.repository.add_examples(rows)
+            for key in dict.fromkeys(key for key, _ in rows):
+                self._changed(key)
+        return added
+
+    def explain_term(self, term: str, key: Optional[str] = None, priority: int = NORMAL) -> Dict:
+        """Provide a full explanation of a term, including definition and examples.
+
+        Read-only: the glossary, the repository and stored examples are never
+        modified (only the bounded generated-definition cache may be filled),
+        so the result is safe to serve from GET requests and HTTP caches.
+        Call learn_term to keep a term.
+
+        With background jobs started, an unknown term is explained with a
+        placeholder and its generation is queued at priority. "pending" is
+        True while the job runs; listeners are told its key once it is done.
+        """
+        if key is None:
+            key = self.definition_agent.resolve_key(term)
+        with self.lock.read():
+            known = self.definition_agent.lookup(key)
+            if known is not None:
+                return self._explain(term, known, key)
+            if self.jobs is not None:
+                # Answer now and let the queue fill in the real definition
+                self.jobs.submit(key, self.definition_agent.display_name(term), priority)
+                return dict(self._explain(term, self.definition_agent.placeholder(term), key),
+                            pending=self.jobs.pending(key))
+        # Generate without holding the lock, so a slow model does not block writers
+        generated = self.definition_agent.get_definition(term, key)
+        with self.lock.read():
+            return self._explain(term, self.definition_agent.lookup(key) or generated, key)
+
+    def _explain(self, query: str, glossary_term: GlossaryTerm, key: str) -> Dict:
+        # Callers hold the read lock; everything shown is copied out, so later
+        # writes cannot change a page mid-render
+        curated = self.definition_agent.is_curated(glossary_term)
+        examples = list(glossary_term.examples)
+        if not examples:
+            # Show a preview example for terms that have none stored yet
+            examples.append(self.example_agent.compose_example(glossary_term))
         return {
             "term": glossary_term.term,
             "definition": glossary_term.definition,
             "category": glossary_term.category,
-            "examples": glossary_term.examples,
-            "business_tip": f"Use {term.lower()} to grow your business by applying it to your unique needs."
+            "examples": examples,
+            "business_tip": f"Use {glossary_term.term.lower()} to grow your business by applying it to your unique needs.",
+            # Close curated matches for terms that fell through to generation
+            "suggestions": [] if curated else self.search_index.fuzzy(query, limit=3),
+            "related": self._related(key, glossary_term, curated, 5),
+            "pending": False
         }
 
+    def _related(self, key: str, glossary_term: GlossaryTerm, curated: bool, k: int) -> List[str]:
+        # Callers hold the read lock, so they must not wait for a build
+        engine = self._related_terms
+        if engine is None:
+            self.refresh_related_terms()
+            return []
+        if curated:
+            return engine.related(key, k)
+        return engine.similar_to(glossary_term.term, glossary_term.definition, k)
+
+    def related(self, term: str, k: int = 5) -> List[str]:
+        """Names of up to k curated terms whose name and definition are most like term's.
+
+        Curated terms answer from precomputed neighbour lists; other known
+        terms are compared against every curated term at lookup time.
+        Unknown terms are not generated and have no related terms.
+        """
+        key = self.definition_agent.resolve_key(term)
+        with self.lock.read():
+            glossary_term = self.definition_agent.lookup(key)
+            if glossary_term is None:
+                return []
+            return self._related(key, glossary_term,
+                                 self.definition_agent.is_curated(glossary_term), k)
+
+    def start_jobs(self, workers: int = 2, **options) -> JobQueue:
+        """Generate unknown terms in a background JobQueue from now on.
+
+        Jobs are recorded in the repository's job table, if it has one, and
+        options are passed on to JobQueue.
+        """
+        self.jobs = JobQueue(self._generated, workers,
+                             table=self.definition_agent.repository.jobs, **options)
+        self._job_arguments = (workers, options)
+        return self.jobs
+
+    def after_fork(self):
+        """Replace the threads, pools and connections this process inherited over fork().
+
+        For pre-forking servers that build the agent in the parent, such as
+        gunicorn with preload_app; call it in each child before serving.
+        """
+        self.definition_agent.repository.after_fork()
+        generator = self.definition_agent.generator
+        if isinstance(generator, BatchingGenerator):
+            self.definition_agent.generator = BatchingGenerator(
+                generator.backend, generator.max_batch_size, generator.max_wait)
+        self._generation_pool = None
+        if self.jobs is not None:
+            workers, options = self._job_arguments
+            self.start_jobs(workers, **options)
+        if self._related_refresh is not None:
+            # Its thread stayed behind in the parent
+            self._related_refresh = None
+            self.refresh_related_terms()
+        for listener in self.fork_listeners:
+            listener()
+
+    def _generated(self, key: str, term: str, definition: str):
+        # Called by the job queue when a background generation finishes
+        self.definition_agent.remember(key, GlossaryTerm(term, definition, "Unclassified"))
+        self._changed(key)
+
+    @property
+    def generation_pool(self) -> ThreadPoolExecutor:
+        """Worker threads that generate definitions for batch requests, started on first use."""
+        with self._generation_pool_lock:
+            if self._generation_pool is None:
+                self._generation_pool = ThreadPoolExecutor(self.generation_workers,
+                                                           thread_name_prefix="generate")
+        return self._generation_pool
+
+    def explain_terms(self, terms: Iterable[str], deadline: Optional[float] = None) -> Iterator[Dict]:
+        """Explain many terms at once, yielding one explanation per distinct term.
+
+        Terms that resolve to the same key (e.g. "ML" and "machine learning")
+        are explained once, under the first spelling given, which each result
+        carries as "query". Known terms are read from a single snapshot and
+        yielded first, in input order; terms that need generation are fanned
+        out to generation_pool and yielded as they finish. Those not finished
+        within deadline seconds yield {"query": ..., "error": "timed out"}.
+        """
+        expires = None if deadline is None else time.monotonic() + deadline
+        queries: Dict[str, str] = {}
+        for term in terms:
+            queries.setdefault(self.definition_agent.resolve_key(term), term)
+
+        pending: Dict[str, str] = {}
+        snapshot = []
+        with self.lock.read():
+            for key, query in queries.items():
+                known = self.definition_agent.lookup(key)
+                if known is None:
+                    pending[key] = query
+                else:
+                    snapshot.append(dict(self._explain(query, known, key), query=query))
+        yield from snapshot
+
+        futures = {self.generation_pool.submit(self.explain_term, query, key): query
+                   for key, query in pending.items()}
+        while futures:
+            timeout = None if expires is None else max(0.0, expires - time.monotonic())
+            done, _ = wait(futures, timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                query = futures.pop(future)
+                try:
+                    yield dict(future.result(), query=query)
+                except Exception as error:
+                    yield {"query": query, "error": str(error)}
+        for future, query in futures.items():
+            future.cancel()
+            yield {"query": query, "error": "timed out"}
+
     def list_terms(self) -> List[str]:
         """List all known glossary terms."""
-        return list(self.glossary.keys())
+        with self.lock.read():
+            return [glossary_term.term for glossary_term in self.glossary.values()]
+
+    def list_page(self, category: Optional[str] = None, after: Optional[str] = None,
+                  limit: int = 50) -> Dict:
+        """One page of learned terms in alphabetical order, optionally of one category.
+
+        Pass the returned "next" cursor as after to get the following page;
+        it is None on the last page. Costs O(log N + limit), not O(N).
+        """
+        with self.lock.read():
+            terms, cursor = self.listing.page(category, after, limit)
+            return {"terms": terms, "next": cursor, "category": category}
+
+    def categories(self) -> List[Tuple[str, int]]:
+        """(category, number of learned terms) pairs, sorted by category."""
+        with self.lock.read():
+            return self.listing.categories()
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """Find curated terms by prefix, falling back to close misspellings."""
+        with self.lock.read():
+            return self.search_index.search(query, limit)
 
 # Example usage (for testing privately)
 if __name__ == "__main__":
@@ -145,38 +770,3 @@ if __name__ == "__main__":
     print(f"Term: {result['term']}")
     print(f"Definition: {result['definition']}")
     print(f"Examples: {result['examples']}")
-```
-
-### Explanation of the Code
-1. **GlossaryTerm Class**:
-   - Represents a single glossary entry (e.g., "Machine Learning") with attributes like definition, category, and examples.
-   - Includes a method to convert to a dictionary for easy storage or display.
-
-2. **DefinitionAgent Class**:
-   - Manages glossary term definitions.
-   - Comes with a small set of predefined terms for demo purposes.
-   - Can simulate generating definitions for new terms (placeholder for future integration with a real AI model like GPT).
-   - Allows manual term addition for customization.
-
-3. **ExampleAgent Class**:
-   - Generates business-focused examples for each term.
-   - Uses a list of entrepreneurial contexts (e.g., e-commerce, startups) to keep examples relevant.
-   - Randomizes examples but ties them to the term’s meaning.
-
-4. **GlossaryAgent Class**:
-   - The main coordinator, tying DefinitionAgent and ExampleAgent together.
-   - Learns terms on demand, caches them, and provides full explanations with definitions, examples, and a business tip.
-   - Supports listing all terms for a glossary overview.
-
-### How It Fits "Gelato Play"
-- **Educational Focus**: The agents break down AI concepts into digestible definitions and practical examples, perfect for entrepreneurs new to AI.
-- **Business Growth Angle**: Examples and tips emphasize how AI can drive growth, aligning with your project’s goal.
-- **Scalability**: The modular design lets you later integrate real AI models (e.g., via API calls) or a database for persistence.
-
-### Next Steps
-- **Real AI Integration**: Replace simulated definitions with calls to an AI model (e.g., OpenAI’s API) for dynamic generation.
-- **Storage**: Add a database (e.g., SQLite) to persist glossary data.
-- **UI**: Pair this with a front-end (e.g., Flask or Django) to make it interactive for users.
-- **Secret Features**: If you have private enhancements in mind, I can add those securely—just let me know what you’re thinking!
-
-What would you like to prioritize next for Gelato Play?
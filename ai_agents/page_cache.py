@@ -0,0 +1,120 @@
+# page_cache.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+
+from .cache import LRUCache
+
+
+class CachedPage:
+    """A rendered page body with its strong ETag."""
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: str):
+        self.body = body.encode("utf-8")
+        # Strong validator: identical bytes always get the same tag
+        self.etag = hashlib.blake2b(self.body, digest_size=16).hexdigest()
+
+
+class PageCache:
+    """Rendered pages keyed by (page name, canonical term key, content version, variant).
+
+    invalidate(key) bumps the key's content version, so pages rendered from
+    older content are never served again, and drops them right away. The
+    home listing is stored under the empty key and is invalidated along with
+    any term. A variant distinguishes renderings of the same content, such
+    as the pages of the home listing; invalidate() drops only the default
+    variant right away, and the others become unreachable and age out.
+
+    A page rendered while its key was being invalidated must not be stored
+    under the new version, so callers read version(key) before rendering and
+    pass it to put.
+
+    Every cached page is younger than ttl, so a key invalidated longer ago
+    than that has no page left from before the invalidation, and its version
+    entry is dropped (assuming no render takes longer than ttl). Without a
+    ttl, more than max_versions entries clear the whole cache instead.
+    """
+
+    HOME = ""
+
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = 300.0,
+                 max_versions: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.pages = LRUCache(max_size, ttl, clock)
+        self.ttl = ttl
+        self.max_versions = max_versions
+        self.clock = clock
+        # Versions come from one counter; keys not invalidated since the last
+        # clear() (or for longer than ttl) are at the version clear() set and
+        # have no entry here. Entries are (version, invalidated at), oldest first.
+        self._counter = 0
+        self._cleared = 0
+        self._versions: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._page_names: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def version(self, key: str) -> int:
+        entry = self._versions.get(key)
+        return self._cleared if entry is None else entry[0]
+
+    def get(self, page: str, key: str, version: Optional[int] = None,
+            variant: Hashable = None) -> Optional[CachedPage]:
+        if version is None:
+            version = self.version(key)
+        return self.pages.get((page, key, version, variant))
+
+    def put(self, page: str, key: str, body: str, version: Optional[int] = None,
+            variant: Hashable = None) -> CachedPage:
+        """Store body, rendered from key's content as of version (default: current)."""
+        cached = CachedPage(body)
+        with self._lock:
+            if version is None:
+                version = self.version(key)
+            elif version != self.version(key):
+                # Rendered from content that has changed since; do not keep it
+                return cached
+            self._page_names.add(page)
+            self.pages.put((page, key, version, variant), cached)
+        return cached
+
+    def invalidate(self, key: str, home: bool = True):
+        """Forget pages showing key's content, and unless home is False the home listing."""
+        with self._lock:
+            now = self.clock()
+            for changed in {key, self.HOME} if home else {key}:
+                version = self.version(changed)
+                for page in self._page_names:
+                    self.pages.pop((page, changed, version, None))
+                self._counter += 1
+                self._versions[changed] = (self._counter, now)
+                self._versions.move_to_end(changed)
+            self._prune(now)
+
+    def _prune(self, now: float):
+        # Callers hold the lock
+        if self.ttl is None:
+            if len(self._versions) > self.max_versions:
+                self._clear()
+            return
+        horizon = now - self.ttl
+        while self._versions:
+            key, (_, invalidated_at) = next(iter(self._versions.items()))
+            if invalidated_at > horizon:
+                break
+            del self._versions[key]
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self.pages.clear()
+        # Every key moves to a new version, so in-flight renders are not stored
+        self._counter += 1
+        self._cleared = self._counter
+        self._versions.clear()
+
+    def stats(self) -> Dict:
+        return dict(self.pages.stats(), versions=len(self._versions))
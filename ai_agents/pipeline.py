@@ -0,0 +1,360 @@
+# pipeline.py
+"""Streaming task pipelines, such as the sales_rep / lead_sales_rep outreach crew.
+
+A pipeline is a DAG of tasks. Each task runs its function on a pool of
+worker threads, one item at a time, and hands every result to the tasks
+that depend on it as soon as it is ready, so outreach for the first lead
+starts while research is still finding the rest:
+
+    pipeline = outreach_pipeline(StubLLM(), StubSearchTool())
+    for result in pipeline.run(["fintech", "retail"]):
+        print(result.value)
+
+Tasks without dependencies receive the pipeline's inputs. A task with
+fan_out=True returns an iterable and each of its elements becomes an item
+of its own. A task with several dependencies receives a dict of their
+results once all of them have finished the same item. Queues between
+tasks hold at most queue_size items, so a slow task blocks the tasks
+feeding it instead of letting work pile up in memory. The results such
+a task holds while it waits for its slower dependencies are not queued;
+see _Run.joins for what bounds them.
+
+StubLLM and StubSearchTool stand in for the model and the web search with
+fixed latencies, so pipelines run offline.
+"""
+import hashlib
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .sentiment import SentimentAnalysisTool
+
+# Identifies an item and its origin: the input's index, then the position
+# in each fan-out it went through
+Key = Tuple[int, ...]
+
+_DONE = object()
+
+# Task name of the Result reporting that iterating a run's inputs failed
+INPUTS = "<inputs>"
+
+
+class Task:
+    """A named step of a pipeline and the tasks whose results it takes."""
+
+    def __init__(self, name: str, run: Callable[[Any], Any], depends_on: Sequence[str] = (),
+                 workers: int = 1, fan_out: bool = False):
+        if workers < 1:
+            raise ValueError(f"Task {name!r} needs at least one worker")
+        self.name = name
+        self.run = run
+        self.depends_on = tuple(depends_on)
+        self.workers = workers
+        self.fan_out = fan_out
+
+
+class Result:
+    """What a final task produced for one item, or the error that stopped the item."""
+
+    __slots__ = ("task", "key", "value", "error")
+
+    def __init__(self, task: str, key: Key, value: Any = None,
+                 error: Optional[BaseException] = None):
+        self.task = task
+        self.key = key
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else f"value={self.value!r}"
+        return f"Result(task={self.task!r}, key={self.key!r}, {outcome})"
+
+
+class _Run:
+    """The queues and threads of one Pipeline.run() call."""
+
+    def __init__(self, pipeline: "Pipeline"):
+        self.pipeline = pipeline
+        size = pipeline.queue_size
+        self.inboxes = {name: queue.Queue(size) for name in pipeline.order}
+        self.output: queue.Queue = queue.Queue(size)
+        # task -> key -> partial dict of dependency results, for tasks with several.
+        # Not bounded by queue_size itself: its faster dependencies run ahead
+        # of the slower ones only as far as the slower paths' queues and
+        # workers let their common upstream (or the feed) get ahead, since
+        # every item is put to each dependent in turn. Results of items that
+        # failed in another dependency stay until the task's inputs end.
+        self.joins: Dict[str, Dict[Key, Dict[str, Any]]] = {
+            name: {} for name, task in pipeline.tasks.items() if len(task.depends_on) > 1}
+        self.upstream_left = {name: len(task.depends_on) for name, task in pipeline.tasks.items()}
+        self.workers_left = {name: task.workers for name, task in pipeline.tasks.items()}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.threads: List[threading.Thread] = []
+        self.sinks_left = len(pipeline.sinks)
+        self.processed = {name: 0 for name in pipeline.order}
+        self.failed = {name: 0 for name in pipeline.order}
+
+    def put(self, target: queue.Queue, item) -> bool:
+        # Blocking put that gives up once the run is stopped
+        while not self.stopped.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def start(self, inputs: Iterable[Any]):
+        for name in self.pipeline.order:
+            for index in range(self.pipeline.tasks[name].workers):
+                self._spawn(self._work, name, f"pipeline-{name}-{index}")
+        self._spawn(self._feed, inputs, "pipeline-feed")
+
+    def _spawn(self, target, argument, name: str):
+        thread = threading.Thread(target=target, args=(argument,), name=name, daemon=True)
+        self.threads.append(thread)
+        thread.start()
+
+    def _feed(self, inputs: Iterable[Any]):
+        index = -1
+        try:
+            for index, item in enumerate(inputs):
+                for name in self.pipeline.sources:
+                    if not self.put(self.inboxes[name], ((index,), item)):
+                        return
+        except Exception as error:
+            # Iterating inputs failed: report it where the next input would have been
+            self.put(self.output, Result(INPUTS, (index + 1,), error=error))
+        finally:
+            # The items fed so far still finish, and results() ends after them
+            for name in self.pipeline.sources:
+                self._close_inbox(name)
+
+    def _close_inbox(self, name: str):
+        # One marker per worker, each of which exits on its first
+        for _ in range(self.pipeline.tasks[name].workers):
+            self.put(self.inboxes[name], _DONE)
+
+    def _work(self, name: str):
+        task = self.pipeline.tasks[name]
+        inbox = self.inboxes[name]
+        try:
+            while not self.stopped.is_set():
+                try:
+                    entry = inbox.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if entry is _DONE:
+                    break
+                key, item = entry
+                try:
+                    value = task.run(item)
+                    values = (list(enumerate(value)) if task.fan_out else [(None, value)])
+                except Exception as error:
+                    with self.lock:
+                        self.failed[name] += 1
+                    self.put(self.output, Result(name, key, error=error))
+                    continue
+                with self.lock:
+                    self.processed[name] += 1
+                for position, value in values:
+                    self._emit(name, key if position is None else key + (position,), value)
+        finally:
+            # Even if a BaseException ends this worker, the last one out closes downstream
+            with self.lock:
+                self.workers_left[name] -= 1
+                finished = self.workers_left[name] == 0
+            if finished:
+                self._finish(name)
+
+    def _emit(self, name: str, key: Key, value: Any):
+        dependents = self.pipeline.dependents[name]
+        if not dependents:
+            self.put(self.output, Result(name, key, value))
+        for dependent in dependents:
+            pending = self.joins.get(dependent)
+            if pending is None:
+                self.put(self.inboxes[dependent], (key, value))
+                continue
+            with self.lock:
+                results = pending.setdefault(key, {})
+                results[name] = value
+                complete = len(results) == len(self.pipeline.tasks[dependent].depends_on)
+                if complete:
+                    del pending[key]
+            if complete:
+                self.put(self.inboxes[dependent], (key, results))
+
+    def _finish(self, name: str):
+        # Every worker of name has exited, so nothing more flows out of it
+        dependents = self.pipeline.dependents[name]
+        if not dependents:
+            with self.lock:
+                self.sinks_left -= 1
+                last = self.sinks_left == 0
+            if last:
+                self.put(self.output, _DONE)
+        for dependent in dependents:
+            with self.lock:
+                self.upstream_left[dependent] -= 1
+                ready = self.upstream_left[dependent] == 0
+            if ready:
+                # Items that some dependency dropped with an error never complete
+                self.joins.get(dependent, {}).clear()
+                self._close_inbox(dependent)
+
+    def results(self) -> Iterator[Result]:
+        try:
+            while True:
+                result = self.output.get()
+                if result is _DONE:
+                    return
+                yield result
+        finally:
+            # Also reached when the caller stops iterating early; every
+            # thread notices within its next queue timeout and exits
+            self.stopped.set()
+
+
+class Pipeline:
+    """Runs a DAG of tasks over a stream of inputs."""
+
+    def __init__(self, tasks: Sequence[Task], queue_size: int = 64):
+        self.tasks: Dict[str, Task] = {}
+        for task in tasks:
+            if task.name in self.tasks:
+                raise ValueError(f"Duplicate task {task.name!r}")
+            self.tasks[task.name] = task
+        self.queue_size = queue_size
+        self.dependents: Dict[str, List[str]] = {name: [] for name in self.tasks}
+        for task in tasks:
+            for dependency in task.depends_on:
+                if dependency not in self.tasks:
+                    raise ValueError(f"Task {task.name!r} depends on unknown task {dependency!r}")
+                self.dependents[dependency].append(task.name)
+        self.order = self._topological_order()
+        self.sources = [name for name in self.order if not self.tasks[name].depends_on]
+        self.sinks = [name for name in self.order if not self.dependents[name]]
+        self.last_run: Optional[_Run] = None
+
+    def _topological_order(self) -> List[str]:
+        waiting = {name: len(task.depends_on) for name, task in self.tasks.items()}
+        ready = [name for name, count in waiting.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop()
+            order.append(name)
+            for dependent in self.dependents[name]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.tasks):
+            cycle = sorted(name for name, count in waiting.items() if count)
+            raise ValueError(f"Tasks form a cycle: {', '.join(cycle)}")
+        return order
+
+    def run(self, inputs: Iterable[Any]) -> Iterator[Result]:
+        """Results of the final tasks, in the order they finish.
+
+        inputs is consumed lazily, so it may be a generator. Failed items
+        come out as results with error set and go no further. If iterating
+        inputs raises, the items before it still finish and the error comes
+        out as a result of task INPUTS.
+        """
+        run = self.last_run = _Run(self)
+        run.start(inputs)
+        return run.results()
+
+    def stats(self) -> Dict:
+        """Items processed and failed per task in the latest run."""
+        run = self.last_run
+        if run is None:
+            return {}
+        with run.lock:
+            return {name: {"processed": run.processed[name], "failed": run.failed[name]}
+                    for name in self.order}
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), "big")
+
+
+class StubLLM:
+    """Deterministic completions after a simulated model latency."""
+
+    def __init__(self, latency: float = 0.0, token_latency: float = 0.0, max_tokens: int = 40):
+        self.latency = latency
+        self.token_latency = token_latency
+        self.max_tokens = max_tokens
+        self.calls = 0
+
+    def complete(self, prompt: str) -> str:
+        self.calls += 1
+        words = prompt.split()
+        tokens = min(self.max_tokens, 8 + _digest(prompt) % 24)
+        if self.latency or self.token_latency:
+            time.sleep(self.latency + self.token_latency * tokens)
+        return " ".join(words[i % len(words)] for i in range(tokens)) if words else ""
+
+
+class StubSearchTool:
+    """Deterministic made-up leads for a query after a simulated search latency."""
+
+    SNIPPETS = (
+        "Customers say support is great and onboarding was excellent.",
+        "Recent reviews mention slow delivery and a billing problem.",
+        "The team is expanding and interested in automation.",
+        "Announced layoffs after a disappointing quarter.",
+    )
+
+    def __init__(self, latency: float = 0.0, results: int = 5):
+        self.latency = latency
+        self.results = results
+        self.calls = 0
+
+    def search(self, query: str) -> List[Dict[str, str]]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        seed = _digest(query)
+        return [{"company": f"{query.title()} Co {seed % 1000 + index}",
+                 "contact": f"lead{index}@{query.lower().replace(' ', '')}.example",
+                 "snippet": self.SNIPPETS[(seed + index) % len(self.SNIPPETS)]}
+                for index in range(self.results)]
+
+
+def outreach_pipeline(llm, search, sentiment: Optional[SentimentAnalysisTool] = None,
+                      research_workers: int = 4, outreach_workers: int = 8,
+                      queue_size: int = 64) -> Pipeline:
+    """The outreach crew as a pipeline: research, then per-lead sentiment and summary, then a message.
+
+    Inputs are search queries (industries, regions); results are one dict
+    per lead with its outreach message.
+    """
+    sentiment = sentiment or SentimentAnalysisTool(workers=1)
+
+    def research(query: str):
+        return search.search(f"{query} companies looking for AI tools")
+
+    def qualify(lead: Dict[str, str]) -> Dict[str, str]:
+        summary = llm.complete(f"Summarize {lead['company']} as a sales lead: {lead['snippet']}")
+        return dict(lead, summary=summary)
+
+    def tone(lead: Dict[str, str]) -> str:
+        return sentiment.analyze(lead["snippet"])
+
+    def prepare(results: Dict[str, Any]) -> Dict[str, str]:
+        lead, mood = results["lead_qualification"], results["lead_sentiment"]
+        message = llm.complete(f"Write a {mood.lower()}-aware outreach email to "
+                               f"{lead['company']} ({lead['contact']}): {lead['summary']}")
+        return dict(lead, sentiment=mood, message=message)
+
+    return Pipeline([
+        Task("lead_research", research, workers=research_workers, fan_out=True),
+        Task("lead_qualification", qualify, ["lead_research"], workers=outreach_workers),
+        Task("lead_sentiment", tone, ["lead_research"]),
+        Task("outreach_preparation", prepare, ["lead_qualification", "lead_sentiment"],
+             workers=outreach_workers),
+    ], queue_size=queue_size)
@@ -0,0 +1,138 @@
+# profiling.py
+"""Sampling profiler for a random fraction of requests, as collapsed stacks.
+
+    if profiler.should_sample():
+        profiler.start(request.endpoint)
+        ...
+        profiler.stop()
+
+While at least one sampled request is running, a background thread wakes
+every interval seconds and records the stack of each sampled request's
+thread; otherwise it sleeps. Unsampled requests only pay for one random
+draw, so a low rate can stay on in production. Samples are aggregated
+per endpoint in the collapsed format ("root;caller;callee count") read by
+flamegraph.pl and speedscope.
+"""
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterator, Optional
+
+
+class StackSampler:
+    """Samples the stacks of the threads registered with start()."""
+
+    def __init__(self, rate: float = 0.0, interval: float = 0.005, max_depth: int = 64,
+                 max_stacks: int = 5000):
+        self.rate = rate
+        self.interval = interval
+        self.max_depth = max_depth
+        # Distinct stacks kept per endpoint; further ones are counted as "[truncated]"
+        self.max_stacks = max_stacks
+        self._active: Dict[int, str] = {}
+        self._stacks: Dict[str, Counter] = {}
+        self._requests: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+
+    def should_sample(self) -> bool:
+        return self.rate > 0 and random.random() < self.rate
+
+    def start(self, endpoint: str):
+        """Sample the calling thread's stack, under endpoint, until stop()."""
+        if self._pid != os.getpid():
+            # First use, or first use in a forked worker, which inherits no threads
+            self._start_thread()
+        with self._lock:
+            self._active[threading.get_ident()] = endpoint
+            self._requests[endpoint] += 1
+            self._wake.set()
+
+    def stop(self):
+        with self._lock:
+            self._active.pop(threading.get_ident(), None)
+            if not self._active:
+                self._wake.clear()
+
+    def _start_thread(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._active = {}
+            self._wake = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        wake = self._wake
+        while True:
+            wake.wait()
+            time.sleep(self.interval)
+            self._sample()
+
+    def _sample(self):
+        with self._lock:
+            active = dict(self._active)
+        if not active:
+            return
+        frames = sys._current_frames()
+        stacks = [(endpoint, self._collapse(frames[ident]))
+                  for ident, endpoint in active.items() if ident in frames]
+        with self._lock:
+            for endpoint, stack in stacks:
+                counts = self._stacks.setdefault(endpoint, Counter())
+                if stack not in counts and len(counts) >= self.max_stacks:
+                    stack = "[truncated]"
+                counts[stack] += 1
+
+    def _collapse(self, frame) -> str:
+        labels = []
+        while frame is not None and len(labels) < self.max_depth:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = (
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+    def collapsed(self, endpoint: Optional[str] = None) -> str:
+        """Samples as collapsed stacks, rooted at their endpoint unless one is given."""
+        return "".join(self._lines(endpoint))
+
+    def _lines(self, endpoint: Optional[str]) -> Iterator[str]:
+        with self._lock:
+            stacks = {name: dict(counts) for name, counts in self._stacks.items()
+                      if endpoint is None or name == endpoint}
+        for name in sorted(stacks):
+            prefix = "" if endpoint is not None else f"{name};"
+            for stack, count in sorted(stacks[name].items()):
+                yield f"{prefix}{stack} {count}\n"
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "interval": self.interval,
+                "endpoints": {name: {"requests": self._requests[name],
+                                     "samples": sum(self._stacks.get(name, {}).values())}
+                              for name in sorted(self._requests)},
+            }
+
+    def clear(self):
+        with self._lock:
+            self._stacks = {}
+            self._requests = Counter()
+
+
+# Configured by create_app and served by the views blueprint
+profiler = StackSampler()
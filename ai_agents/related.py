@@ -0,0 +1,234 @@
+# related.py
+import re
+import zlib
+from math import log
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_WORDS = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has in into is it its like of on or that the "
+    "their them they this to was were which while with without".split()
+)
+
+
+def tokens(text: str) -> List[str]:
+    """Lowercase content words of text, with a plural "s" dropped."""
+    words = []
+    for word in _WORDS.findall(text.lower()):
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+class RelatedTerms:
+    """Nearest neighbours of glossary terms by TF-IDF similarity of their text.
+
+    Each term's name and definition become a TF-IDF vector, hashed into dim
+    signed buckets so every term is one row of a single float32 matrix.
+    build() precomputes the top max_k neighbours of every row with batched
+    matrix products; add_many() then keeps them current with one similarity
+    per (row, added term) pair, merging the added terms into the lists of
+    rows they now beat. A changed term's old scores no longer hold, so rows
+    that listed it are recomputed. Document frequencies keep counting as
+    terms are added, but existing rows keep the IDF weights they were built
+    with; stale marks an engine whose document count has doubled since,
+    which is worth rebuilding.
+    """
+
+    def __init__(self, dim: int = 256, max_k: int = 10, batch_size: int = 1024):
+        self.dim = dim
+        self.max_k = max_k
+        self.batch_size = batch_size
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._neighbours = np.zeros((0, max_k), dtype=np.int32)
+        self._scores = np.zeros((0, max_k), dtype=np.float32)
+        self._document_frequency: Dict[str, int] = {}
+        self._documents = 0
+        # Documents counted at the last build(), against which stale is judged
+        self._built_documents = 0
+        self.stale = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _idf(self, word: str) -> float:
+        return log((1 + self._documents) / (1 + self._document_frequency.get(word, 0))) + 1.0
+
+    def _count(self, words: Iterable[str]):
+        self._documents += 1
+        for word in set(words):
+            self._document_frequency[word] = self._document_frequency.get(word, 0) + 1
+
+    def vector(self, name: str, definition: str) -> np.ndarray:
+        """Unit-length hashed TF-IDF vector of a term; the name's words count twice."""
+        counts: Dict[str, float] = {}
+        for word in tokens(name) * 2 + tokens(definition):
+            counts[word] = counts.get(word, 0.0) + 1.0
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word, count in counts.items():
+            digest = zlib.crc32(word.encode("utf-8"))
+            weight = (1.0 + log(count)) * self._idf(word)
+            vector[digest % self.dim] += weight if digest & 0x80000000 else -weight
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def copy(self) -> "RelatedTerms":
+        """An independent copy, to update while this one keeps answering lookups."""
+        other = RelatedTerms(self.dim, self.max_k, self.batch_size)
+        other._keys, other._names, other._rows = list(self._keys), list(self._names), dict(self._rows)
+        other._vectors = self._vectors.copy()
+        other._neighbours = self._neighbours.copy()
+        other._scores = self._scores.copy()
+        other._document_frequency = dict(self._document_frequency)
+        other._documents = self._documents
+        other._built_documents = self._built_documents
+        other.stale = self.stale
+        return other
+
+    def _grow(self, rows: int):
+        if rows <= len(self._vectors):
+            return
+        capacity = max(rows, 2 * len(self._vectors), 64)
+        for attribute, fill in (("_vectors", 0), ("_neighbours", -1), ("_scores", -np.inf)):
+            old = getattr(self, attribute)
+            new = np.full((capacity,) + old.shape[1:], fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, attribute, new)
+
+    def build(self, terms: Iterable[Tuple[str, str, str]]):
+        """Index (key, name, definition) rows from scratch and precompute all neighbours."""
+        rows = list(terms)
+        self._keys, self._names, self._rows = [], [], {}
+        self._document_frequency, self._documents = {}, 0
+        for key, name, definition in rows:
+            self._count(tokens(name) + tokens(definition))
+        self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+        self._neighbours = np.zeros((0, self.max_k), dtype=np.int32)
+        self._scores = np.zeros((0, self.max_k), dtype=np.float32)
+        self._grow(len(rows))
+        for key, name, definition in rows:
+            self._append(key, name, definition)
+        count = len(self._keys)
+        vectors = self._vectors[:count]
+        k = min(self.max_k, count - 1)
+        for start in range(0, count, self.batch_size):
+            similarities = vectors[start:start + self.batch_size] @ vectors.T
+            # A term is not its own neighbour
+            np.fill_diagonal(similarities[:, start:], -np.inf)
+            self._store(np.arange(start, start + len(similarities)), similarities, k)
+        self._built_documents = self._documents
+        self.stale = False
+
+    def _append(self, key: str, name: str, definition: str) -> int:
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = len(self._keys)
+            self._keys.append(key)
+            self._names.append(name)
+            self._grow(len(self._keys))
+        else:
+            self._names[row] = name
+        self._vectors[row] = self.vector(name, definition)
+        return row
+
+    def _store(self, rows: np.ndarray, similarities: np.ndarray, k: int):
+        # Replace the lists of rows with the top k of their similarities to every row
+        index = np.arange(len(similarities))[:, None]
+        self._neighbours[rows] = -1
+        self._scores[rows] = -np.inf
+        if k <= 0:
+            return
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        order = np.argsort(-similarities[index, top], axis=1)
+        top = top[index, order]
+        self._neighbours[rows, :k] = top
+        self._scores[rows, :k] = similarities[index, top]
+
+    def _merge(self, rows: np.ndarray, columns: np.ndarray, similarities: np.ndarray, k: int):
+        # Keep the top k of rows' current lists and their similarities to columns
+        scores = np.concatenate([self._scores[rows, :k], similarities], axis=1)
+        neighbours = np.concatenate(
+            [self._neighbours[rows, :k], np.broadcast_to(columns, similarities.shape)], axis=1)
+        index = np.arange(len(rows))[:, None]
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top = top[index, np.argsort(-scores[index, top], axis=1)]
+        scores = scores[index, top]
+        self._scores[rows, :k] = scores
+        self._neighbours[rows, :k] = np.where(np.isfinite(scores), neighbours[index, top], -1)
+
+    def add(self, key: str, name: str, definition: str):
+        """Index one new or changed term and update neighbour lists incrementally."""
+        self.add_many([(key, name, definition)])
+
+    def add_many(self, terms: Iterable[Tuple[str, str, str]]):
+        """Index new or changed (key, name, definition) rows and update neighbour lists incrementally."""
+        terms = list(terms)
+        for key, name, definition in terms:
+            if key not in self._rows:
+                self._count(tokens(name) + tokens(definition))
+        before = len(self._keys)
+        added = np.unique(np.fromiter((self._append(key, name, definition)
+                                       for key, name, definition in terms),
+                                      dtype=np.int64, count=len(terms)))
+        count = len(self._keys)
+        self.stale = self._documents > 2 * max(self._built_documents, 1)
+        k = min(self.max_k, count - 1)
+        others = np.ones(count, dtype=bool)
+        others[added] = False
+        changed = added[added < before]
+        if len(changed):
+            # Rows that listed a changed term hold its old score, and would not
+            # know what replaces it if it dropped out
+            listing = others[:before] & np.isin(self._neighbours[:before], changed).any(axis=1)
+            others[:before] &= ~listing
+            stale = np.nonzero(listing)[0]
+            for start in range(0, len(stale), self.batch_size):
+                rows = stale[start:start + self.batch_size]
+                similarities = self._vectors[rows] @ self._vectors[:count].T
+                similarities[np.arange(len(rows)), rows] = -np.inf
+                self._store(rows, similarities, k)
+        # One product per chunk of added terms gives both their own lists and
+        # the other rows they now belong in
+        step = max(1, self.batch_size ** 2 // count)
+        for start in range(0, len(added), step):
+            columns = added[start:start + step]
+            similarities = self._vectors[:count] @ self._vectors[columns].T
+            similarities[columns, np.arange(len(columns))] = -np.inf
+            self._store(columns, similarities.T, k)
+            if k <= 0:
+                continue
+            beaten = similarities.max(axis=1) > self._scores[:count, k - 1]
+            rows = np.nonzero(others & beaten)[0]
+            if len(rows):
+                self._merge(rows, columns, similarities[rows], k)
+
+    def related(self, key: str, k: int = 5) -> List[str]:
+        """Names of the k indexed terms most similar to key's term, best first."""
+        row = self._rows.get(key)
+        if row is None:
+            return []
+        # Like similar_to, terms with nothing in common are not related
+        return [self._names[neighbour] for neighbour, score
+                in zip(self._neighbours[row, :k], self._scores[row, :k]) if score > 0]
+
+    def similar_to(self, name: str, definition: str, k: int = 5,
+                   exclude: Optional[str] = None) -> List[str]:
+        """Names of the k indexed terms most similar to a term that is not indexed."""
+        count = len(self._keys)
+        if not count:
+            return []
+        similarities = self._vectors[:count] @ self.vector(name, definition)
+        if exclude is not None and exclude in self._rows:
+            similarities[self._rows[exclude]] = -np.inf
+        k = min(k, count)
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [self._names[row] for row in top if similarities[row] > 0]
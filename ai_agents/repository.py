@@ -0,0 +1,582 @@
+# repository.py
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
+
+from .keys import AliasTable, canonical_key
+from .term_store import TermIndex, TermStore
+
+# (term, definition, category) rows accepted by add_many
+TermRow = Tuple[str, str, str]
+
+
+class MemoryRepository:
+    """Keeps the glossary in process memory (lost on restart)."""
+
+    def __init__(self):
+        self.store = TermStore()
+        # Curated terms and the subset a user has learned share one store
+        self.terms = TermIndex(self.store)
+        self.learned = TermIndex(self.store)
+        self.aliases = AliasTable()
+        # Empty until seeded; see DefinitionAgent
+        self.created = True
+        # Only one process uses this repository, so there is nothing to coordinate
+        self.flight = None
+        # Background jobs are not persisted without a database
+        self.jobs = None
+
+    def after_fork(self):
+        pass
+
+    def add_many(self, rows: Iterable[TermRow], examples: Iterable[Tuple[str, str]] = ()) -> int:
+        """Add curated terms in bulk, replacing existing keys. Returns the row count.
+
+        examples are (key, example) pairs attached once the terms are added.
+        """
+        count = 0
+        for term, definition, category in rows:
+            self.terms.add(canonical_key(term), term, definition, category)
+            count += 1
+        self.add_examples(examples)
+        return count
+
+    def add_examples(self, rows: Iterable[Tuple[str, str]]) -> int:
+        """Attach (key, example) pairs to existing terms. Returns the row count."""
+        count = 0
+        for key, example in rows:
+            self.terms[key].add_example(example)
+            count += 1
+        return count
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Stream every curated term as a to_dict() record."""
+        for term in self.terms.values():
+            yield term.to_dict()
+
+    def close(self):
+        pass
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS glossary_term (
+    key TEXT PRIMARY KEY,
+    term TEXT NOT NULL,
+    definition TEXT NOT NULL,
+    category TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    learned INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS glossary_term_category
+    ON glossary_term (category, key, term);
+CREATE INDEX IF NOT EXISTS glossary_term_learned
+    ON glossary_term (key, term) WHERE learned = 1;
+CREATE TABLE IF NOT EXISTS glossary_example (
+    id INTEGER PRIMARY KEY,
+    term_key TEXT NOT NULL REFERENCES glossary_term (key) ON DELETE CASCADE,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS glossary_example_term
+    ON glossary_example (term_key, id, text);
+CREATE UNIQUE INDEX IF NOT EXISTS glossary_example_text
+    ON glossary_example (term_key, text);
+CREATE TABLE IF NOT EXISTS glossary_alias (
+    alias TEXT PRIMARY KEY,
+    key TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS generation_lease (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS generation_result (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS generation_job (
+    key TEXT PRIMARY KEY,
+    term TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    failed INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteRepository:
+    """Keeps the glossary in a SQLite database shared by all workers.
+
+    The database runs in WAL mode so readers never block the writer, and
+    each thread gets its own connection. Lookups are single primary-key
+    probes with fixed SQL text, so sqlite3's statement cache reuses the
+    prepared statements. The covering indexes on category and on learned
+    terms serve listings without touching definition text. The tables use
+    Django's naming for the glossary app, so glossary.models can read them.
+    """
+
+    def __init__(self, path: str, mmap_size: int = 256 * 1024 * 1024):
+        self.path = path
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+        # Whether this call creates the glossary, so DefinitionAgent seeds it once only
+        self.created = self.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'glossary_term'"
+        ).fetchone() is None
+        if not self.created and self.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'glossary_example_text'"
+        ).fetchone() is None:
+            # Older databases may repeat an example; keep the first before indexing
+            self.execute("DELETE FROM glossary_example WHERE id NOT IN "
+                         "(SELECT MIN(id) FROM glossary_example GROUP BY term_key, text)")
+        self._connection().executescript(SCHEMA)
+        self.terms = SQLiteTermIndex(self)
+        self.learned = SQLiteTermIndex(self, learned=True)
+        self.aliases = SQLiteAliasTable(self)
+        self.flight = SQLiteFlight(self)
+        self.jobs = SQLiteJobTable(self)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, cached_statements=256,
+                                         isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            self._local.connection = connection
+        return connection
+
+    def after_fork(self):
+        """Drop connections inherited from the parent process; SQLite must not share them."""
+        self._local = threading.local()
+
+    def execute(self, sql: str, parameters: Tuple = ()) -> sqlite3.Cursor:
+        return self._connection().execute(sql, parameters)
+
+    def add_many(self, rows: Iterable[TermRow], examples: Iterable[Tuple[str, str]] = ()) -> int:
+        """Add curated terms in bulk inside one transaction. Returns the row count.
+
+        examples are (key, example) pairs attached in the same transaction,
+        so terms are never committed without them.
+        """
+        now = int(datetime.now().timestamp())
+        count = 0
+
+        def records():
+            nonlocal count
+            for term, definition, category in rows:
+                count += 1
+                yield canonical_key(term), term, definition, category, now
+
+        connection = self._connection()
+        with transaction(connection):
+            connection.executemany(
+                "INSERT INTO glossary_term (key, term, definition, category, created_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "term = excluded.term, definition = excluded.definition, "
+                "category = excluded.category",
+                records()
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO glossary_example (term_key, text) VALUES (?, ?)", examples
+            )
+        return count
+
+    def add_examples(self, rows: Iterable[Tuple[str, str]]) -> int:
+        """Attach (key, example) pairs to existing terms in one transaction."""
+        count = 0
+
+        def records():
+            nonlocal count
+            for record in rows:
+                count += 1
+                yield record
+
+        connection = self._connection()
+        with transaction(connection):
+            connection.executemany(
+                "INSERT OR IGNORE INTO glossary_example (term_key, text) VALUES (?, ?)", records()
+            )
+        return count
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Stream every curated term as a to_dict() record, in key order.
+
+        Terms and examples are read through two cursors ordered by key and
+        merged, so memory use does not grow with the glossary.
+        """
+        connection = self._connection()
+        terms = connection.execute(
+            "SELECT key, term, definition, category, created_at FROM glossary_term ORDER BY key"
+        )
+        examples = connection.execute(
+            "SELECT term_key, text FROM glossary_example ORDER BY term_key, id"
+        )
+        pending = next(examples, None)
+        for key, term, definition, category, created_at in terms:
+            collected = []
+            while pending is not None and pending[0] <= key:
+                if pending[0] == key:
+                    collected.append(pending[1])
+                pending = next(examples, None)
+            yield {
+                "term": term,
+                "definition": definition,
+                "category": category,
+                "examples": collected,
+                "created_at": datetime.fromtimestamp(created_at).isoformat()
+            }
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class SQLiteFlight:
+    """Cross-process single flight for generation, through tables in the database.
+
+    A process that wants to generate the value for a key first takes a lease
+    row in generation_lease. The lease holder runs the generation and stores
+    the value in generation_result. Other processes poll until the lease is
+    gone, then read the stored value. A lease expires after lease seconds,
+    so a crashed holder only delays the others. Stored values are reused for
+    result_ttl seconds, so processes that arrive just after a generation
+    also share it.
+    """
+
+    def __init__(self, repository: SQLiteRepository, lease: float = 30.0,
+                 poll_interval: float = 0.02, result_ttl: float = 60.0):
+        self.repository = repository
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.result_ttl = result_ttl
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self.generated = 0
+        self.shared = 0
+
+    def _result(self, key: str) -> Optional[str]:
+        row = self.repository.execute(
+            "SELECT value FROM generation_result WHERE key = ? AND created_at > ?",
+            (key, time.time() - self.result_ttl)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _acquire(self, key: str) -> bool:
+        now = time.time()
+        cursor = self.repository.execute(
+            "INSERT INTO generation_lease (key, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET owner = excluded.owner, "
+            "expires_at = excluded.expires_at WHERE generation_lease.expires_at <= ?",
+            (key, self.owner, now + self.lease, now)
+        )
+        return cursor.rowcount == 1
+
+    def _release(self, key: str):
+        self.repository.execute(
+            "DELETE FROM generation_lease WHERE key = ? AND owner = ?", (key, self.owner)
+        )
+
+    def do(self, key: str, fn: Callable[[], str]) -> str:
+        """Value for key, generated by fn in at most one process at a time."""
+        while True:
+            value = self._result(key)
+            if value is not None:
+                self.shared += 1
+                return value
+            if self._acquire(key):
+                break
+            time.sleep(self.poll_interval)
+        try:
+            value = fn()
+            self.generated += 1
+            connection = self.repository._connection()
+            with transaction(connection):
+                connection.execute(
+                    "INSERT OR REPLACE INTO generation_result (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+                # Keep the table to recent values
+                connection.execute("DELETE FROM generation_result WHERE created_at <= ?",
+                                   (time.time() - self.result_ttl,))
+            return value
+        finally:
+            self._release(key)
+
+
+class SQLiteJobTable:
+    """Background generation jobs recorded in generation_job, for jobs.JobQueue.
+
+    Rows are written when a job is queued or retried and deleted when it
+    succeeds; jobs that ran out of attempts stay behind flagged as failed.
+    """
+
+    def __init__(self, repository: SQLiteRepository):
+        self.repository = repository
+
+    def pending(self) -> List[Tuple[str, str, int, int, float]]:
+        """(key, term, priority, attempts, next_attempt_at) of unfinished jobs."""
+        return self.repository.execute(
+            "SELECT key, term, priority, attempts, next_attempt_at FROM generation_job "
+            "WHERE failed = 0 ORDER BY priority, next_attempt_at"
+        ).fetchall()
+
+    def save(self, key: str, term: str, priority: int, attempts: int,
+             next_attempt_at: float, error: Optional[str] = None):
+        self.repository.execute(
+            "INSERT OR REPLACE INTO generation_job "
+            "(key, term, priority, attempts, next_attempt_at, last_error, failed) "
+            "VALUES (?, ?, ?, ?, ?, ?, 0)",
+            (key, term, priority, attempts, next_attempt_at, error)
+        )
+
+    def delete(self, key: str):
+        self.repository.execute("DELETE FROM generation_job WHERE key = ?", (key,))
+
+    def fail(self, key: str, error: str):
+        self.repository.execute(
+            "UPDATE generation_job SET failed = 1, attempts = attempts + 1, last_error = ? "
+            "WHERE key = ?", (error, key)
+        )
+
+    def failed(self) -> List[Tuple[str, str, int, str]]:
+        """(key, term, attempts, last_error) of jobs that ran out of attempts."""
+        return self.repository.execute(
+            "SELECT key, term, attempts, last_error FROM generation_job WHERE failed = 1 ORDER BY key"
+        ).fetchall()
+
+
+@contextmanager
+def transaction(connection: sqlite3.Connection):
+    """BEGIN IMMEDIATE ... COMMIT on an autocommit-mode connection."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+class StoredTerm:
+    """GlossaryTerm-compatible row of the glossary_term table."""
+    __slots__ = ("_repository", "key", "term", "definition", "category", "_created_at")
+
+    def __init__(self, repository: SQLiteRepository, key: str, term: str,
+                 definition: str, category: str, created_at: int):
+        self._repository = repository
+        self.key = key
+        self.term = term
+        self.definition = definition
+        self.category = category
+        self._created_at = created_at
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self._created_at)
+
+    @property
+    def examples(self) -> Tuple[str, ...]:
+        # Read-only, like TermView.examples: examples change only through add_example
+        rows = self._repository.execute(
+            "SELECT text FROM glossary_example WHERE term_key = ? ORDER BY id", (self.key,)
+        )
+        return tuple(text for text, in rows)
+
+    def add_example(self, example: str):
+        """Add a business-related example to the term."""
+        self._repository.execute(
+            "INSERT OR IGNORE INTO glossary_example (term_key, text) VALUES (?, ?)", (self.key, example)
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert term to dictionary for storage or display."""
+        return {
+            "term": self.term,
+            "definition": self.definition,
+            "category": self.category,
+            "examples": list(self.examples),
+            "created_at": self.created_at.isoformat()
+        }
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, StoredTerm) and other._repository is self._repository
+                and other.key == self.key)
+
+    def __hash__(self) -> int:
+        return hash((id(self._repository), self.key))
+
+    def __repr__(self) -> str:
+        return f"StoredTerm({self.term!r})"
+
+
+class SQLiteTermIndex(MutableMapping):
+    """TermIndex-compatible mapping over glossary_term.
+
+    With learned=True only rows flagged as learned are visible, and
+    assigning a stored term flags it instead of inserting a copy.
+    """
+
+    def __init__(self, repository: SQLiteRepository, learned: bool = False):
+        self.repository = repository
+        self.learned = learned
+        self._filter = " AND learned = 1" if learned else ""
+
+    def _row(self, key: str) -> Optional[StoredTerm]:
+        row = self.repository.execute(
+            "SELECT term, definition, category, created_at FROM glossary_term "
+            "WHERE key = ?" + self._filter, (key,)
+        ).fetchone()
+        return None if row is None else StoredTerm(self.repository, key, *row)
+
+    def add(self, key: str, term: str, definition: str,
+            category: str = "General AI") -> StoredTerm:
+        """Store a term under key, redefining it if key exists, and return it."""
+        created_at = int(datetime.now().timestamp())
+        self.repository.execute(
+            "INSERT INTO glossary_term (key, term, definition, category, created_at, learned) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+            "term = excluded.term, definition = excluded.definition, "
+            "category = excluded.category, learned = MAX(learned, excluded.learned)",
+            (key, term, definition, category, created_at, int(self.learned))
+        )
+        return StoredTerm(self.repository, key, term, definition, category, created_at)
+
+    def __getitem__(self, key: str) -> StoredTerm:
+        stored = self._row(key)
+        if stored is None:
+            raise KeyError(key)
+        return stored
+
+    def get(self, key: str, default=None):
+        stored = self._row(key)
+        return default if stored is None else stored
+
+    def __setitem__(self, key: str, value):
+        if (self.learned and isinstance(value, StoredTerm)
+                and value._repository is self.repository and value.key == key):
+            self.repository.execute("UPDATE glossary_term SET learned = 1 WHERE key = ?", (key,))
+            return
+        with transaction(self.repository._connection()):
+            stored = self.add(key, value.term, value.definition, value.category)
+            for example in value.examples:
+                stored.add_example(example)
+
+    def claim(self, key: str, value) -> bool:
+        """Bind key to value unless it is already bound; True if this call bound it.
+
+        Each check and write is a single statement inside one transaction,
+        so of several processes claiming the same key exactly one succeeds.
+        A learned index claims an existing row by flagging it.
+        """
+        stored = (isinstance(value, StoredTerm) and value._repository is self.repository
+                  and value.key == key)
+        with transaction(self.repository._connection()) as connection:
+            claimed = False
+            if not stored:
+                cursor = connection.execute(
+                    "INSERT INTO glossary_term (key, term, definition, category, created_at, learned) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO NOTHING",
+                    (key, value.term, value.definition, value.category,
+                     int(datetime.now().timestamp()), int(self.learned))
+                )
+                claimed = cursor.rowcount == 1
+                if claimed:
+                    connection.executemany(
+                        "INSERT OR IGNORE INTO glossary_example (term_key, text) VALUES (?, ?)",
+                        ((key, example) for example in value.examples)
+                    )
+            if self.learned and not claimed:
+                cursor = connection.execute(
+                    "UPDATE glossary_term SET learned = 1 WHERE key = ? AND learned = 0", (key,)
+                )
+                claimed = cursor.rowcount == 1
+        return claimed
+
+    def __delitem__(self, key: str):
+        if self.learned:
+            cursor = self.repository.execute(
+                "UPDATE glossary_term SET learned = 0 WHERE key = ? AND learned = 1", (key,)
+            )
+        else:
+            cursor = self.repository.execute("DELETE FROM glossary_term WHERE key = ?", (key,))
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return self.repository.execute(
+            "SELECT 1 FROM glossary_term WHERE key = ?" + self._filter, (key,)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self.repository.execute(
+            "SELECT key FROM glossary_term WHERE 1" + self._filter + " ORDER BY key"
+        ).fetchall()
+        return (key for key, in rows)
+
+    def values(self) -> List[StoredTerm]:
+        rows = self.repository.execute(
+            "SELECT key, term, definition, category, created_at FROM glossary_term "
+            "WHERE 1" + self._filter + " ORDER BY key"
+        ).fetchall()
+        return [StoredTerm(self.repository, *row) for row in rows]
+
+    def items(self) -> List[Tuple[str, StoredTerm]]:
+        return [(term.key, term) for term in self.values()]
+
+    def __len__(self) -> int:
+        return self.repository.execute(
+            "SELECT COUNT(*) FROM glossary_term WHERE 1" + self._filter
+        ).fetchone()[0]
+
+
+class SQLiteAliasTable(AliasTable):
+    """AliasTable persisted in glossary_alias."""
+
+    def __init__(self, repository: SQLiteRepository):
+        self.repository = repository
+
+    def add(self, alias: str, term: str):
+        alias_key, target = canonical_key(alias), self.resolve(canonical_key(term))
+        if alias_key == target:
+            return
+        with transaction(self.repository._connection()) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO glossary_alias (alias, key) VALUES (?, ?)", (alias_key, target)
+            )
+            # Re-point aliases that targeted the new alias so chains stay one hop
+            connection.execute("UPDATE glossary_alias SET key = ? WHERE key = ?", (target, alias_key))
+
+    def get(self, key: str) -> Optional[str]:
+        row = self.repository.execute(
+            "SELECT key FROM glossary_alias WHERE alias = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def resolve(self, key: str) -> str:
+        return self.get(key) or key
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self.repository.execute("SELECT alias FROM glossary_alias ORDER BY alias").fetchall()
+        return (alias for alias, in rows)
+
+    def __len__(self) -> int:
+        return self.repository.execute("SELECT COUNT(*) FROM glossary_alias").fetchone()[0]
+
+
+def open_repository(path: Optional[str] = None):
+    """SQLiteRepository for path, or a MemoryRepository when path is empty."""
+    return SQLiteRepository(path) if path else MemoryRepository()
@@ -0,0 +1,199 @@
+# search.py
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from .keys import canonical_key
+
+
+def trigrams(key: str) -> List[str]:
+    """Distinct character trigrams of a canonical key, padded at both ends."""
+    padded = f"  {key} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance using Hyyro's bit-parallel variant of Myers' algorithm."""
+    if not a:
+        return len(b)
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    pv, mv, score = mask, 0, len(a)
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    return score
+
+
+class SearchIndex:
+    """Prefix autocomplete and typo-tolerant lookup over glossary term names.
+
+    Prefix queries bisect a sorted array of canonical keys. Fuzzy queries use a
+    trigram inverted index: a single edit destroys at most three trigrams of
+    a key, so any key within max_distance edits shares at least one of the
+    query's 3 * max_distance + 1 rarest trigrams. Candidates come from those
+    posting lists, are filtered by how many query trigrams they share, and
+    are verified with a bit-parallel edit distance.
+
+    Mistyped prefixes ("machne" while typing "machine learning") are found
+    by bisecting for every single-edit variant of the query instead, which
+    costs a few hundred prefix lookups whatever the number of terms.
+    """
+
+    # Posting lists longer than this are not scanned when counting shared trigrams
+    max_scan = 4096
+    # Shorter queries are one edit away from too many terms to be worth suggesting
+    min_fuzzy_length = 4
+
+    def __init__(self, terms: Iterable[str] = ()):
+        self._names: List[str] = []
+        self._keys: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._sorted: List[str] = []
+        self._postings: Dict[str, array] = {}
+        # Every character of an indexed key, for the variants fuzzy_prefix tries
+        self._alphabet: Set[str] = set()
+        for term in terms:
+            self._insert(term)
+        self._sorted.sort()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, term: str) -> bool:
+        return canonical_key(term) in self._ids
+
+    def _insert(self, term: str) -> Optional[str]:
+        key = canonical_key(term)
+        if not key or key in self._ids:
+            return None
+        term_id = len(self._names)
+        self._names.append(term)
+        self._keys.append(key)
+        self._ids[key] = term_id
+        for gram in trigrams(key):
+            postings = self._postings.get(gram)
+            if postings is None:
+                postings = self._postings[gram] = array("i")
+                self._alphabet.update(gram)
+            postings.append(term_id)
+        self._sorted.append(key)
+        return key
+
+    def add(self, term: str):
+        """Index a new term name, keeping the prefix array sorted."""
+        key = self._insert(term)
+        if key is not None:
+            # _insert appended the key; move it into sorted position
+            self._sorted.pop()
+            insort(self._sorted, key)
+
+    def _starting_with(self, key: str, limit: int) -> List[str]:
+        """Up to limit keys starting with key, in alphabetical order."""
+        results = []
+        position = bisect_left(self._sorted, key)
+        while position < len(self._sorted) and len(results) < limit:
+            candidate = self._sorted[position]
+            if not candidate.startswith(key):
+                break
+            results.append(candidate)
+            position += 1
+        return results
+
+    def prefix(self, query: str, limit: int = 10) -> List[str]:
+        """Term names starting with query, in alphabetical order."""
+        return [self._names[self._ids[key]]
+                for key in self._starting_with(canonical_key(query), limit)]
+
+    def fuzzy_prefix(self, query: str, limit: int = 10) -> List[str]:
+        """Term names starting with a single edit of query, in alphabetical order.
+
+        An edit is a deleted, substituted or inserted character, or two
+        adjacent characters swapped.
+        """
+        key = canonical_key(query)
+        if not key:
+            return []
+        alphabet = self._alphabet
+        variants = set()
+        for position in range(len(key)):
+            head, rest = key[:position], key[position + 1:]
+            variants.add(head + rest)
+            variants.update(head + char + rest for char in alphabet)
+            variants.update(head + char + key[position:] for char in alphabet)
+            if rest:
+                variants.add(head + rest[0] + key[position] + rest[1:])
+        # Longer variants than key itself only find terms that start with key
+        variants.discard(key)
+        variants.discard("")
+        matches = set()
+        for variant in variants:
+            matches.update(self._starting_with(variant, limit))
+        return [self._names[self._ids[match]] for match in sorted(matches)[:limit]]
+
+    def fuzzy(self, query: str, limit: int = 10,
+              max_distance: Optional[int] = None) -> List[str]:
+        """Term names within max_distance edits of query, closest first."""
+        key = canonical_key(query)
+        if not key:
+            return []
+        if max_distance is None:
+            max_distance = 0 if len(key) < 3 else 1 if len(key) <= 6 else 2
+        grams = [gram for gram in trigrams(key) if gram in self._postings]
+        grams.sort(key=lambda gram: len(self._postings[gram]))
+        seeds = 3 * max_distance + 1
+        # A match shares all but 3 * max_distance of the query's trigrams.
+        # Count shared trigrams over every posting list that is cheap to
+        # scan, lowering the bar by one for each list that is skipped.
+        counts = Counter()
+        required = len(trigrams(key)) - 3 * max_distance
+        for position, gram in enumerate(grams):
+            postings = self._postings[gram]
+            if position < seeds or len(postings) <= self.max_scan:
+                counts.update(postings)
+            else:
+                required -= 1
+        candidates = [term_id for term_id in set().union(*map(self._postings.get, grams[:seeds]))
+                      if counts[term_id] >= required]
+        scored = []
+        for term_id in candidates:
+            candidate = self._keys[term_id]
+            if abs(len(candidate) - len(key)) > max_distance:
+                continue
+            distance = levenshtein(key, candidate)
+            if distance <= max_distance:
+                scored.append((distance, candidate, term_id))
+        scored.sort()
+        return [self._names[term_id] for _, _, term_id in scored[:limit]]
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """Prefix matches, or if there are none, typo-tolerant matches.
+
+        Queries that start some term cost a single bisection. Others of at
+        least min_fuzzy_length characters are matched as mistyped prefixes,
+        and those long enough to allow two edits (see fuzzy) also as whole
+        mistyped terms.
+        """
+        results = self.prefix(query, limit)
+        key = canonical_key(query)
+        if results or len(key) < self.min_fuzzy_length:
+            return results
+        results = self.fuzzy_prefix(key, limit)
+        if not results and len(key) > 6:
+            results = self.fuzzy(key, limit)
+        return results
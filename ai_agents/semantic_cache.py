@@ -0,0 +1,150 @@
+# semantic_cache.py
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def _singular(word: str) -> str:
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def embed(key: str, dim: int = 512) -> np.ndarray:
+    """Unit-length hashed bag of words and character trigrams of a canonical key.
+
+    Punctuation is treated as a space, a plural "s" is dropped and words
+    are counted regardless of order, so "machine-learning" and "learning
+    machines" embed exactly like "machine learning", while misspellings
+    still share most trigrams. Each feature is hashed to one of dim signed
+    buckets.
+    """
+    words = [_singular(word) for word in _SEPARATORS.sub(" ", key).split()]
+    features: List[str] = [f"w:{word}" for word in words]
+    for word in words:
+        padded = f" {word} "
+        features.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature in features:
+        digest = zlib.crc32(feature.encode("utf-8"))
+        vector[digest % dim] += 1.0 if digest & 0x80000000 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """Bounded cache that also answers lookups for keys similar to a stored one.
+
+    Keys are embedded with embed() into rows of one preallocated matrix, so
+    a lookup is a single matrix-vector product. An exact key match is tried
+    first; otherwise the most similar stored key is a hit when its cosine
+    similarity reaches threshold. The least recently used entry is evicted
+    once max_size is reached.
+    """
+
+    def __init__(self, max_size: int = 10_000, threshold: float = 0.95, dim: int = 512):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.threshold = threshold
+        self.dim = dim
+        self._vectors = np.zeros((max_size, dim), dtype=np.float32)
+        # key -> row, in least- to most-recently-used order
+        self._rows: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._keys: List[Optional[Hashable]] = [None] * max_size
+        self._values: List[Any] = [None] * max_size
+        self._free = list(range(max_size - 1, -1, -1))
+        # Rows at or above this index have never been used
+        self._high_water = 0
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._rows.get(key)
+            if row is not None:
+                self.exact_hits += 1
+                self._rows.move_to_end(key)
+                return self._values[row]
+        vector = embed(key, self.dim)
+        with self._lock:
+            if self._rows:
+                similarities = self._vectors[:self._high_water] @ vector
+                row = int(np.argmax(similarities))
+                if similarities[row] >= self.threshold:
+                    self.similar_hits += 1
+                    self._rows.move_to_end(self._keys[row])
+                    return self._values[row]
+            self.misses += 1
+            return default
+
+    def put(self, key: str, value: Any):
+        vector = embed(key, self.dim)
+        with self._lock:
+            row = self._rows.get(key)
+            if row is not None:
+                self._rows.move_to_end(key)
+            else:
+                if not self._free:
+                    _, victim = self._rows.popitem(last=False)
+                    self._release(victim)
+                    self.evictions += 1
+                row = self._free.pop()
+                self._high_water = max(self._high_water, row + 1)
+                self._rows[key] = row
+                self._keys[row] = key
+            self._vectors[row] = vector
+            self._values[row] = value
+
+    def _release(self, row: int):
+        # A zero row has similarity 0 with every query, so it never matches
+        self._vectors[row] = 0.0
+        self._keys[row] = None
+        self._values[row] = None
+        self._free.append(row)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is None:
+                return default
+            value = self._values[row]
+            self._release(row)
+            return value
+
+    def clear(self):
+        with self._lock:
+            for row in self._rows.values():
+                self._release(row)
+            self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def stats(self) -> Dict:
+        """Return hit/miss/eviction counters for monitoring."""
+        with self._lock:
+            hits = self.exact_hits + self.similar_hits
+            lookups = hits + self.misses
+            return {
+                "size": len(self._rows),
+                "max_size": self.max_size,
+                "threshold": self.threshold,
+                "exact_hits": self.exact_hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,119 @@
+# sentiment.py
+"""Lexicon sentiment scoring for outreach messages, one message or millions.
+
+    tool = SentimentAnalysisTool()
+    tool.analyze("Thanks, the demo was great")      # "Positive"
+    tool.score_batch(messages)                      # [1, 0, -2, ...]
+
+The lexicon is compiled once into a dict from word to polarity. Each text
+is lowercased, has its punctuation turned into spaces and is split into
+words a single time, and every word costs one dict lookup, so scoring is
+linear in the text and only whole words match ("good" does not count in
+"goodbye"). score_batch spreads large batches over a process pool whose
+workers compile the lexicon once each.
+"""
+import os
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# The outreach crew's original word lists; pass others to SentimentAnalysisTool
+POSITIVE_WORDS = ("good", "great", "excellent", "happy", "satisfied")
+NEGATIVE_WORDS = ("bad", "poor", "terrible", "unhappy", "dissatisfied")
+
+# Punctuation other than apostrophes separates words ("great!" -> "great")
+_SEPARATORS = str.maketrans({mark: " " for mark in string.punctuation if mark != "'"})
+
+
+def compile_lexicon(positive: Iterable[str] = POSITIVE_WORDS,
+                    negative: Iterable[str] = NEGATIVE_WORDS) -> Dict[str, int]:
+    """Map each lowercased word to +1 or -1; a word in both lists scores 0 and is dropped."""
+    lexicon = {word.lower(): 1 for word in positive}
+    for word in negative:
+        word = word.lower()
+        if lexicon.get(word) == 1:
+            del lexicon[word]
+        elif word not in lexicon:
+            lexicon[word] = -1
+    return lexicon
+
+
+def score_text(text: str, lexicon: Dict[str, int]) -> int:
+    """Positive minus negative word count of text."""
+    return sum(filter(None, map(lexicon.get, text.lower().translate(_SEPARATORS).split())))
+
+
+def label(score: int) -> str:
+    if score > 0:
+        return "Positive"
+    if score < 0:
+        return "Negative"
+    return "Neutral"
+
+
+# Lexicon of a pool worker process, compiled once by _init_worker
+_worker_lexicon: Dict[str, int] = {}
+
+
+def _init_worker(lexicon: Dict[str, int]):
+    global _worker_lexicon
+    _worker_lexicon = lexicon
+
+
+def _score_chunk(texts: Sequence[str]) -> List[int]:
+    lexicon = _worker_lexicon
+    return [score_text(text, lexicon) for text in texts]
+
+
+class SentimentAnalysisTool:
+    """Analyzes the sentiment of a given text (positive, negative, neutral).
+
+    Batches of at least chunk_size texts are scored on a pool of worker
+    processes (all CPUs by default), started on first use and kept until
+    close(); smaller batches are scored in the calling process.
+    """
+
+    name = "Sentiment Analysis Tool"
+    description = "Analyzes the sentiment of a given text (positive, negative, neutral)."
+
+    def __init__(self, positive: Iterable[str] = POSITIVE_WORDS,
+                 negative: Iterable[str] = NEGATIVE_WORDS, workers: Optional[int] = None,
+                 chunk_size: int = 20_000):
+        self.lexicon = compile_lexicon(positive, negative)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def score(self, text: str) -> int:
+        return score_text(text, self.lexicon)
+
+    def analyze(self, text: str) -> str:
+        """"Positive", "Negative" or "Neutral"."""
+        return label(score_text(text, self.lexicon))
+
+    # Name of the method agent frameworks call on their tools
+    _run = analyze
+
+    def score_batch(self, texts: Iterable[str]) -> List[int]:
+        """Scores of texts, in order."""
+        texts = texts if isinstance(texts, (list, tuple)) else list(texts)
+        if self.workers == 1 or len(texts) < self.chunk_size:
+            lexicon = self.lexicon
+            return [score_text(text, lexicon) for text in texts]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                                 initargs=(self.lexicon,))
+        chunks = (texts[start:start + self.chunk_size]
+                  for start in range(0, len(texts), self.chunk_size))
+        scores: List[int] = []
+        for chunk_scores in self._executor.map(_score_chunk, chunks):
+            scores.extend(chunk_scores)
+        return scores
+
+    def analyze_batch(self, texts: Iterable[str]) -> List[str]:
+        return [label(score) for score in self.score_batch(texts)]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
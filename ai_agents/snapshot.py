@@ -0,0 +1,520 @@
+# snapshot.py
+"""Binary snapshots of an in-memory glossary and its indexes.
+
+Usage:
+
+    python -m ai_agents.snapshot glossary.snap --warm --import vendor_terms.jsonl
+    python -m ai_agents.snapshot glossary.snap
+
+The first form builds a glossary (optionally importing a JSONL or CSV
+file), precomputes its indexes and writes the snapshot; the second
+describes an existing one.
+
+A snapshot file is an 8-byte magic, the format version and the header
+length as little-endian uint32s, a JSON header, then 64-byte aligned
+sections, each a flat numpy array. load_snapshot maps the file
+copy-on-write, so columns and matrices are used in place and a process
+only copies the pages it changes. Lists of strings are stored as one
+UTF-8 text plus the end offset (in characters) of each string.
+"""
+import argparse
+import atexit
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import weakref
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes at exit are not coordinated across processes
+    fcntl = None
+
+import numpy as np
+
+from .models import GlossaryAgent
+from .related import RelatedTerms
+from .repository import MemoryRepository
+from .search import SearchIndex
+from .term_store import StringColumn, TermIndex, TermStore
+
+MAGIC = b"GLOSSNAP"
+VERSION = 2
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+
+class SnapshotError(ValueError):
+    """Raised for a file that is not a snapshot this version can read."""
+
+
+class _Writer:
+    def __init__(self):
+        self.sections: Dict[str, np.ndarray] = {}
+
+    def array(self, name: str, values):
+        self.sections[name] = np.ascontiguousarray(values)
+
+    def typed(self, name: str, values: array):
+        self.array(name, np.frombuffer(values, dtype=values.typecode))
+
+    def strings(self, name: str, values: List[str]):
+        self.array(f"{name}.text", np.frombuffer("".join(values).encode("utf-8"), dtype=np.uint8))
+        self.array(f"{name}.ends", np.cumsum([len(value) for value in values], dtype=np.int64))
+
+    def column(self, name: str, column: StringColumn):
+        data, offsets = column.buffers()
+        self.array(f"{name}.data", np.frombuffer(data, dtype=np.uint8))
+        self.typed(f"{name}.offsets", offsets)
+
+    def write(self, path: str, meta: Dict[str, Any]) -> int:
+        layout = {}
+        position = 0
+        for name, values in self.sections.items():
+            layout[name] = {"dtype": values.dtype.str, "shape": list(values.shape), "offset": position}
+            position += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+        header = json.dumps({"meta": meta, "sections": layout}).encode("utf-8")
+        start = -(-(_PREAMBLE.size + len(header)) // _ALIGNMENT) * _ALIGNMENT
+        # Written beside the target and renamed over it, so readers (and other
+        # processes writing at the same time) never see a partial file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as stream:
+            stream.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+            stream.write(header)
+            for name, values in self.sections.items():
+                stream.seek(start + layout[name]["offset"])
+                stream.write(values.data)
+            stream.truncate(start + position)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary, path)
+        return start + position
+
+
+class _Reader:
+    def __init__(self, path: str):
+        with open(path, "rb") as stream:
+            preamble = stream.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise SnapshotError(f"{path} is not a glossary snapshot")
+            magic, version, header_length = _PREAMBLE.unpack(preamble)
+            if magic != MAGIC:
+                raise SnapshotError(f"{path} is not a glossary snapshot")
+            if version != VERSION:
+                raise SnapshotError(f"{path} is snapshot format {version}; expected {VERSION}")
+            header = json.loads(stream.read(header_length))
+            # Private copy-on-write mapping: writes stay in this process
+            self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_COPY)
+            self.identity = _identity(os.fstat(stream.fileno()))
+        self.meta = header["meta"]
+        self._sections = header["sections"]
+        self._start = -(-(_PREAMBLE.size + header_length) // _ALIGNMENT) * _ALIGNMENT
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sections
+
+    def array(self, name: str) -> np.ndarray:
+        section = self._sections[name]
+        dtype = np.dtype(section["dtype"])
+        count = int(np.prod(section["shape"]))
+        values = np.frombuffer(self._map, dtype, count, self._start + section["offset"])
+        return values.reshape(section["shape"])
+
+    def typed(self, name: str, typecode: str) -> array:
+        values = array(typecode)
+        values.frombytes(self.array(name).data.cast("B"))
+        return values
+
+    def strings(self, name: str) -> List[str]:
+        text = str(self.array(f"{name}.text").data, "utf-8")
+        ends = self.array(f"{name}.ends").tolist()
+        return [text[start:end] for start, end in zip([0] + ends, ends)]
+
+    def column(self, name: str) -> StringColumn:
+        return StringColumn(self.array(f"{name}.data").data, self.typed(f"{name}.offsets", "Q"))
+
+
+def _write_index(writer: _Writer, name: str, index: TermIndex):
+    writer.strings(f"{name}.keys", list(index._ids))
+    writer.array(f"{name}.ids", np.fromiter(index._ids.values(), dtype=np.int32, count=len(index)))
+
+
+def _read_index(reader: _Reader, name: str, store: TermStore) -> TermIndex:
+    index = TermIndex(store)
+    keys = [sys.intern(key) for key in reader.strings(f"{name}.keys")]
+    index._ids = dict(zip(keys, reader.array(f"{name}.ids").tolist()))
+    return index
+
+
+def write_snapshot(agent: GlossaryAgent, path: str) -> int:
+    """Write agent's glossary, aliases and built indexes to path. Returns the file size.
+
+    Only in-memory repositories are snapshotted; a database is persistent
+    already. Indexes that were never built are left out and rebuilt on
+    first use after loading.
+    """
+    repository = agent.definition_agent.repository
+    if not isinstance(repository, MemoryRepository):
+        raise TypeError("Only a MemoryRepository glossary can be snapshotted")
+    writer = _Writer()
+    meta: Dict[str, Any] = {"created": time.time()}
+    with agent.lock.read():
+        store = repository.store
+        writer.strings("store.terms", store._terms)
+        writer.column("store.definitions", store._definitions)
+        writer.typed("store.definition_ids", store._definition_ids)
+        writer.typed("store.category_codes", store._category_codes)
+        meta["categories"] = store._categories
+        writer.typed("store.created_at", store._created_at)
+        writer.typed("store.first_example", store._first_example)
+        writer.typed("store.last_example", store._last_example)
+        writer.column("store.examples", store._examples)
+        writer.typed("store.next_example", store._next_example)
+        _write_index(writer, "terms", repository.terms)
+        _write_index(writer, "learned", repository.learned)
+        targets = repository.aliases._targets
+        writer.strings("aliases.keys", list(targets))
+        writer.strings("aliases.targets", list(targets.values()))
+
+        related = agent._related_terms
+        if related is not None:
+            count = len(related)
+            meta["related"] = {"dim": related.dim, "max_k": related.max_k,
+                               "documents": related._documents}
+            writer.strings("related.keys", related._keys)
+            writer.strings("related.names", related._names)
+            writer.array("related.vectors", related._vectors[:count])
+            writer.array("related.neighbours", related._neighbours[:count])
+            writer.array("related.scores", related._scores[:count])
+            writer.strings("related.words", list(related._document_frequency))
+            writer.array("related.frequencies", np.fromiter(
+                related._document_frequency.values(), dtype=np.int64,
+                count=len(related._document_frequency)))
+
+        search = agent._search_index
+        if search is not None:
+            meta["search"] = True
+            writer.strings("search.names", search._names)
+            writer.strings("search.keys", search._keys)
+            writer.array("search.sorted", np.fromiter(
+                (search._ids[key] for key in search._sorted), dtype=np.int32, count=len(search)))
+            writer.strings("search.grams", list(search._postings))
+            writer.array("search.postings", np.fromiter(
+                (term_id for postings in search._postings.values() for term_id in postings),
+                dtype=np.int32))
+            writer.array("search.posting_ends", np.cumsum(
+                [len(postings) for postings in search._postings.values()], dtype=np.int64))
+        try:
+            return writer.write(path, meta)
+        finally:
+            # Drop the views onto live buffers so the columns can grow again
+            writer.sections.clear()
+
+
+def _identity(status: os.stat_result) -> tuple:
+    return status.st_ino, status.st_mtime_ns, status.st_size
+
+
+def _stat(path: str) -> Optional[tuple]:
+    try:
+        return _identity(os.stat(path))
+    except FileNotFoundError:
+        return None
+
+
+# Agent -> keys of the curated terms it changed since it was loaded or first tracked
+_changes: "weakref.WeakKeyDictionary[GlossaryAgent, Set[str]]" = weakref.WeakKeyDictionary()
+# Agent -> identity of the snapshot file it was loaded from
+_sources: "weakref.WeakKeyDictionary[GlossaryAgent, tuple]" = weakref.WeakKeyDictionary()
+
+# Merged terms past this many are indexed like a bulk load rather than one by one
+MERGE_BULK_SIZE = 1000
+
+
+def _changed_keys(agent: GlossaryAgent) -> Set[str]:
+    keys = _changes.get(agent)
+    if keys is None:
+        keys = _changes[agent] = set()
+        curated = agent.definition_agent
+
+        def record(key: str):
+            # Generated definitions are only cached, and never snapshotted
+            if key in curated.predefined_terms:
+                keys.add(key)
+
+        agent.listeners.append(record)
+        curated.bulk_listeners.append(keys.update)
+        # A forked worker writes only what it changes itself; the parent has the rest
+        agent.fork_listeners.append(keys.clear)
+    return keys
+
+
+def merge_changes(source: GlossaryAgent, target: GlossaryAgent, keys: Iterable[str]) -> int:
+    """Copy the curated terms under keys, their examples and learned flags, from source into target.
+
+    A term's name, definition and category are overwritten; examples
+    target lacks are added to its own. Returns the number of terms copied.
+    """
+    with source.lock.read():
+        terms = source.definition_agent.predefined_terms
+        rows = [(key, terms[key].term, terms[key].definition, terms[key].category,
+                 terms[key].examples, key in source.glossary) for key in keys if key in terms]
+    definitions = target.definition_agent
+    with target.lock.write():
+        learned = False
+        for key, name, definition, category, examples, in_glossary in rows:
+            merged = definitions.predefined_terms.add(key, name, definition, category)
+            existing = set(merged.examples)
+            for example in examples:
+                if example not in existing:
+                    merged.add_example(example)
+            if in_glossary:
+                learned = target.glossary.claim(key, merged) or learned
+        if len(rows) > MERGE_BULK_SIZE:
+            keys = [row[0] for row in rows]
+            for listener in definitions.bulk_listeners:
+                listener(keys)
+            for listener in definitions.reload_listeners:
+                listener()
+        else:
+            for key, *_ in rows:
+                merged = definitions.predefined_terms[key]
+                for listener in definitions.listeners:
+                    listener(key, merged)
+            if learned:
+                # The learned listing is rebuilt on next use
+                target._drop_listing()
+    return len(rows)
+
+
+# Snapshot path -> [agent to write there at exit, whether it changed]
+_exit_snapshots: Dict[str, list] = {}
+
+
+@contextmanager
+def _exclusive(path: str):
+    """Hold an exclusive lock on path's sidecar lock file, where fcntl is available."""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{path}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _write_exit_snapshots():
+    for path, (agent, changed) in _exit_snapshots.items():
+        keys = _changes.get(agent)
+        if not changed and not keys:
+            continue
+        # Held from the check for a newer file to the rename, so processes
+        # exiting together merge into each other's snapshots in turn
+        with _exclusive(path):
+            if keys and _stat(path) not in (None, _sources.get(agent)):
+                # Another process replaced the snapshot since this one loaded it,
+                # so add this one's changes to it rather than overwrite it
+                try:
+                    newer = load_snapshot(path)
+                except SnapshotError:
+                    newer = None
+                if newer is not None:
+                    merge_changes(agent, newer, keys)
+                    if newer._related_terms is not None:
+                        newer.refresh_related_terms(wait=True)
+                    agent = newer
+            write_snapshot(agent, path)
+
+
+def write_at_exit(agent: GlossaryAgent, path: str, changed: bool = False):
+    """Write agent's snapshot to path when the interpreter exits normally.
+
+    The snapshot is only written if agent's glossary changes after this
+    call (or changed is True), so a process that only read from a
+    snapshot never overwrites a newer one. If another process replaced
+    the file since agent loaded it, agent's changes are merged into that
+    snapshot instead; processes exiting together take turns through a lock
+    on path + ".lock". A later call for the same path replaces the agent,
+    so an app factory that runs more than once does not leave stale
+    agents to overwrite it. agent.after_fork() forgets the parent's
+    changes, so each forked worker writes only its own.
+    """
+    if not _exit_snapshots:
+        atexit.register(_write_exit_snapshots)
+    entry = _exit_snapshots[path] = [agent, changed]
+    # Changed terms are tracked by _changed_keys; this catches bulk reloads
+    _changed_keys(agent)
+
+    def mark_changed():
+        entry[1] = True
+
+    def mark_unchanged():
+        entry[1] = False
+
+    agent.reload_listeners.append(mark_changed)
+    agent.fork_listeners.append(mark_unchanged)
+
+
+class SnapshotWatcher:
+    """Notices when a snapshot file has been replaced (e.g. by os.replace).
+
+    changed() stats the file at most once per interval seconds and is True
+    once for each new file, so long-running workers can swap in a newer
+    snapshot between requests.
+    """
+
+    def __init__(self, path: str, interval: float = 5.0):
+        self.path = path
+        self.interval = interval
+        self._identity = _stat(path)
+        self._checked = time.monotonic()
+        self._lock = threading.Lock()
+
+    def changed(self) -> bool:
+        now = time.monotonic()
+        if now - self._checked < self.interval:
+            return False
+        # One thread checks (and then loads); the others carry on meanwhile
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked = now
+            identity = _stat(self.path)
+            if identity is None or identity == self._identity:
+                return False
+            self._identity = identity
+            return True
+        finally:
+            self._lock.release()
+
+
+def swap_in(path: str, current: GlossaryAgent) -> GlossaryAgent:
+    """Load path into a new agent that takes over current's generator, examples and jobs.
+
+    The terms current curated, learned or gave examples since it was
+    loaded are merged into the new agent, which keeps them as its own
+    changes, so they outlive the swap and are written at exit.
+    """
+    agent = load_snapshot(path, generator=current.definition_agent.generator)
+    keys = _changes.get(current)
+    if keys:
+        merge_changes(current, agent, keys)
+    agent.example_agent = current.example_agent
+    agent.max_terms = current.max_terms
+    if current.jobs is not None:
+        agent.jobs = current.jobs
+        agent.jobs.on_done = agent._generated
+        agent._job_arguments = current._job_arguments
+    return agent
+
+
+def load_snapshot(path: str, generator=None) -> GlossaryAgent:
+    """Build a GlossaryAgent from a snapshot written by write_snapshot.
+
+    Raises SnapshotError if path is not a snapshot of this format version.
+    """
+    reader = _Reader(path)
+    store = TermStore()
+    store._terms = [sys.intern(term) for term in reader.strings("store.terms")]
+    store._definitions = reader.column("store.definitions")
+    if "store.definition_ids" in reader:
+        store._definition_ids = reader.typed("store.definition_ids", "I")
+    else:
+        # Written before terms could be redefined in place: one definition per row
+        store._definition_ids = array("I", range(len(store._terms)))
+    store._category_codes = reader.typed("store.category_codes", "I")
+    store._categories = [sys.intern(category) for category in reader.meta["categories"]]
+    store._category_ids = {category: code for code, category in enumerate(store._categories)}
+    store._created_at = reader.typed("store.created_at", "q")
+    store._first_example = reader.typed("store.first_example", "i")
+    store._last_example = reader.typed("store.last_example", "i")
+    store._examples = reader.column("store.examples")
+    store._next_example = reader.typed("store.next_example", "i")
+
+    repository = MemoryRepository()
+    # Seeded when the snapshot's glossary was first built, not again
+    repository.created = False
+    repository.store = store
+    repository.terms = _read_index(reader, "terms", store)
+    repository.learned = _read_index(reader, "learned", store)
+    repository.aliases._targets = dict(zip(reader.strings("aliases.keys"),
+                                           reader.strings("aliases.targets")))
+    agent = GlossaryAgent(repository=repository, generator=generator)
+
+    if "related" in reader.meta:
+        options = reader.meta["related"]
+        related = RelatedTerms(dim=options["dim"], max_k=options["max_k"])
+        related._keys = reader.strings("related.keys")
+        related._names = reader.strings("related.names")
+        related._rows = {key: row for row, key in enumerate(related._keys)}
+        related._vectors = reader.array("related.vectors")
+        related._neighbours = reader.array("related.neighbours")
+        related._scores = reader.array("related.scores")
+        related._document_frequency = dict(zip(reader.strings("related.words"),
+                                               reader.array("related.frequencies").tolist()))
+        related._documents = related._built_documents = options["documents"]
+        agent._related_terms = related
+
+    if "search" in reader.meta:
+        search = SearchIndex()
+        search._names = reader.strings("search.names")
+        search._keys = [sys.intern(key) for key in reader.strings("search.keys")]
+        search._ids = {key: term_id for term_id, key in enumerate(search._keys)}
+        search._sorted = [search._keys[term_id] for term_id in reader.array("search.sorted").tolist()]
+        postings = reader.array("search.postings")
+        ends = reader.array("search.posting_ends").tolist()
+        search._postings = {}
+        for gram, start, end in zip(reader.strings("search.grams"), [0] + ends, ends):
+            search._postings[gram] = array("i")
+            search._postings[gram].frombytes(postings[start:end].data.cast("B"))
+        search._alphabet = set("".join(search._postings))
+        agent._search_index = search
+    _sources[agent] = reader.identity
+    _changed_keys(agent)
+    return agent
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ai_agents.snapshot",
+                                     description="Build or describe a glossary snapshot.")
+    parser.add_argument("path", help="snapshot file")
+    parser.add_argument("--warm", action="store_true",
+                        help="build the glossary and its indexes and write the snapshot")
+    parser.add_argument("--import", dest="source", help="terms to import first (.jsonl or .csv)")
+    parser.add_argument("--format", dest="file_format", choices=["jsonl", "csv"])
+    args = parser.parse_args(argv)
+
+    if not args.warm:
+        if args.source:
+            parser.error("--import needs --warm")
+        reader = _Reader(args.path)
+        print(f"{args.path}: format {VERSION}, {len(reader.strings('store.terms'))} stored terms, "
+              f"{len(reader.strings('learned.keys'))} learned, "
+              f"related index: {'yes' if 'related' in reader.meta else 'no'}, "
+              f"search index: {'yes' if 'search' in reader.meta else 'no'}")
+        return 0
+
+    started = time.perf_counter()
+    agent = GlossaryAgent()
+    if args.source:
+        from .bulk import detect_format, import_terms
+        with open(args.source, newline="", encoding="utf-8") as stream:
+            stats = import_terms(agent.definition_agent, stream,
+                                 args.file_format or detect_format(args.source))
+        print(stats, file=sys.stderr)
+    agent.learn_starter_terms()
+    agent.related_terms
+    agent.search_index
+    size = write_snapshot(agent, args.path)
+    print(f"wrote {args.path} ({size / 2 ** 20:.1f} MiB) in {time.perf_counter() - started:.2f} s",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+# term_store.py
+import sys
+from array import array
+from datetime import datetime
+from typing import Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+
+class StringColumn:
+    """Append-only column of strings packed as UTF-8.
+
+    The column may start out from any bytes-like object, such as a view of
+    a memory-mapped snapshot. That buffer is only ever read: strings
+    appended later are packed into a bytearray of their own, so the pages
+    of a mapping stay shared with every process that maps the same file.
+    """
+
+    def __init__(self, data=None, offsets: Optional[array] = None):
+        self._base = memoryview(b"" if data is None else data)
+        self._offsets = array("Q", [0]) if offsets is None else offsets
+        # Offsets from _split on point into _tail
+        self._split = self._offsets[-1]
+        self._tail = bytearray()
+
+    def append(self, value: str):
+        self._tail += value.encode("utf-8")
+        self._offsets.append(self._split + len(self._tail))
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self._offsets[index], self._offsets[index + 1]
+        if start >= self._split:
+            return str(self._tail[start - self._split:end - self._split], "utf-8")
+        return str(self._base[start:end], "utf-8")
+
+    def buffers(self) -> Tuple[memoryview, array]:
+        """The packed UTF-8 data (up to the last string) and its offsets."""
+        if not self._split:
+            return memoryview(self._tail), self._offsets
+        if not self._tail:
+            return self._base[:self._split], self._offsets
+        return memoryview(b"".join((self._base[:self._split], self._tail))), self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+class TermStore:
+    """Columnar storage for glossary terms.
+
+    A term is a row id into parallel columns rather than an object of its own:
+    term names and categories are interned, categories are kept as small
+    integer codes, timestamps as epoch seconds, and definitions and examples
+    are packed into string columns, with each term's examples chained
+    through offset arrays. A redefined term keeps its row (and so its
+    examples and every index entry pointing at it); its new definition is
+    appended to the column and the row's definition id re-pointed.
+    Examples are read back as tuples; they are only added through
+    add_example.
+    """
+
+    def __init__(self):
+        self._terms: List[str] = []
+        self._definitions = StringColumn()
+        # Row -> index into _definitions
+        self._definition_ids = array("I")
+        self._category_codes = array("I")
+        self._categories: List[str] = []
+        self._category_ids: Dict[str, int] = {}
+        self._created_at = array("q")
+        # First/last offset into the example column per term (-1 if none)
+        self._first_example = array("i")
+        self._last_example = array("i")
+        # Flat example column; _next_example links examples of the same term
+        self._examples = StringColumn()
+        self._next_example = array("i")
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def category_code(self, category: str) -> int:
+        """Return the integer code for a category, registering it if new."""
+        code = self._category_ids.get(category)
+        if code is None:
+            code = len(self._categories)
+            self._categories.append(sys.intern(category))
+            self._category_ids[self._categories[code]] = code
+        return code
+
+    def add(self, term: str, definition: str, category: str = "General AI",
+            created_at: Optional[datetime] = None) -> int:
+        """Append a term and return its row id."""
+        timestamp = int((created_at or datetime.now()).timestamp())
+        self._terms.append(sys.intern(term))
+        self._definition_ids.append(len(self._definitions))
+        self._definitions.append(definition)
+        self._category_codes.append(self.category_code(category))
+        self._created_at.append(timestamp)
+        self._first_example.append(-1)
+        self._last_example.append(-1)
+        return len(self._terms) - 1
+
+    def update(self, term_id: int, term: str, definition: str, category: str):
+        """Redefine a row in place, keeping its examples and creation time."""
+        self._terms[term_id] = sys.intern(term)
+        if definition != self.definition(term_id):
+            self._definition_ids[term_id] = len(self._definitions)
+            self._definitions.append(definition)
+        self._category_codes[term_id] = self.category_code(category)
+
+    def add_term(self, glossary_term) -> int:
+        """Copy a GlossaryTerm-like object (including its examples) into the store."""
+        term_id = self.add(glossary_term.term, glossary_term.definition,
+                           glossary_term.category, glossary_term.created_at)
+        for example in glossary_term.examples:
+            self.add_example(term_id, example)
+        return term_id
+
+    def add_example(self, term_id: int, example: str):
+        """Append an example to a term's example chain."""
+        offset = len(self._examples)
+        self._examples.append(example)
+        self._next_example.append(-1)
+        last = self._last_example[term_id]
+        if last < 0:
+            self._first_example[term_id] = offset
+        else:
+            self._next_example[last] = offset
+        self._last_example[term_id] = offset
+
+    def term(self, term_id: int) -> str:
+        return self._terms[term_id]
+
+    def definition(self, term_id: int) -> str:
+        return self._definitions[self._definition_ids[term_id]]
+
+    def category(self, term_id: int) -> str:
+        return self._categories[self._category_codes[term_id]]
+
+    def created_at(self, term_id: int) -> datetime:
+        return datetime.fromtimestamp(self._created_at[term_id])
+
+    def examples(self, term_id: int) -> Tuple[str, ...]:
+        """Return a term's examples in insertion order."""
+        result = []
+        offset = self._first_example[term_id]
+        while offset >= 0:
+            result.append(self._examples[offset])
+            offset = self._next_example[offset]
+        return tuple(result)
+
+    def view(self, term_id: int) -> "TermView":
+        return TermView(self, term_id)
+
+
+class TermView:
+    """GlossaryTerm-compatible handle onto one row of a TermStore."""
+    __slots__ = ("_store", "_id")
+
+    def __init__(self, store: TermStore, term_id: int):
+        self._store = store
+        self._id = term_id
+
+    @property
+    def term(self) -> str:
+        return self._store.term(self._id)
+
+    @property
+    def definition(self) -> str:
+        return self._store.definition(self._id)
+
+    @property
+    def category(self) -> str:
+        return self._store.category(self._id)
+
+    @property
+    def created_at(self) -> datetime:
+        return self._store.created_at(self._id)
+
+    @property
+    def examples(self) -> Tuple[str, ...]:
+        # Read-only: a view's examples change only through add_example
+        return self._store.examples(self._id)
+
+    def add_example(self, example: str):
+        """Add a business-related example to the term."""
+        self._store.add_example(self._id, example)
+
+    def to_dict(self) -> Dict:
+        """Convert term to dictionary for storage or display."""
+        return {
+            "term": self.term,
+            "definition": self.definition,
+            "category": self.category,
+            "examples": list(self.examples),
+            "created_at": self.created_at.isoformat()
+        }
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, TermView) and other._store is self._store
+                and other._id == self._id)
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._id))
+
+    def __repr__(self) -> str:
+        return f"TermView({self.term!r})"
+
+
+class TermIndex(MutableMapping):
+    """Maps lookup keys to rows of a TermStore, yielding TermView objects.
+
+    Several indexes may share one store, so the same term can be reachable
+    under different keys without being stored twice. Assigning a TermView
+    from the same store only records its row id; any other GlossaryTerm-like
+    value is copied into the store. Adding or assigning a term under a key
+    that is already bound redefines the bound row in place, as the SQLite
+    repository updates its row, so every index sharing the row sees it.
+    """
+
+    def __init__(self, store: TermStore):
+        self.store = store
+        self._ids: Dict[str, int] = {}
+
+    def add(self, key: str, term: str, definition: str,
+            category: str = "General AI") -> TermView:
+        """Store a term under key, redefining it if key is bound, and return its view."""
+        term_id = self._ids.get(key)
+        if term_id is None:
+            term_id = self._ids[sys.intern(key)] = self.store.add(term, definition, category)
+        else:
+            self.store.update(term_id, term, definition, category)
+        return TermView(self.store, term_id)
+
+    def __getitem__(self, key: str) -> TermView:
+        return TermView(self.store, self._ids[key])
+
+    def __setitem__(self, key: str, value):
+        if isinstance(value, TermView) and value._store is self.store:
+            term_id = value._id
+        elif key in self._ids:
+            # Redefined in place; value's new examples are added to the row's own
+            term_id = self._ids[key]
+            self.store.update(term_id, value.term, value.definition, value.category)
+            existing = set(self.store.examples(term_id))
+            for example in value.examples:
+                if example not in existing:
+                    self.store.add_example(term_id, example)
+                    existing.add(example)
+        else:
+            term_id = self.store.add_term(value)
+        self._ids[sys.intern(key)] = term_id
+
+    def claim(self, key: str, value) -> bool:
+        """Bind key to value unless it is already bound; True if this call bound it."""
+        if key in self._ids:
+            return False
+        self[key] = value
+        return True
+
+    def __delitem__(self, key: str):
+        # The row stays in the store; other indexes may still reference it
+        del self._ids[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -5,226 +5,3 @@ from flask import Blueprint
 bp = Blueprint('main', __name__)
 
 # Routes are implemented in views.py; this file can be expanded for complex routing logic if needed
-
-Here's a more practical and production-ready urls.py with proper route organization and error handling:
-
-# urls.py
-from flask import Blueprint, current_app
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
-
-# Create blueprints for different sections of your application
-main_bp = Blueprint('main', __name__)
-api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
-auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
-admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
-
-# Initialize rate limiter
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"]
-)
-
-# Import views after blueprint definition to avoid circular imports
-from .views import main_views, api_views, auth_views, admin_views
-from .error_handlers import handle_404, handle_500, handle_429, handle_403
-
-# Register routes for main blueprint
-main_bp.add_url_rule('/', view_func=main_views.index, methods=['GET'])
-main_bp.add_url_rule('/about', view_func=main_views.about, methods=['GET'])
-main_bp.add_url_rule('/contact', view_func=main_views.contact, methods=['GET', 'POST'])
-
-# Register API routes with rate limiting
-@api_bp.before_request
-@limiter.limit("100/hour")  # Stricter rate limiting for API
-def api_limit():
-    pass
-
-api_bp.add_url_rule('/users', view_func=api_views.users_list, methods=['GET'])
-api_bp.add_url_rule('/users/<int:user_id>', view_func=api_views.user_detail, methods=['GET'])
-api_bp.add_url_rule('/products', view_func=api_views.products_list, methods=['GET'])
-
-# Register authentication routes
-auth_bp.add_url_rule('/login', view_func=auth_views.login, methods=['GET', 'POST'])
-auth_bp.add_url_rule('/logout', view_func=auth_views.logout, methods=['POST'])
-auth_bp.add_url_rule('/register', view_func=auth_views.register, methods=['GET', 'POST'])
-auth_bp.add_url_rule('/reset-password', view_func=auth_views.reset_password, methods=['GET', 'POST'])
-
-# Register admin routes with authentication required
-admin_bp.before_request(auth_views.admin_required)
-admin_bp.add_url_rule('/dashboard', view_func=admin_views.dashboard, methods=['GET'])
-admin_bp.add_url_rule('/users', view_func=admin_views.manage_users, methods=['GET', 'POST'])
-
-def register_error_handlers(app):
-    """Register error handlers for the application."""
-    app.register_error_handler(404, handle_404)
-    app.register_error_handler(500, handle_500)
-    app.register_error_handler(429, handle_429)
-    app.register_error_handler(403, handle_403)
-
-def init_app(app):
-    """Initialize the application with all blueprints and configurations."""
-    # Register blueprints
-    app.register_blueprint(main_bp)
-    app.register_blueprint(api_bp)
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(admin_bp)
-    
-    # Initialize rate limiter
-    limiter.init_app(app)
-    
-    # Register error handlers
-    register_error_handlers(app)
-    
-    # Register URL map processor for trailing slashes
-    @app.before_request
-    def remove_trailing_slash():
-        from flask import redirect, request
-        rpath = request.path 
-        if rpath != '/' and rpath.endswith('/'):
-            return redirect(rpath[:-1])
-
-    # Register request logger
-    @app.after_request
-    def log_request(response):
-        if not current_app.debug:
-            current_app.logger.info(
-                f"Request: {request.method} {request.path} - "
-                f"Status: {response.status_code}"
-            )
-        return response
-
-    return app
-
-Copy
-
-Insert at cursor
-python
-And here are the corresponding view files that would work with this URL configuration:
-
-# views/main_views.py
-from flask import render_template, request, current_app
-from werkzeug.exceptions import NotFound
-
-def index():
-    """Home page view."""
-    return render_template('main/index.html')
-
-def about():
-    """About page view."""
-    return render_template('main/about.html')
-
-def contact():
-    """Contact page view with form handling."""
-    if request.method == 'POST':
-        # Handle form submission
-        pass
-    return render_template('main/contact.html')
-
-# views/api_views.py
-from flask import jsonify
-from werkzeug.exceptions import NotFound
-
-def users_list():
-    """API endpoint to list users."""
-    # Implementation here
-    return jsonify({'users': []})
-
-def user_detail(user_id):
-    """API endpoint to get user details."""
-    # Implementation here
-    return jsonify({'user': {}})
-
-def products_list():
-    """API endpoint to list products."""
-    # Implementation here
-    return jsonify({'products': []})
-
-# views/auth_views.py
-from flask import render_template, redirect, url_for, flash
-from functools import wraps
-
-def login():
-    """User login view."""
-    if request.method == 'POST':
-        # Handle login logic
-        pass
-    return render_template('auth/login.html')
-
-def logout():
-    """User logout view."""
-    # Handle logout logic
-    return redirect(url_for('main.index'))
-
-def admin_required(f):
-    """Decorator to require admin access."""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_admin:
-            abort(403)
-        return f(*args, **kwargs)
-    return decorated_function
-
-# error_handlers.py
-from flask import render_template, jsonify
-
-def handle_404(error):
-    """Handle 404 errors."""
-    if request.path.startswith('/api/'):
-        return jsonify({'error': 'Resource not found'}), 404
-    return render_template('errors/404.html'), 404
-
-def handle_500(error):
-    """Handle 500 errors."""
-    current_app.logger.error(f'Server Error: {error}')
-    if request.path.startswith('/api/'):
-        return jsonify({'error': 'Internal server error'}), 500
-    return render_template('errors/500.html'), 500
-
-Copy
-
-Insert at cursor
-python
-Key improvements in this production code:
-
-Organized Route Structure :
-
-Separate blueprints for different parts of the application
-
-Clear URL prefixes for different sections
-
-Proper HTTP method specifications
-
-Security Features :
-
-Rate limiting for API endpoints
-
-Authentication requirements for admin routes
-
-Proper error handling
-
-Maintainability :
-
-Modular organization with blueprints
-
-Separate view files for different sections
-
-Clear function names and documentation
-
-Logging and Monitoring :
-
-Request logging
-
-Error tracking
-
-Rate limit monitoring
-
-URL Management :
-
-Trailing slash handling
-
-Proper route registration
-
-Version prefix for API
-
-This structure provides a solid foundation for a production Flask application with proper separation of concerns and security considerations.
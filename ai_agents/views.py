@@ -1,285 +1,240 @@
 # views.py
-from flask import Blueprint, render_template, request
+import hmac
+import json
+import time
+
+from flask import (Blueprint, Response, abort, current_app, g, jsonify, redirect,
+                   render_template, request, stream_with_context, url_for)
+from .metrics import metrics
 from .models import GlossaryAgent
+from .page_cache import PageCache
+from .profiling import profiler
 
 # Use the blueprint defined in urls.py
 bp = Blueprint('views', __name__, url_prefix='/')
 
-# Initialize the GlossaryAgent
-glossary_agent = GlossaryAgent()
-
-@bp.route('/', methods=['GET'])
-def home():
-    """Render the homepage with a list of glossary terms."""
-    terms = glossary_agent.list_terms()
-    if not terms:  # Seed with some terms if empty
-        glossary_agent.learn_term("Machine Learning")
-        glossary_agent.learn_term("Generative AI")
-        terms = glossary_agent.list_terms()
-    return render_template('home.html', terms=terms)
-
-@bp.route('/term', methods=['GET', 'POST'])
-def term_detail():
-    """Handle term explanation requests."""
-    if request.method == 'POST':
-        term = request.form.get('term', '').strip()
-        if term:
-            explanation = glossary_agent.explain_term(term)
-            return render_template('term.html', explanation=explanation)
-    # GET request: show a form or default term
-    default_term = "Chatbot"
-    explanation = glossary_agent.explain_term(default_term)
-    return render_template('term.html', explanation=explanation)
-
-Here's an upgraded, production-ready version of views.py with advanced features, error handling, caching, and proper organization:
-
-# views.py
-from flask import (
-    Blueprint, render_template, request, jsonify, 
-    current_app, abort, flash, redirect, url_for
-)
-from flask_login import login_required, current_user
-from werkzeug.exceptions import HTTPException
-from .models import GlossaryAgent, Term, User
-from .extensions import cache, db, limiter
-from .forms import TermForm, SearchForm
-from .utils.decorators import admin_required
-from .utils.validators import validate_term
-from .tasks import update_term_async
-import logging
-from datetime import datetime
-import json
-
-# Configure logging
-logger = logging.getLogger(__name__)
-
-# Blueprint definition
-bp = Blueprint('views', __name__, url_prefix='/')
+# Rendered pages, dropped whenever the agent changes the content they show
+page_cache = PageCache()
+
+def use_agent(agent: GlossaryAgent):
+    """Serve the blueprint from agent and keep the page cache in sync with its writes."""
+    global glossary_agent
+    glossary_agent = agent
+    page_cache.clear()
+    agent.listeners.append(page_cache.invalidate)
+    agent.reload_listeners.append(page_cache.clear)
+    # An evicted generated term is generated afresh on its next request; it
+    # is not on the home listing
+    agent.definition_agent.generated_terms.eviction_listeners.append(
+        lambda key: page_cache.invalidate(key, home=False))
+    register_gauges(agent)
+
+def register_gauges(agent: GlossaryAgent):
+    """Report agent's glossary sizes, cache hit ratios and job queue depth on /metrics."""
+    definitions = agent.definition_agent
+    metrics.gauge('glossary_terms', "Terms by where they are kept.", lambda: {
+        (('set', 'curated'),): len(definitions.predefined_terms),
+        (('set', 'learned'),): len(agent.glossary),
+        (('set', 'generated'),): len(definitions.generated_terms),
+    })
+    metrics.gauge('glossary_cache_hit_ratio', "Hits per lookup since start.", lambda: {
+        (('cache', 'generated'),): definitions.generated_terms.stats()['hit_ratio'],
+        (('cache', 'similar_keys'),): definitions.similar_keys.stats()['hit_ratio'],
+        (('cache', 'page'),): page_cache.stats()['hit_ratio'],
+    })
+    metrics.gauge('glossary_jobs_queued', "Background generations waiting for a worker.",
+                  lambda: agent.jobs.stats()['queued'] if agent.jobs is not None else 0)
 
-# Initialize the GlossaryAgent with error handling
-try:
-    glossary_agent = GlossaryAgent()
-except Exception as e:
-    logger.error(f"Failed to initialize GlossaryAgent: {str(e)}")
-    glossary_agent = None
+metrics.describe('glossary_request_seconds', "Time to build each response, by route.")
+metrics.describe('glossary_stage_seconds', "Time spent in each stage of serving a term.")
 
-class TermNotFoundException(Exception):
-    pass
+# Initialize the GlossaryAgent
+use_agent(GlossaryAgent())
 
 @bp.before_request
-def before_request():
-    """Execute before each request to this blueprint."""
-    if glossary_agent is None:
-        abort(503, description="Glossary service temporarily unavailable")
+def start_timer():
+    if metrics.enabled:
+        g.request_started = time.perf_counter()
 
 @bp.after_request
-def after_request(response):
-    """Execute after each request to this blueprint."""
-    # Add security headers
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
+def record_latency(response):
+    # Streaming responses are timed up to their first byte
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.observe('glossary_request_seconds', time.perf_counter() - started,
+                        route=route, method=request.method)
     return response
 
-@bp.route('/', methods=['GET'])
-@cache.cached(timeout=300)  # Cache for 5 minutes
-def home():
-    """
-    Render the homepage with a list of glossary terms.
-    Includes pagination and search functionality.
-    """
-    try:
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
-        search_form = SearchForm()
-        query = request.args.get('q', '')
-
-        if query:
-            terms = Term.search(query).paginate(
-                page=page, per_page=per_page, error_out=False
-            )
-        else:
-            terms = Term.query.order_by(Term.name).paginate(
-                page=page, per_page=per_page, error_out=False
-            )
-
-        return render_template('home.html',
-                             terms=terms,
-                             search_form=search_form,
-                             query=query)
+def render(template, **context):
+    with metrics.timer('glossary_stage_seconds', stage='render_template'):
+        return render_template(template, **context)
 
-    except Exception as e:
-        logger.error(f"Error in home view: {str(e)}")
-        flash("An error occurred while loading terms.", "error")
-        return render_template('home.html', terms=None)
+def cached_page(page, key, render, conditional=True, variant=None):
+    """Serve a page from the cache, rendering it on a miss.
 
-@bp.route('/term/<string:term_id>', methods=['GET', 'POST'])
-@limiter.limit("30/minute")
-def term_detail(term_id):
+    Conditional responses carry a strong ETag and Cache-Control, and turn into
+    304 Not Modified when the client's If-None-Match matches. A render that
+    sets g.no_store (a placeholder for content still being generated) is
+    neither cached nor cacheable downstream.
     """
-    Handle term explanation requests with detailed information and related terms.
-    Includes user interactions and voting system.
-    """
-    try:
-        term = Term.query.get_or_404(term_id)
-        form = TermForm(obj=term)
-
-        if request.method == 'POST' and current_user.is_authenticated:
-            if form.validate_on_submit():
-                if current_user.can_edit_term(term):
-                    form.populate_obj(term)
-                    db.session.commit()
-                    cache.delete_memoized(get_term_explanation, term_id)
-                    flash("Term updated successfully.", "success")
-                else:
-                    flash("You don't have permission to edit this term.", "error")
-
-        explanation = get_term_explanation(term_id)
-        related_terms = get_related_terms(term)
-
-        return render_template('term_detail.html',
-                             term=term,
-                             form=form,
-                             explanation=explanation,
-                             related_terms=related_terms)
-
-    except TermNotFoundException:
-        return render_template('errors/term_not_found.html'), 404
-    except Exception as e:
-        logger.error(f"Error in term_detail view: {str(e)}")
-        flash("An error occurred while loading the term.", "error")
-        return redirect(url_for('views.home'))
-
-@bp.route('/api/term', methods=['POST'])
-@login_required
-@limiter.limit("10/minute")
-def add_term():
-    """API endpoint to add new terms."""
-    try:
-        data = request.get_json()
-        if not data or 'term' not in data:
-            return jsonify({'error': 'Missing term data'}), 400
-
-        term_name = data['term'].strip()
-        if not validate_term(term_name):
-            return jsonify({'error': 'Invalid term format'}), 400
-
-        # Check for existing term
-        existing_term = Term.query.filter_by(name=term_name).first()
-        if existing_term:
-            return jsonify({'error': 'Term already exists'}), 409
-
-        # Create new term
-        new_term = Term(
-            name=term_name,
-            created_by=current_user.id,
-            created_at=datetime.utcnow()
-        )
-        db.session.add(new_term)
-        db.session.commit()
-
-        # Trigger async task to update term
-        update_term_async.delay(new_term.id)
-
-        return jsonify({
-            'message': 'Term added successfully',
-            'term_id': new_term.id
-        }), 201
+    cached = None
+    enabled = current_app.config.get('PAGE_CACHE_ENABLED', True)
+    if enabled:
+        # Read the version before rendering, so a concurrent write discards this render
+        version = page_cache.version(key)
+        cached = page_cache.get(page, key, version, variant)
+    if cached is not None:
+        body = cached.body
+    else:
+        body = render()
+        if g.pop('no_store', False):
+            response = Response(body, mimetype='text/html')
+            response.cache_control.no_store = True
+            return response
+        if enabled:
+            cached = page_cache.put(page, key, body, version, variant)
+            body = cached.body
+    response = Response(body, mimetype='text/html')
+    if not conditional:
+        return response
+    if cached is not None:
+        response.set_etag(cached.etag)
+    else:
+        response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get('PAGE_CACHE_MAX_AGE', 60)
+    return response.make_conditional(request)
 
-    except Exception as e:
-        logger.error(f"Error adding term: {str(e)}")
-        db.session.rollback()
-        return jsonify({'error': 'Internal server error'}), 500
-
-@bp.route('/admin/terms', methods=['GET'])
-@admin_required
-def admin_terms():
-    """Admin interface for term management."""
-    try:
-        terms = Term.query.all()
-        return render_template('admin/terms.html', terms=terms)
-    except Exception as e:
-        logger.error(f"Error in admin terms view: {str(e)}")
-        flash("An error occurred while loading admin panel.", "error")
-        return redirect(url_for('views.home'))
-
-@cache.memoize(timeout=3600)
-def get_term_explanation(term_id):
-    """Get cached explanation for a term."""
-    term = Term.query.get(term_id)
-    if not term:
-        raise TermNotFoundException()
-    
-    try:
-        explanation = glossary_agent.explain_term(term.name)
-        return explanation
-    except Exception as e:
-        logger.error(f"Error getting term explanation: {str(e)}")
-        return "Explanation temporarily unavailable"
-
-def get_related_terms(term, limit=5):
-    """Get related terms based on similarity."""
-    try:
-        return Term.get_related_terms(term.id, limit=limit)
-    except Exception as e:
-        logger.error(f"Error getting related terms: {str(e)}")
-        return []
-
-@bp.errorhandler(HTTPException)
-def handle_exception(e):
-    """Handle HTTP exceptions."""
-    response = e.get_response()
-    response.data = json.dumps({
-        "code": e.code,
-        "name": e.name,
-        "description": e.description,
-    })
-    response.content_type = "application/json"
-    return response
-
-Copy
-
-Insert at cursor
-python
-This upgraded version includes:
-
-Advanced Error Handling :
-
-Proper exception handling
-
-Custom exceptions
-
-Logging
-
-User feedback
-
-Security Features :
-
-Rate limiting
-
-Authentication requirements
-
-Input validation
-
-Security headers
-
-Performance Optimization :
-
-Caching with Redis
-
-Pagination
-
-Async task processing
-
-Advanced Features :
-
-Search functionality
-
-Related terms
-
-Admin interface
+@bp.route('/', methods=['GET'])
+def home():
+    """Render the homepage with one page of glossary terms.
 
-API endpoints
+    ?category= restricts the listing to one category and ?after= is the
+    cursor returned with the previous page.
+    """
+    category = request.args.get('category') or None
+    after = request.args.get('after') or None
+    limit = current_app.config.get('HOME_PAGE_SIZE', 50)
+    return cached_page('home', PageCache.HOME, lambda: render(
+        'home.html', page=glossary_agent.list_page(category, after, limit),
+        categories=glossary_agent.categories()), variant=(category, after))
+
+def explained_page(term):
+    key = glossary_agent.definition_agent.resolve_key(term)
+
+    def render_term():
+        explanation = glossary_agent.explain_term(term, key)
+        if explanation['pending']:
+            # The page polls and reloads until the real definition is ready, so
+            # nothing may keep serving it the placeholder
+            g.no_store = True
+        return render('term.html', explanation=explanation)
+
+    # explain_term is read-only, so a cached page can skip it entirely
+    return cached_page('term', key, render_term)
 
-Form handling
+@bp.route('/term', methods=['GET', 'POST'])
+def term_detail():
+    """Handle term explanation requests.
 
-You'll also need these supporting files
+    GET /term?term=... only reads, so it is cacheable; POST learns the term
+    and redirects to its GET page.
+    """
+    if request.method == 'POST':
+        term = request.form.get('term', '').strip()
+        if term:
+            glossary_agent.learn_term(term)
+            return redirect(url_for('views.term_detail', term=term), code=303)
+    # GET request: show the requested term or a default one
+    term = request.args.get('term', '').strip() or "Chatbot"
+    return explained_page(term)
+
+@bp.route('/autocomplete', methods=['GET'])
+def autocomplete():
+    """Return curated terms matching a partial or misspelled query as JSON."""
+    query = request.args.get('q', '').strip()
+    limit = max(1, min(request.args.get('limit', 10, type=int), 50))
+    results = glossary_agent.search(query, limit) if query else []
+    return jsonify({"query": query, "results": results})
+
+@bp.route('/api/terms/batch', methods=['POST'])
+def explain_batch():
+    """Explain a JSON list of terms, streaming one JSON object per line.
+
+    Accepts {"terms": [...]} or a bare list. Duplicates and aliases of the
+    same term are explained once; see GlossaryAgent.explain_terms.
+    """
+    payload = request.get_json(silent=True)
+    terms = payload.get('terms') if isinstance(payload, dict) else payload
+    if not isinstance(terms, list) or not all(isinstance(term, str) for term in terms):
+        return jsonify({"error": "expected a JSON list of term strings"}), 400
+    limit = current_app.config.get('BATCH_MAX_TERMS', 500)
+    if len(terms) > limit:
+        return jsonify({"error": f"at most {limit} terms per batch"}), 413
+    terms = [term.strip() for term in terms if term.strip()]
+    explanations = glossary_agent.explain_terms(terms, current_app.config.get('BATCH_DEADLINE'))
+    lines = (json.dumps(explanation, ensure_ascii=False) + "\n" for explanation in explanations)
+    return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+@bp.route('/api/terms/status', methods=['GET'])
+def term_status():
+    """Whether a term's definition is still being generated in the background."""
+    term = request.args.get('term', '').strip()
+    key = glossary_agent.definition_agent.resolve_key(term)
+    jobs = glossary_agent.jobs
+    return jsonify({"term": term, "pending": jobs is not None and jobs.pending(key)})
+
+@bp.route('/term/events', methods=['GET'])
+def term_events():
+    """Server-sent events: one "ready" event once the term's generation finishes.
+
+    The response holds its worker for up to JOB_EVENT_TIMEOUT seconds, so
+    serve it with gevent or threaded (gthread) workers; behind sync workers
+    clients should poll /api/terms/status instead.
+    """
+    term = request.args.get('term', '').strip()
+    key = glossary_agent.definition_agent.resolve_key(term)
+    jobs = glossary_agent.jobs
+    timeout = current_app.config.get('JOB_EVENT_TIMEOUT', 5.0)
+
+    def events():
+        ready = jobs is None or jobs.wait(key, timeout)
+        yield f"event: {'ready' if ready else 'timeout'}\ndata: {json.dumps({'term': term})}\n\n"
+
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+@bp.route('/metrics', methods=['GET'])
+def metrics_page():
+    """Latency histograms and gauges in the Prometheus text format."""
+    if not metrics.enabled:
+        abort(404)
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@bp.route('/admin/profile', methods=['GET', 'DELETE'])
+def profile():
+    """Sampled request stacks in the collapsed format, for flamegraph tools.
+
+    Requires "Authorization: Bearer <PROFILE_TOKEN>". ?endpoint= limits the
+    output to one endpoint, ?format=json returns sample counts instead, and
+    DELETE discards the samples collected so far.
+    """
+    token = current_app.config.get('PROFILE_TOKEN')
+    if not token:
+        abort(404)
+    supplied = request.headers.get('Authorization', '')
+    if not hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode()):
+        abort(403)
+    if request.method == 'DELETE':
+        profiler.clear()
+        return '', 204
+    if request.args.get('format') == 'json':
+        return jsonify(profiler.stats())
+    return Response(profiler.collapsed(request.args.get('endpoint')), mimetype='text/plain')
+
+@bp.route('/api/jobs', methods=['GET'])
+def job_stats():
+    """Background generation queue depth, outcomes and throughput."""
+    jobs = glossary_agent.jobs
+    return jsonify(jobs.stats() if jobs is not None else {"enabled": False})
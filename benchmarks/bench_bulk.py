@@ -0,0 +1,71 @@
+# bench_bulk.py
+"""Measure bulk import/export throughput (rows/sec) against a SQLite glossary.
+
+Run from the repository root:
+
+    python benchmarks/bench_bulk.py --rows 1000000
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.bulk import export_terms, import_terms  # noqa: E402
+from ai_agents.models import DefinitionAgent  # noqa: E402
+from ai_agents.repository import SQLiteRepository  # noqa: E402
+
+
+def write_input(path, rows):
+    with open(path, "w", encoding="utf-8") as stream:
+        for i in range(rows):
+            stream.write(json.dumps({
+                "term": f"Vendor Term {i}",
+                "definition": f"Vendor Term {i} is a concept from a partner glossary.",
+                "category": ["Core AI", "Applications", "Advanced AI"][i % 3],
+                "examples": [f"A shop applying vendor term {i}."] if i % 4 == 0 else []
+            }) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "terms.jsonl")
+        write_input(source, args.rows)
+        repository = SQLiteRepository(os.path.join(directory, "glossary.db"))
+        agent = DefinitionAgent(repository=repository)
+
+        with open(source, encoding="utf-8") as stream:
+            stats = import_terms(agent, stream, "jsonl", args.batch_size)
+        print(f"import jsonl: {stats.read} rows in {stats.elapsed:.2f}s "
+              f"= {stats.rows_per_second:,.0f} rows/s")
+
+        for file_format in ("jsonl", "csv"):
+            target = os.path.join(directory, f"export.{file_format}")
+            start = time.perf_counter()
+            with open(target, "w", newline="", encoding="utf-8") as stream:
+                count = export_terms(repository, stream, file_format)
+            elapsed = time.perf_counter() - start
+            print(f"export {file_format}: {count} rows in {elapsed:.2f}s = {count / elapsed:,.0f} rows/s")
+
+        target = os.path.join(directory, "export.csv")
+        fresh = DefinitionAgent(repository=SQLiteRepository(os.path.join(directory, "copy.db")))
+        with open(target, newline="", encoding="utf-8") as stream:
+            stats = import_terms(fresh, stream, "csv", args.batch_size)
+        print(f"import csv:   {stats.read} rows in {stats.elapsed:.2f}s "
+              f"= {stats.rows_per_second:,.0f} rows/s")
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"peak RSS: {peak:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
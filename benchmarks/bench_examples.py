@@ -0,0 +1,52 @@
+# bench_examples.py
+"""Example generation cost: one term at a time vs the bulk warm-up pass.
+
+Run from the repository root:
+
+    python benchmarks/bench_examples.py --terms 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.models import ExampleAgent, GlossaryAgent, GlossaryTerm  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=100_000)
+    parser.add_argument("--count", type=int, default=3, help="examples per term")
+    args = parser.parse_args(argv)
+
+    examples = ExampleAgent()
+    terms = [GlossaryTerm(f"Term {i}", f"Definition of term {i}.") for i in range(args.terms)]
+    start = time.perf_counter()
+    for term in terms:
+        for _ in range(args.count):
+            examples.generate_example(term)
+    elapsed = time.perf_counter() - start
+    print(f"generate_example: {args.terms * args.count / elapsed:,.0f} examples/s")
+
+    start = time.perf_counter()
+    examples.compose_examples(terms, args.count)
+    elapsed = time.perf_counter() - start
+    print(f"compose_examples: {args.terms * args.count / elapsed:,.0f} examples/s")
+
+    agent = GlossaryAgent()
+    agent.definition_agent.add_terms(
+        (f"Term {i}", f"Definition of term {i}.", "General AI") for i in range(args.terms)
+    )
+    for key, term in list(agent.definition_agent.predefined_terms.items()):
+        agent.glossary.claim(key, term)
+    start = time.perf_counter()
+    added = agent.warm_examples(args.count)
+    elapsed = time.perf_counter() - start
+    print(f"warm_examples:    {added:,} examples for {args.terms:,} learned terms "
+          f"in {elapsed:.2f} s ({added / elapsed:,.0f} examples/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# bench_file_tools.py
+"""Cost per agent task of reading the instruction files: uncached walk and read vs cached tools vs passage search.
+
+Builds a temporary instructions directory of --files files plus one
+--large-mb file, then runs --tasks tasks that each either read every file
+(as the crew's tools do) or fetch the passages matching a query.
+
+Run from the repository root:
+
+    python benchmarks/bench_file_tools.py --files 200 --tasks 200
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.file_tools import (DirectoryReadTool, FileCache, FileReadTool,  # noqa: E402
+                                  InstructionIndex)
+
+TOPICS = ("lead demo pricing follow up email call prospect discount contract renewal onboarding "
+          "support schedule meeting budget decision timeline competitor feature integration "
+          "security trial feedback objection referral").split()
+# A long tail of rarer words, each topic word followed by its variants
+WORDS = TOPICS + [f"{topic}{suffix}" for topic in TOPICS for suffix in range(1, 80)]
+WEIGHTS = [1 / rank for rank in range(1, len(WORDS) + 1)]
+
+
+def paragraph(rng):
+    return " ".join(rng.choices(WORDS, WEIGHTS, k=rng.randint(15, 40))).capitalize() + "."
+
+
+def write_corpus(directory, files, large_mb, rng):
+    for index in range(files):
+        subdirectory = os.path.join(directory, f"team{index % 5}")
+        os.makedirs(subdirectory, exist_ok=True)
+        with open(os.path.join(subdirectory, f"instructions{index}.md"), "w") as stream:
+            stream.write("\n\n".join(paragraph(rng) for _ in range(rng.randint(5, 30))))
+    with open(os.path.join(directory, "playbook.md"), "w") as stream:
+        while stream.tell() < large_mb * 2 ** 20:
+            stream.write(paragraph(rng) + "\n\n")
+
+
+def uncached(directory):
+    total = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            with open(os.path.join(root, name), encoding="utf-8") as stream:
+                total += len(stream.read())
+    return total
+
+
+def cached(directory_tool, file_tool):
+    return sum(len(file_tool._run(path)) for path in directory_tool.files())
+
+
+def report(label, tasks, seconds, characters):
+    print(f"  {label:<26} {seconds * 1e3 / tasks:10.2f} ms per task {characters / tasks:14,.0f} "
+          f"characters per task")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--large-mb", type=float, default=8.0)
+    parser.add_argument("--tasks", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        write_corpus(directory, args.files, args.large_mb, rng)
+        queries = [" ".join(rng.choices(WORDS, WEIGHTS, k=3)) for _ in range(args.tasks)]
+        print(f"{args.files} files + {args.large_mb:.0f} MiB playbook, {args.tasks} tasks")
+
+        start = time.perf_counter()
+        characters = sum(uncached(directory) for _ in range(args.tasks))
+        report("walk and read everything", args.tasks, time.perf_counter() - start, characters)
+
+        cache = FileCache(max_bytes=256 * 2 ** 20)
+        directory_tool = DirectoryReadTool(directory, cache=cache)
+        file_tool = FileReadTool(cache=cache)
+        start = time.perf_counter()
+        characters = sum(cached(directory_tool, file_tool) for _ in range(args.tasks))
+        report("cached tools, everything", args.tasks, time.perf_counter() - start, characters)
+
+        index = InstructionIndex(directory_tool)
+        start = time.perf_counter()
+        index.refresh()
+        print(f"  {'build passage index':<26} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+        start = time.perf_counter()
+        characters = sum(len(index._run(query)) for query in queries)
+        report("passage search, top 5", args.tasks, time.perf_counter() - start, characters)
+        print(index.stats())
+
+
+if __name__ == "__main__":
+    main()
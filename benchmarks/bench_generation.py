@@ -0,0 +1,83 @@
+# bench_generation.py
+"""Tokens/sec and latency of definition generation at different micro-batch sizes.
+
+Client threads request definitions for distinct terms through one
+BatchingGenerator. The default stub backend simulates a CPU model (a fixed
+cost per forward pass plus a cost per generated token); --backend
+transformers measures a real local model instead.
+
+Run from the repository root:
+
+    python benchmarks/bench_generation.py --clients 32 --requests 20
+    python benchmarks/bench_generation.py --backend transformers --model gpt2 --requests 4
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.generation import BatchingGenerator, StubBackend, create_backend  # noqa: E402
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(generator, clients, requests):
+    latencies, tokens = [], []
+    barrier = threading.Barrier(clients + 1)
+
+    def client(number):
+        barrier.wait()
+        for i in range(requests):
+            start = time.perf_counter()
+            definition = generator.define(f"Benchmark Term {number}-{i}")
+            latencies.append(time.perf_counter() - start)
+            tokens.append(generator.count_tokens(definition))
+
+    threads = [threading.Thread(target=client, args=(number,)) for number in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(tokens) / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.95)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="stub", choices=["stub", "transformers"])
+    parser.add_argument("--model", default="gpt2")
+    parser.add_argument("--clients", type=int, default=32, help="concurrent request threads")
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--batch-sizes", default="1,2,4,8,16,32")
+    parser.add_argument("--max-wait", type=float, default=0.01, help="seconds to wait for a batch to fill")
+    parser.add_argument("--batch-latency", type=float, default=0.02, help="stub: seconds per forward pass")
+    parser.add_argument("--token-latency", type=float, default=0.002, help="stub: seconds per token")
+    args = parser.parse_args(argv)
+
+    if args.backend == "stub":
+        backend = StubBackend(args.batch_latency, args.token_latency)
+    else:
+        backend = create_backend(args.backend, args.model)
+    print(f"{args.backend} backend, {args.clients} clients x {args.requests} requests")
+    print(f"{'batch':>6} {'tokens/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'mean batch':>11}")
+    for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+        generator = BatchingGenerator(backend, batch_size, args.max_wait)
+        try:
+            tokens_per_second, p50, p95 = run(generator, args.clients, args.requests)
+            stats = generator.stats()
+        finally:
+            generator.close()
+        print(f"{batch_size:>6} {tokens_per_second:>10,.0f} {p50 * 1000:>8.1f} {p95 * 1000:>8.1f} "
+              f"{stats['mean_batch_size']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# bench_jobs.py
+"""Request latency for unknown terms with inline vs background generation, and queue throughput.
+
+Inline, explain_term waits for the (simulated) model; with the job queue
+it returns a placeholder at once and the pool generates in the background.
+
+Run from the repository root:
+
+    python benchmarks/bench_jobs.py --terms 200 --latency 0.05 --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.generation import StubBackend  # noqa: E402
+from ai_agents.models import GlossaryAgent  # noqa: E402
+
+
+def request_latencies(agent, terms):
+    latencies = []
+    for term in terms:
+        start = time.perf_counter()
+        agent.explain_term(term)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per simulated generation")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads", action="store_true", help="use a thread pool instead of processes")
+    args = parser.parse_args(argv)
+
+    inline = GlossaryAgent(generator=StubBackend(batch_latency=args.latency))
+    p50, p95 = request_latencies(inline, [f"Inline Term {i}" for i in range(args.terms)])
+    print(f"inline generation:     p50 {p50 * 1000:8.2f} ms  p95 {p95 * 1000:8.2f} ms")
+
+    queued = GlossaryAgent()
+    jobs = queued.start_jobs(args.workers, backend_options={"batch_latency": args.latency},
+                             processes=not args.threads)
+    start = time.perf_counter()
+    p50, p95 = request_latencies(queued, [f"Queued Term {i}" for i in range(args.terms)])
+    print(f"background generation: p50 {p50 * 1000:8.2f} ms  p95 {p95 * 1000:8.2f} ms")
+    while jobs.stats()["queued"] or jobs.stats()["running"]:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    stats = jobs.stats()
+    jobs.close()
+    print(f"queue: {stats['completed']} jobs on {args.workers} workers in {elapsed:.2f} s "
+          f"({stats['completed'] / elapsed:,.1f} jobs/s), "
+          f"submit-to-done p50 {stats['latency_p50']:.2f} s, p95 {stats['latency_p95']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# bench_pages.py
+"""Requests/sec for the term and home pages with and without the page cache.
+
+Home pages list HOME_PAGE_SIZE terms, so their cost should not grow with --terms.
+
+Run from the repository root:
+
+    python benchmarks/bench_pages.py --requests 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents import create_app, views  # noqa: E402
+
+
+def run(client, path, requests, headers=None):
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(path, headers=headers or {})
+        assert response.status_code in (200, 304), response.status_code
+    return requests / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--terms", type=int, default=1000, help="learned terms listed on the home page")
+    args = parser.parse_args(argv)
+
+    app = create_app()
+    client = app.test_client()
+    client.get("/")  # warm up
+    agent = views.glossary_agent
+    agent.definition_agent.add_terms(
+        (f"Term {i}", f"Definition of term {i}.", "General AI") for i in range(args.terms)
+    )
+    for i in range(args.terms):
+        agent.learn_term(f"Term {i}")
+    print(f"{'path':<40} {'no cache':>10} {'cached':>10} {'304':>10}  (requests/sec)")
+    middle = f"term {args.terms // 2}"
+    for path in ("/", f"/?after={middle}", f"/?category=General+AI&after={middle}", "/term"):
+        app.config["PAGE_CACHE_ENABLED"] = False
+        uncached = run(client, path, args.requests)
+        app.config["PAGE_CACHE_ENABLED"] = True
+        cached = run(client, path, args.requests)
+        etag = client.get(path).headers["ETag"]
+        not_modified = run(client, path, args.requests, {"If-None-Match": etag})
+        print(f"{path:<40} {uncached:>10,.0f} {cached:>10,.0f} {not_modified:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# bench_pipeline.py
+"""Outreach crew throughput: sequential tasks vs the streaming pipeline, with stub model and search.
+
+The sequential run is how the crew runs its tasks: lead_research for every
+query first, then outreach_preparation one lead at a time. Latencies of
+the stub search and LLM calls are set with --search-ms and --llm-ms.
+
+Run from the repository root:
+
+    python benchmarks/bench_pipeline.py --queries 50 --workers 16
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.pipeline import StubLLM, StubSearchTool, outreach_pipeline  # noqa: E402
+from ai_agents.sentiment import SentimentAnalysisTool  # noqa: E402
+
+
+def sequential(queries, llm, search, sentiment):
+    """(leads, seconds to the first message)."""
+    started = time.perf_counter()
+    leads = [lead for query in queries
+             for lead in search.search(f"{query} companies looking for AI tools")]
+    first = None
+    for lead in leads:
+        summary = llm.complete(f"Summarize {lead['company']} as a sales lead: {lead['snippet']}")
+        mood = sentiment.analyze(lead["snippet"])
+        llm.complete(f"Write a {mood.lower()}-aware outreach email to "
+                     f"{lead['company']} ({lead['contact']}): {summary}")
+        if first is None:
+            first = time.perf_counter() - started
+    return len(leads), first
+
+
+def pipelined(queries, llm, search, sentiment, workers, queue_size):
+    started = time.perf_counter()
+    pipeline = outreach_pipeline(llm, search, sentiment, research_workers=max(1, workers // 4),
+                                 outreach_workers=workers, queue_size=queue_size)
+    first, leads = None, 0
+    for result in pipeline.run(queries):
+        assert result.error is None, result
+        leads += 1
+        if first is None:
+            first = time.perf_counter() - started
+    return leads, first
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--leads", type=int, default=5, help="search results per query")
+    parser.add_argument("--search-ms", type=float, default=50.0)
+    parser.add_argument("--llm-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--queue-size", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    queries = [f"industry {index}" for index in range(args.queries)]
+    sentiment = SentimentAnalysisTool(workers=1)
+    print(f"{args.queries} queries x {args.leads} leads, search {args.search_ms:.0f} ms, "
+          f"LLM {args.llm_ms:.0f} ms per call")
+    print(f"{'mode':<26} {'leads/s':>10} {'total s':>9} {'first lead s':>13}")
+    for label, run in (
+            ("sequential", lambda llm, search: sequential(queries, llm, search, sentiment)),
+            (f"pipeline ({args.workers} workers)",
+             lambda llm, search: pipelined(queries, llm, search, sentiment, args.workers,
+                                           args.queue_size))):
+        llm = StubLLM(latency=args.llm_ms / 1000)
+        search = StubSearchTool(latency=args.search_ms / 1000, results=args.leads)
+        started = time.perf_counter()
+        leads, first = run(llm, search)
+        elapsed = time.perf_counter() - started
+        print(f"{label:<26} {leads / elapsed:10.1f} {elapsed:9.2f} {first:13.3f}")
+
+
+if __name__ == "__main__":
+    main()
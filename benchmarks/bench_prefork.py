@@ -0,0 +1,137 @@
+# bench_prefork.py
+"""Per-worker memory of forked workers that build, load or inherit the glossary.
+
+Forks --workers children the way a pre-forking server (gunicorn) does, in
+three setups:
+
+    build    each worker builds the glossary and its indexes itself
+    load     each worker loads the snapshot after fork
+    preload  the master loads the snapshot and freezes the collector
+             before forking (gunicorn.conf.py's preload_app setup)
+
+Each worker reports its RSS, PSS and private memory once every worker is
+ready ("before") and again after serving --requests lookups ("after").
+Private memory is what a worker does not share with any other process.
+Linux only (reads /proc/self/smaps_rollup).
+
+Run from the repository root:
+
+    python benchmarks/bench_prefork.py --terms 10000 --workers 4
+"""
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.models import GlossaryAgent  # noqa: E402
+from ai_agents.snapshot import load_snapshot, write_snapshot  # noqa: E402
+
+CATEGORIES = ["Core AI", "Applications", "Advanced AI"]
+
+
+def memory():
+    """RSS, PSS and private memory of this process, in MiB."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as stream:
+        for line in stream:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[name] = int(value.split()[0]) / 1024
+    return {"rss": fields["Rss"], "pss": fields["Pss"],
+            "private": fields["Private_Clean"] + fields["Private_Dirty"]}
+
+
+def build(rows):
+    agent = GlossaryAgent()
+    agent.definition_agent.add_terms(rows)
+    for term, _, _ in rows[:len(rows) // 10]:
+        agent.learn_term(term)
+    agent.related_terms
+    agent.search_index
+    return agent
+
+
+def serve(agent, rows, requests, seed):
+    rng = random.Random(seed)
+    for _ in range(requests):
+        term = rng.choice(rows)[0]
+        agent.explain_term(term)
+        agent.related(term)
+        agent.search(term[:6])
+    agent.list_page()
+
+
+def worker(mode, rows, path, agent, requests, barrier, output, seed):
+    if mode == "build":
+        agent = build(rows)
+    elif mode == "load":
+        agent = load_snapshot(path)
+    else:
+        agent.after_fork()
+    barrier.wait()
+    before = memory()
+    serve(agent, rows, requests, seed)
+    barrier.wait()
+    after = memory()
+    os.write(output, (json.dumps({"before": before, "after": after}) + "\n").encode())
+
+
+def run(mode, rows, path, workers, requests):
+    agent = None
+    if mode == "preload":
+        agent = load_snapshot(path)
+        gc.freeze()
+    barrier = multiprocessing.Barrier(workers)
+    read, write = os.pipe()
+    children = []
+    for index in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            try:
+                worker(mode, rows, path, agent, requests, barrier, write, index)
+            finally:
+                os._exit(0)
+        children.append(pid)
+    os.close(write)
+    with os.fdopen(read) as stream:
+        reports = [json.loads(line) for line in stream]
+    for pid in children:
+        os.waitpid(pid, 0)
+    if mode == "preload":
+        gc.unfreeze()
+    return reports
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    rows = [(f"Term {i}", f"Term {i} helps a business with {CATEGORIES[i % 3].lower()} work.",
+             CATEGORIES[i % 3]) for i in range(args.terms)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "glossary.snap")
+        size = write_snapshot(build(rows), path)
+        print(f"{args.terms:,} terms, snapshot {size / 2 ** 20:.1f} MiB, {args.workers} workers "
+              f"(MiB per worker, mean)")
+        print(f"{'mode':<8} {'':>6} {'rss':>8} {'pss':>8} {'private':>8}")
+        for mode in ("build", "load", "preload"):
+            reports = run(mode, rows, path, args.workers, args.requests)
+            for phase in ("before", "after"):
+                mean = {field: sum(report[phase][field] for report in reports) / len(reports)
+                        for field in ("rss", "pss", "private")}
+                print(f"{mode if phase == 'before' else '':<8} {phase:>6} {mean['rss']:8.1f} "
+                      f"{mean['pss']:8.1f} {mean['private']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
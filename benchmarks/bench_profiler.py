@@ -0,0 +1,41 @@
+# bench_profiler.py
+"""Request throughput with the sampling profiler off, sampling 1% and sampling every request.
+
+Run from the repository root:
+
+    python benchmarks/bench_profiler.py --threads 4 --requests 20000
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ai_agents import create_app  # noqa: E402
+from ai_agents.config import Config  # noqa: E402
+from ai_agents.profiling import profiler  # noqa: E402
+from wsgi_load import run_load  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["/", "/term?term=Chatbot"])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'sample rate':<12} {'requests/s':>12} {'p50 ms':>8} {'p99 ms':>8} {'samples':>8}")
+    for rate in (0.0, 0.01, 1.0):
+        Config.PROFILE_SAMPLE_RATE = rate
+        app = create_app()
+        profiler.clear()
+        run_load(app, args.paths, args.threads, args.requests // 10)  # warm up
+        result = run_load(app, args.paths, args.threads, args.requests)
+        samples = sum(endpoint["samples"] for endpoint in profiler.stats()["endpoints"].values())
+        print(f"{rate:<12} {result['requests_per_second']:12,.0f} "
+              f"{result['latency_p50'] * 1e3:8.2f} {result['latency_p99'] * 1e3:8.2f} {samples:8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# bench_related.py
+"""Build time, incremental update cost and lookup latency of the related-terms engine.
+
+Builds RelatedTerms over synthetic terms whose definitions are drawn from
+a shared vocabulary, then times adding terms one at a time (as add_term
+does) and in bulk (as after add_terms), and looking up precomputed and
+ad-hoc neighbours.
+
+Run from the repository root:
+
+    python benchmarks/bench_related.py --terms 100000 --adds 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.related import RelatedTerms  # noqa: E402
+
+WORDS = ("adaptive agent analytics anomaly attention automated bayesian chatbot churn cloud "
+         "cluster customer data decision deep demand detection edge embedding engine feature "
+         "forecast fraud generative graph image inference insight language latent learning "
+         "machine marketing model network neural optimization pipeline prediction pricing "
+         "prompt recommendation reinforcement retrieval risk robotic search segmentation "
+         "sentiment signal speech supply synthetic text training transformer vector vision "
+         "voice workflow").split()
+
+
+def synthetic_term(index, rng):
+    name = " ".join(rng.sample(WORDS, 2)) + f" {index}"
+    definition = " ".join(rng.choices(WORDS, k=rng.randint(8, 20))) + "."
+    return f"term-{index}", name, definition
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=100_000)
+    parser.add_argument("--adds", type=int, default=200, help="terms added incrementally")
+    parser.add_argument("--bulk", type=int, default=5000, help="terms added in one add_many")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    terms = [synthetic_term(i, rng) for i in range(args.terms)]
+    engine = RelatedTerms(dim=args.dim)
+
+    start = time.perf_counter()
+    engine.build(terms)
+    elapsed = time.perf_counter() - start
+    megabytes = (engine._vectors.nbytes + engine._neighbours.nbytes + engine._scores.nbytes) / 2 ** 20
+    print(f"build: {args.terms:,} terms x {args.dim} dims in {elapsed:.2f} s "
+          f"({megabytes:.0f} MiB of arrays)")
+
+    added = [synthetic_term(args.terms + i, rng) for i in range(args.adds)]
+    start = time.perf_counter()
+    for key, name, definition in added:
+        engine.add(key, name, definition)
+    elapsed = time.perf_counter() - start
+    print(f"add:   {elapsed / args.adds * 1e3:.2f} ms per term (incremental neighbour update)")
+
+    bulk = [synthetic_term(args.terms + args.adds + i, rng) for i in range(args.bulk)]
+    start = time.perf_counter()
+    engine.add_many(bulk)
+    elapsed = time.perf_counter() - start
+    print(f"add_many: {args.bulk:,} terms in {elapsed:.2f} s (bulk neighbour update)")
+
+    keys = [key for key, _, _ in rng.sample(terms, args.queries)]
+    start = time.perf_counter()
+    for key in keys:
+        engine.related(key, args.k)
+    elapsed = time.perf_counter() - start
+    print(f"related (precomputed): {elapsed / args.queries * 1e6:.1f} us per lookup")
+
+    queries = [synthetic_term(-i, rng) for i in range(1, args.queries // 10 + 1)]
+    start = time.perf_counter()
+    for _, name, definition in queries:
+        engine.similar_to(name, definition, args.k)
+    elapsed = time.perf_counter() - start
+    print(f"similar_to (ad hoc):   {elapsed / len(queries) * 1e3:.2f} ms per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# bench_search.py
+"""Measure prefix and fuzzy search latency of SearchIndex.
+
+Run from the repository root:
+
+    python benchmarks/bench_search.py --terms 1000000 --queries 2000
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.search import SearchIndex  # noqa: E402
+
+
+def make_terms(n, rng, vocabulary=50_000):
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+             for _ in range(vocabulary)]
+    terms = set()
+    while len(terms) < n:
+        terms.add(" ".join(rng.choice(words) for _ in range(rng.randint(1, 3))).title())
+    return list(terms)
+
+
+def typo(term, rng):
+    position = rng.randrange(len(term))
+    return term[:position] + rng.choice(string.ascii_lowercase) + term[position + 1:]
+
+
+def percentiles(samples):
+    samples.sort()
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1e3  # noqa: E731
+    return f"p50={pick(0.50):.3f}ms p99={pick(0.99):.3f}ms max={samples[-1] * 1e3:.3f}ms"
+
+
+def timed(function, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        function(query)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--vocabulary", type=int, default=50_000,
+                        help="distinct words the synthetic terms are built from")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    terms = make_terms(args.terms, rng, args.vocabulary)
+    start = time.perf_counter()
+    index = SearchIndex(terms)
+    print(f"built index over {len(index)} terms in {time.perf_counter() - start:.1f}s")
+
+    sample = rng.sample(terms, args.queries)
+    prefixes = [term[:rng.randint(2, 6)] for term in sample]
+    typos = [typo(term, rng) for term in sample]
+    print("prefix(limit=10):", percentiles(timed(lambda q: index.prefix(q, 10), prefixes)))
+    print("fuzzy(limit=10): ", percentiles(timed(lambda q: index.fuzzy(q, 10), typos)))
+    print("search(limit=10):", percentiles(timed(lambda q: index.search(q, 10), prefixes)),
+          "(prefixes)")
+    # A typo in a partially typed term: the prefix pass finds nothing
+    partial = [typo(term[:rng.randint(4, 8)], rng) for term in sample]
+    print("search(limit=10):", percentiles(timed(lambda q: index.search(q, 10), partial)),
+          "(mistyped prefixes)")
+    print("search(limit=10):", percentiles(timed(lambda q: index.search(q, 10), typos)),
+          "(mistyped terms)")
+
+    extra = make_terms(1000, random.Random(args.seed + 1), args.vocabulary)
+    print("add():           ", percentiles(timed(index.add, extra)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# bench_semantic_cache.py
+"""Hit rate, false matches and lookup latency of the semantic cache.
+
+Fills a SemanticCache with random multi-word terms, then looks up
+paraphrases of them (reordered, hyphenated, pluralized) and unrelated
+terms. A paraphrase should hit; an unrelated term should miss.
+
+Run from the repository root:
+
+    python benchmarks/bench_semantic_cache.py --size 10000 --queries 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.keys import canonical_key  # noqa: E402
+from ai_agents.semantic_cache import SemanticCache  # noqa: E402
+
+WORDS = ("adaptive agent analytics anomaly attention automated bayesian chatbot churn cloud "
+         "cluster customer data decision deep demand detection edge embedding engine feature "
+         "forecast fraud generative graph image inference insight language latent learning "
+         "machine marketing model network neural optimization pipeline prediction pricing "
+         "prompt recommendation reinforcement retrieval risk robotic search segmentation "
+         "sentiment signal speech supply synthetic text training transformer vector vision "
+         "voice workflow").split()
+
+
+def paraphrase(term, rng):
+    words = term.split()
+    choice = rng.randrange(3)
+    if choice == 0:
+        rng.shuffle(words)
+        return " ".join(words)
+    if choice == 1:
+        return "-".join(words)
+    words[-1] += "s"
+    return " ".join(words)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000, help="cached terms")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--threshold", type=float, default=0.95)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    # Distinct word sets, so no "unrelated" term is a reordering of a cached one
+    word_sets = {frozenset(rng.sample(WORDS, rng.randint(2, 3))) for _ in range(args.size * 3)}
+    terms = [" ".join(sorted(words, key=lambda _: rng.random())) for words in word_sets]
+    rng.shuffle(terms)
+    cached, unrelated = terms[:args.size], terms[args.size:]
+    cache = SemanticCache(max_size=args.size, threshold=args.threshold)
+    for term in cached:
+        cache.put(term, term)
+
+    def measure(queries, expected):
+        hits = correct = 0
+        start = time.perf_counter()
+        for query, target in queries:
+            found = cache.get(canonical_key(query))
+            hits += found is not None
+            correct += found == target if expected else 0
+        return hits, correct, (time.perf_counter() - start) / len(queries)
+
+    paraphrases = [(paraphrase(term, rng), term) for term in rng.sample(cached, args.queries)]
+    hits, correct, seconds = measure(paraphrases, True)
+    print(f"{args.size:,} cached terms, threshold {args.threshold}")
+    print(f"paraphrases: {hits / len(paraphrases):.1%} hit, {correct / len(paraphrases):.1%} "
+          f"hit the right term, {seconds * 1e3:.3f} ms/lookup")
+    others = [(term, None) for term in unrelated[:args.queries]]
+    hits, _, seconds = measure(others, False)
+    print(f"unrelated:   {hits / len(others):.1%} false hits, {seconds * 1e3:.3f} ms/lookup")
+
+
+if __name__ == "__main__":
+    main()
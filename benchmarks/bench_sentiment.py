@@ -0,0 +1,78 @@
+# bench_sentiment.py
+"""Sentiment scoring throughput: per-word str.count vs the compiled lexicon, inline and pooled.
+
+The str.count baseline is the original outreach-campaign tool: it lowercases
+the text once per lexicon word and counts substrings, so "good" also
+matches "goodbye". It is timed on the first --baseline-messages messages.
+
+Run from the repository root:
+
+    python benchmarks/bench_sentiment.py --messages 1000000 --workers 4
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.sentiment import (NEGATIVE_WORDS, POSITIVE_WORDS,  # noqa: E402
+                                 SentimentAnalysisTool)
+
+FILLER = ("hi team I wanted to follow up on our call about the new plan and your goals for "
+          "next quarter the demo covered pricing onboarding and support let me know what "
+          "works goodbye regards").split()
+
+
+def messages(count, seed=0):
+    rng = random.Random(seed)
+    words = FILLER * 4 + list(POSITIVE_WORDS) + list(NEGATIVE_WORDS)
+    return [" ".join(rng.choices(words, k=rng.randint(20, 80))) + rng.choice(".!?")
+            for _ in range(count)]
+
+
+def count_words(text):
+    positive = sum(text.lower().count(word) for word in POSITIVE_WORDS)
+    negative = sum(text.lower().count(word) for word in NEGATIVE_WORDS)
+    return positive - negative
+
+
+def report(label, count, seconds):
+    print(f"  {label:<30} {count / seconds:14,.0f} messages/s {seconds * 1e6 / count:8.2f} us each")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--baseline-messages", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    texts = messages(args.messages)
+    sample = texts[:args.baseline_messages]
+    print(f"{len(texts):,} messages, {sum(map(len, texts)) / len(texts):.0f} characters each")
+
+    start = time.perf_counter()
+    expected = [count_words(text) for text in sample]
+    report("str.count per word", len(sample), time.perf_counter() - start)
+
+    inline = SentimentAnalysisTool(workers=1)
+    start = time.perf_counter()
+    scores = inline.score_batch(texts)
+    report("compiled lexicon", len(texts), time.perf_counter() - start)
+
+    pooled = SentimentAnalysisTool(workers=args.workers)
+    pooled.score_batch(texts[:pooled.chunk_size * args.workers])  # start the workers
+    start = time.perf_counter()
+    pooled_scores = pooled.score_batch(texts)
+    report(f"compiled lexicon, {args.workers} processes", len(texts), time.perf_counter() - start)
+    pooled.close()
+
+    assert pooled_scores == scores
+    differ = sum(old != new for old, new in zip(expected, scores))
+    print(f"  scores that differ from str.count (substring matches): {differ / len(sample):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# bench_single_flight.py
+"""Backend generations when many threads and processes ask for the same unknown term.
+
+Each process starts a thread per client; all of them explain (or, with
+--learn, learn) the same unknown term at once against a slow stub backend.
+Without coalescing every caller would generate; with it, one generation
+should serve every thread of every process that shares the database.
+
+Run from the repository root:
+
+    python benchmarks/bench_single_flight.py --processes 4 --threads 64
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.generation import StubBackend  # noqa: E402
+from ai_agents.models import GlossaryAgent  # noqa: E402
+from ai_agents.repository import SQLiteRepository  # noqa: E402
+
+
+class CountingBackend(StubBackend):
+    def __init__(self, latency):
+        super().__init__(batch_latency=latency)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, terms):
+        with self._lock:
+            self.calls += 1
+        super().generate(terms)
+        # Not the stub's placeholder text, so learn_term keeps the term
+        return [f"{term} is a term the counting backend defined." for term in terms]
+
+
+def process(database, threads, term, learn, latency, start_at, results):
+    backend = CountingBackend(latency)
+    agent = GlossaryAgent(repository=SQLiteRepository(database), generator=backend)
+    definitions = []
+
+    def client():
+        time.sleep(max(0.0, start_at - time.time()))
+        if learn:
+            definitions.append(agent.learn_term(term).definition)
+        else:
+            definitions.append(agent.explain_term(term)["definition"])
+
+    workers = [threading.Thread(target=client) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    results.put((backend.calls, definitions[0], agent.definition_agent.flight.stats()["shared"]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=64, help="threads per process")
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per stub generation")
+    parser.add_argument("--learn", action="store_true", help="learn the term instead of explaining it")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "flight.db")
+        SQLiteRepository(database).close()
+        results = multiprocessing.Queue()
+        start_at = time.time() + 1.0
+        processes = [
+            multiprocessing.Process(target=process, args=(database, args.threads, "Viral Term",
+                                                          args.learn, args.latency, start_at, results))
+            for _ in range(args.processes)
+        ]
+        for worker in processes:
+            worker.start()
+        reports = [results.get() for _ in processes]
+        for worker in processes:
+            worker.join()
+        elapsed = time.time() - start_at
+        repository = SQLiteRepository(database)
+        examples = [len(term.examples) for term in repository.learned.values()
+                    if term.term == "Viral Term"]
+        repository.close()
+
+    callers = args.processes * args.threads
+    generations = sum(report[0] for report in reports)
+    print(f"{callers} callers in {args.processes} processes, {elapsed:.2f} s")
+    print(f"backend generations: {generations} (without coalescing: {callers})")
+    print(f"callers sharing an in-process flight: {sum(report[2] for report in reports)}")
+    print(f"distinct definitions seen: {len(set(report[1] for report in reports))}")
+    if args.learn:
+        print(f"examples stored for the term: {examples[0] if examples else 0}")
+
+
+if __name__ == "__main__":
+    main()
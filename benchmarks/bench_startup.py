@@ -0,0 +1,63 @@
+# bench_startup.py
+"""Startup cost of building a glossary and its indexes vs loading a snapshot.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py --terms 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.models import GlossaryAgent  # noqa: E402
+from ai_agents.snapshot import load_snapshot, write_snapshot  # noqa: E402
+
+CATEGORIES = ["Core AI", "Applications", "Advanced AI"]
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def first_requests(agent):
+    agent.explain_term("Term 1")
+    agent.explain_term("Termm 2")  # a typo, so suggestions use the search index
+    agent.list_page()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    rows = [(f"Term {i}", f"Term {i} helps a business with {CATEGORIES[i % 3].lower()} work.",
+             CATEGORIES[i % 3]) for i in range(args.terms)]
+    print(f"build from scratch ({args.terms:,} terms):")
+    start = time.perf_counter()
+    agent = timed("create agent", GlossaryAgent)
+    timed("load terms", lambda: agent.definition_agent.add_terms(rows))
+    timed("learn starter terms", agent.learn_starter_terms)
+    timed("build related index", lambda: agent.related_terms)
+    timed("build search index", lambda: agent.search_index)
+    timed("first requests", lambda: first_requests(agent))
+    print(f"  {'total':<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "glossary.snap")
+        size = timed("write snapshot", lambda: write_snapshot(agent, path))
+        print(f"\nload snapshot ({size / 2 ** 20:.1f} MiB):")
+        start = time.perf_counter()
+        loaded = timed("load snapshot", lambda: load_snapshot(path))
+        timed("first requests", lambda: first_requests(loaded))
+        print(f"  {'total':<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
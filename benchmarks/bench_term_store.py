@@ -0,0 +1,74 @@
+# bench_term_store.py
+"""Compare memory use of GlossaryTerm objects against the columnar TermStore.
+
+Run from the repository root:
+
+    python benchmarks/bench_term_store.py --sizes 10000 100000 1000000
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.models import GlossaryTerm  # noqa: E402
+from ai_agents.term_store import TermIndex, TermStore  # noqa: E402
+
+CATEGORIES = ["Core AI", "Advanced AI", "Applications", "General AI", "Unclassified"]
+
+
+def make_rows(n):
+    for i in range(n):
+        term = f"Term {i}"
+        yield term, f"{term} is an AI concept related to business growth.", CATEGORIES[i % len(CATEGORIES)]
+
+
+def build_objects(n):
+    """The current layout: GlossaryTerm objects referenced from two dicts."""
+    predefined, glossary = {}, {}
+    for term, definition, category in make_rows(n):
+        glossary_term = GlossaryTerm(term, definition, category)
+        glossary_term.add_example(f"For {term}, imagine a startup using it.")
+        predefined[term] = glossary_term
+        glossary[term] = glossary_term
+    return predefined, glossary
+
+
+def build_store(n):
+    """The columnar layout: one TermStore shared by two indexes."""
+    store = TermStore()
+    predefined, glossary = TermIndex(store), TermIndex(store)
+    for term, definition, category in make_rows(n):
+        view = predefined.add(term, term, definition, category)
+        view.add_example(f"For {term}, imagine a startup using it.")
+        glossary[term] = view
+    return predefined, glossary
+
+
+def measure(builder, n):
+    gc.collect()
+    tracemalloc.start()
+    result = builder(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'terms':>10} {'objects MiB':>12} {'store MiB':>10} {'B/term obj':>11} {'B/term store':>13} {'ratio':>6}")
+    for n in args.sizes:
+        objects = measure(build_objects, n)
+        store = measure(build_store, n)
+        print(f"{n:>10} {objects / 2**20:>12.1f} {store / 2**20:>10.1f} "
+              f"{objects / n:>11.0f} {store / n:>13.0f} {objects / store:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# stress_agent.py
+"""Hammer one shared GlossaryAgent from many threads and check its invariants.
+
+Every thread mixes explain_term calls (curated, aliased and unknown terms),
+searches, and learn_term calls on terms that all threads race to learn as
+well as on terms of its own. Afterwards each learned term must be curated,
+in the glossary, searchable, and have exactly one example.
+tests/test_stress.py runs a shorter version of the same mix under pytest.
+
+Run from the repository root:
+
+    python benchmarks/stress_agent.py --threads 64 --operations 2000
+    python benchmarks/stress_agent.py --database /tmp/stress.db
+
+The default switch interval makes races likely but costs throughput; pass
+--switch-interval 0.005 (CPython's default) to measure ops/s.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.models import GlossaryAgent  # noqa: E402
+from ai_agents.repository import SQLiteRepository  # noqa: E402
+
+
+class ModelBackend:
+    """Definitions that are not the stub's placeholders, so learn_term keeps new terms."""
+
+    def define(self, term):
+        return f"{term} is a term defined for the stress test."
+
+
+def worker(agent, number, operations, contested, errors, learned, barrier):
+    rng = random.Random(number)
+    own = 0
+    barrier.wait()
+    try:
+        for _ in range(operations):
+            roll = rng.random()
+            if roll < 0.6:
+                term = rng.choice(("Machine Learning", "GenAI", "Chatbot",
+                                   f"Unknown {rng.randrange(1000)}", rng.choice(contested)))
+                explanation = agent.explain_term(term)
+                assert explanation["definition"] and explanation["examples"], explanation
+            elif roll < 0.8:
+                agent.search(rng.choice(("mach", "gen", "chat", "contested", "thread")))
+            elif roll < 0.9:
+                agent.learn_term(rng.choice(contested))
+            else:
+                term = f"Thread {number} Term {own}"
+                own += 1
+                agent.learn_term(term)
+                learned.append(term)
+    except Exception as error:  # reported by the main thread
+        errors.append(error)
+
+
+def check(agent, learned):
+    """Return a list of invariant violations."""
+    problems = []
+    definitions = agent.definition_agent
+    for term in learned:
+        key = definitions.resolve_key(term)
+        stored = definitions.predefined_terms.get(key)
+        if stored is None:
+            problems.append(f"{term!r} was learned but is not curated")
+            continue
+        if key not in agent.glossary:
+            problems.append(f"{term!r} was learned but is not in the glossary")
+        if len(stored.examples) != 1:
+            problems.append(f"{term!r} has {len(stored.examples)} examples, expected 1")
+        if stored.term not in agent.search(term, limit=1):
+            problems.append(f"{term!r} is not searchable")
+        if key in definitions.generated_terms:
+            problems.append(f"{term!r} is still in the generated cache")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--operations", type=int, default=2000, help="operations per thread")
+    parser.add_argument("--contested", type=int, default=50, help="terms every thread tries to learn")
+    parser.add_argument("--database", help="SQLite database (default: in-memory repository)")
+    parser.add_argument("--switch-interval", type=float, default=1e-6,
+                        help="sys.setswitchinterval; tiny values force the thread switches that expose races")
+    args = parser.parse_args(argv)
+    sys.setswitchinterval(args.switch_interval)
+
+    if args.database and os.path.exists(args.database):
+        os.remove(args.database)
+    repository = SQLiteRepository(args.database) if args.database else None
+    agent = GlossaryAgent(repository=repository, generator=ModelBackend())
+    contested = [f"Contested Term {i}" for i in range(args.contested)]
+    errors, learned = [], []
+    barrier = threading.Barrier(args.threads + 1)
+    threads = [
+        threading.Thread(target=worker, args=(agent, number, args.operations, contested,
+                                              errors, learned, barrier))
+        for number in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # Contested terms that no thread happened to pick are never learned
+    learned += [term for term in contested
+                if agent.definition_agent.resolve_key(term) in agent.glossary]
+    problems = [repr(error) for error in errors] + check(agent, learned)
+    total = args.threads * args.operations
+    print(f"{args.threads} threads, {total:,} operations in {elapsed:.2f} s "
+          f"({total / elapsed:,.0f} ops/s), {len(learned):,} terms learned")
+    for problem in problems[:20]:
+        print(f"FAIL: {problem}")
+    if problems:
+        print(f"{len(problems)} invariant violations")
+        return 1
+    print("all invariants hold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+# suite.py
+"""Benchmark suite for the glossary agents and the Flask views, with baseline comparison.
+
+Microbenchmarks time the agents' hot paths at each --sizes glossary size;
+end-to-end runs drive the views blueprint through Flask's test client and
+through the WSGI load generator (wsgi_load.py). Each benchmark is run
+--repeat times and its median kept, so results are comparable between
+runs on the same machine.
+
+Run from the repository root:
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline results.json --tolerance 0.25
+
+With --baseline, every benchmark more than --tolerance slower than in the
+baseline file is reported and the exit status is 1.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents import create_app, views  # noqa: E402
+from ai_agents.models import ExampleAgent, GlossaryAgent, GlossaryTerm  # noqa: E402
+from wsgi_load import run_load  # noqa: E402
+
+CATEGORIES = ["Core AI", "Applications", "Advanced AI"]
+
+
+def timed(operation: Callable[[], object], number: int, repeat: int) -> float:
+    """Median seconds per call of operation over repeat runs of number calls."""
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            operation()
+        runs.append((time.perf_counter() - started) / number)
+    return statistics.median(runs)
+
+
+class ModelBackend:
+    """Definitions that are not the stub's placeholders, so learn_term keeps new terms."""
+
+    def define(self, term: str) -> str:
+        return f"{term} is a term defined for the benchmark."
+
+
+def glossary(size: int) -> GlossaryAgent:
+    """An agent with size curated terms, a tenth of them learned."""
+    agent = GlossaryAgent(generator=ModelBackend())
+    agent.definition_agent.add_terms(
+        (f"Term {i}", f"Term {i} helps a business with {CATEGORIES[i % 3].lower()} work.",
+         CATEGORIES[i % 3]) for i in range(size))
+    for i in range(0, size, 10):
+        agent.learn_term(f"Term {i}")
+    return agent
+
+
+def agent_benchmarks(size: int, number: int, repeat: int) -> Dict[str, float]:
+    agent = glossary(size)
+    definitions = agent.definition_agent
+    agent.explain_term("Generated Term")  # fills the generated cache
+    fresh = itertools.count()
+    examples = ExampleAgent()
+    results = {
+        "get_definition.curated": timed(lambda: definitions.get_definition("Term 1"), number, repeat),
+        "get_definition.generated": timed(lambda: definitions.get_definition("Generated Term"),
+                                          number, repeat),
+        "get_definition.new": timed(lambda: definitions.get_definition(f"New Term {next(fresh)}"),
+                                    number, repeat),
+        "learn_term": timed(lambda: agent.learn_term(f"Learned Term {next(fresh)}"), number, repeat),
+        "explain_term.curated": timed(lambda: agent.explain_term("Term 1"), number, repeat),
+        "explain_term.generated": timed(lambda: agent.explain_term("Generated Term"), number, repeat),
+        "generate_example": timed(
+            lambda: examples.generate_example(GlossaryTerm(f"Example Term {next(fresh)}", "")),
+            number, repeat),
+        "list_page": timed(agent.list_page, number, repeat),
+    }
+    # Lists every learned term, so it is timed fewer times at large sizes
+    results["list_terms"] = timed(agent.list_terms, max(1, number * 100 // size), repeat)
+    return {f"{name}@{size}": seconds for name, seconds in results.items()}
+
+
+def http_benchmarks(size: int, number: int, repeat: int, threads: int) -> Dict[str, float]:
+    app = create_app()
+    views.use_agent(glossary(size))
+    client = app.test_client()
+    batch = {"terms": [f"Term {i}" for i in range(0, min(size, 50))]}
+    results = {}
+    for name, path in (("home", "/"), ("term", "/term?term=Term+1"),
+                       ("autocomplete", "/autocomplete?q=term+1")):
+        for cached in (False, True):
+            app.config["PAGE_CACHE_ENABLED"] = cached
+            results[f"http.{name}{'.cached' if cached else ''}"] = timed(
+                lambda: client.get(path).close(), number, repeat)
+    app.config["PAGE_CACHE_ENABLED"] = True
+    results["http.batch"] = timed(
+        lambda: client.post("/api/terms/batch", json=batch).close(), max(1, number // 10), repeat)
+    # Seconds per request under concurrent load, so lower is better like the rest
+    load = [run_load(app, ["/", "/term?term=Term+1"], threads, number * 10)
+            for _ in range(repeat)]
+    results["wsgi_load"] = statistics.median(1 / run["requests_per_second"] for run in load)
+    return {f"{name}@{size}": seconds for name, seconds in results.items()}
+
+
+def environment() -> Dict[str, str]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    return {"python": platform.python_version(), "machine": platform.machine(),
+            "platform": platform.platform(), "commit": commit, "time": time.time()}
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Lines describing every benchmark slower than baseline by more than tolerance."""
+    regressions = []
+    for name in sorted(results.keys() & baseline.keys()):
+        ratio = results[name] / baseline[name]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {baseline[name] * 1e6:.1f} -> {results[name] * 1e6:.1f} us "
+                               f"({ratio - 1:+.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--number", type=int, default=200, help="calls per timed run")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--threads", type=int, default=4, help="WSGI load generator clients")
+    parser.add_argument("--output", help="write results as JSON here")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before a benchmark counts as a regression")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, float] = {}
+    for size in args.sizes:
+        results.update(agent_benchmarks(size, args.number, args.repeat))
+        results.update(http_benchmarks(size, args.number, args.repeat, args.threads))
+    for name, seconds in results.items():
+        print(f"{name:<40} {seconds * 1e6:12.1f} us")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump({"environment": environment(), "unit": "seconds per operation",
+                       "results": results}, stream, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print(f"{len(regressions)} of {len(results.keys() & baseline.keys())} benchmarks "
+              f"regressed by more than {args.tolerance:.0%}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# wsgi_load.py
+"""Closed-loop load generator that calls a WSGI app directly, without sockets.
+
+Each of --threads clients sends its next request as soon as the previous
+response body has been read, cycling through the given paths. Reports
+throughput, latency percentiles and status counts.
+
+Run from the repository root:
+
+    python benchmarks/wsgi_load.py --threads 8 --requests 20000 / "/term?term=Chatbot"
+"""
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from werkzeug.test import EnvironBuilder  # noqa: E402
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def run_load(app, paths: Sequence[str], threads: int = 8, requests: int = 10_000,
+             method: str = "GET", data: bytes = b"", content_type: Optional[str] = None,
+             headers: Optional[Dict[str, str]] = None) -> Dict:
+    """Send requests spread over threads to app and summarize the responses."""
+    # Environs are built once; each request gets a shallow copy with a fresh input stream
+    templates = [EnvironBuilder(path=path, method=method, data=data, content_type=content_type,
+                                headers=headers).get_environ() for path in paths]
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    lock = threading.Lock()
+    per_thread = [requests // threads + (index < requests % threads) for index in range(threads)]
+
+    def client(count: int, offset: int):
+        local_latencies = []
+        local_statuses: Counter = Counter()
+        for index in range(count):
+            environ = dict(templates[(offset + index) % len(templates)])
+            environ["wsgi.input"] = io.BytesIO(data)
+            status = []
+            started = time.perf_counter()
+            body = app(environ, lambda code, response_headers, exc_info=None: status.append(code))
+            try:
+                for _ in body:
+                    pass
+            finally:
+                if hasattr(body, "close"):
+                    body.close()
+            local_latencies.append(time.perf_counter() - started)
+            local_statuses[status[0].split()[0]] += 1
+        with lock:
+            latencies.extend(local_latencies)
+            statuses.update(local_statuses)
+
+    workers = [threading.Thread(target=client, args=(count, index))
+               for index, count in enumerate(per_thread)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "threads": threads,
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_p50": percentile(latencies, 0.50),
+        "latency_p99": percentile(latencies, 0.99),
+        "statuses": dict(statuses),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["/", "/term?term=Chatbot"])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    from ai_agents import create_app
+    result = run_load(create_app(), args.paths, args.threads, args.requests)
+    print(f"{result['requests']:,} requests on {result['threads']} threads in "
+          f"{result['seconds']:.2f} s: {result['requests_per_second']:,.0f} requests/s, "
+          f"p50 {result['latency_p50'] * 1e3:.2f} ms, p99 {result['latency_p99'] * 1e3:.2f} ms, "
+          f"statuses {result['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
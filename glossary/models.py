@@ -0,0 +1,49 @@
+from django.db import models
+
+
+class Term(models.Model):
+    """Glossary term stored by ai_agents.repository.SQLiteRepository.
+
+    The Flask app owns these tables: SQLiteRepository creates them in the
+    database its GLOSSARY_DATABASE setting names. They are readable here
+    once the Flask app has been started with GLOSSARY_DATABASE set to this
+    project's db.sqlite3; Django neither creates nor migrates them.
+    """
+    key = models.CharField(max_length=200, primary_key=True)
+    term = models.CharField(max_length=200)
+    definition = models.TextField()
+    category = models.CharField(max_length=100, db_index=True)
+    created_at = models.IntegerField()
+    learned = models.BooleanField(default=False)
+
+    class Meta:
+        # The schema is owned by the repository, which also serves the Flask app
+        managed = False
+        db_table = 'glossary_term'
+
+    def __str__(self):
+        return self.term
+
+
+class Example(models.Model):
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, db_column='term_key',
+                             related_name='examples')
+    text = models.TextField()
+
+    class Meta:
+        managed = False
+        db_table = 'glossary_example'
+        ordering = ['id']
+        unique_together = [('term', 'text')]
+
+    def __str__(self):
+        return self.text
+
+
+class Alias(models.Model):
+    alias = models.CharField(max_length=200, primary_key=True)
+    key = models.CharField(max_length=200)
+
+    class Meta:
+        managed = False
+        db_table = 'glossary_alias'
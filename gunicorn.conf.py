@@ -0,0 +1,38 @@
+# gunicorn.conf.py
+"""gunicorn settings for the Flask glossary app.
+
+    GLOSSARY_SNAPSHOT=glossary.snap gunicorn -c gunicorn.conf.py
+
+The app, and its glossary snapshot, is loaded once in the master before
+the workers are forked, so they share its memory copy-on-write instead of
+each building a copy. Workers swap in a newer snapshot when the file is
+replaced (see SNAPSHOT_RELOAD_INTERVAL).
+
+The default sync workers serve one request at a time. Clients of the
+/term/events stream, which waits for background generation, need
+gevent or threaded workers: set THREADS, or pass --worker-class gevent.
+"""
+import gc
+import os
+
+wsgi_app = "ai_agents:create_app()"
+bind = os.environ.get("BIND", "127.0.0.1:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+# More than one thread per worker switches gunicorn to gthread workers
+threads = int(os.environ.get("THREADS", 1))
+preload_app = True
+
+
+def when_ready(server):
+    from ai_agents import views
+    # Finish the related terms create_app started building, so the workers
+    # share them rather than each building its own
+    views.glossary_agent.refresh_related_terms(wait=True)
+    # The collector writes to every object it examines, which would copy
+    # shared pages into each worker; leave what the master built alone
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from ai_agents import views
+    views.glossary_agent.after_fork()
@@ -0,0 +1,39 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "benchmarks"))
+
+import suite  # noqa: E402
+
+TINY = ["--sizes", "20", "--number", "1", "--repeat", "1", "--threads", "1"]
+
+
+def test_compare_reports_only_benchmarks_slower_than_tolerance():
+    baseline = {"fast": 1e-3, "steady": 1e-3, "slow": 1e-3, "removed": 1e-3}
+    results = {"fast": 0.5e-3, "steady": 1.2e-3, "slow": 2e-3, "added": 5e-3}
+    assert suite.compare(results, baseline, 0.25) == ["slow: 1000.0 -> 2000.0 us (+100%)"]
+
+
+def test_results_are_written_as_json(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    assert suite.main(TINY + ["--output", str(output)]) == 0
+    written = json.loads(output.read_text())
+    assert written["unit"] == "seconds per operation"
+    assert {"python", "commit", "time"} <= written["environment"].keys()
+    assert "get_definition.curated@20" in written["results"]
+    assert "http.home.cached@20" in written["results"]
+    assert all(seconds > 0 for seconds in written["results"].values())
+
+
+def test_regressions_against_a_baseline_fail_the_run(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {"list_page@20": 1e-12, "unknown@20": 1.0}}))
+    assert suite.main(TINY + ["--baseline", str(baseline)]) == 1
+    out = capsys.readouterr().out
+    assert "REGRESSION list_page@20:" in out
+    assert "1 of 1 benchmarks regressed" in out
+
+    baseline.write_text(json.dumps({"results": {"list_page@20": 1.0}}))
+    assert suite.main(TINY + ["--baseline", str(baseline)]) == 0
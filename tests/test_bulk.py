@@ -0,0 +1,43 @@
+import io
+import json
+
+import pytest
+
+from ai_agents.bulk import export_terms, import_terms
+from ai_agents.models import DefinitionAgent
+from ai_agents.repository import MemoryRepository, SQLiteRepository
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def agent(request, tmp_path):
+    if request.param == "memory":
+        yield DefinitionAgent(repository=MemoryRepository())
+    else:
+        repository = SQLiteRepository(str(tmp_path / "glossary.db"))
+        yield DefinitionAgent(repository=repository)
+        repository.close()
+
+
+def test_import_jsonl(agent):
+    lines = [{"term": "RAG", "definition": "Retrieval augmented generation.",
+              "category": "Advanced AI", "examples": ["First.", "Second."]},
+             {"term": "", "definition": "No term."},
+             {"term": "Embedding", "definition": "A vector for a piece of text."}]
+    stream = io.StringIO("\n".join(json.dumps(line) for line in lines) + "\nnot json\n")
+    rejects = io.StringIO()
+    stats = import_terms(agent, stream, "jsonl", batch_size=1, rejects=rejects)
+    assert (stats.read, stats.imported, stats.examples, stats.rejected) == (4, 2, 2, 2)
+    assert agent.predefined_terms["rag"].examples == ("First.", "Second.")
+    assert agent.predefined_terms["embedding"].category == "General AI"
+    assert [json.loads(line)["line"] for line in rejects.getvalue().splitlines()] == [2, 4]
+
+
+def test_import_csv_and_export(agent):
+    stream = io.StringIO("term,definition,category,examples\n"
+                         'RAG,Retrieval augmented generation.,Advanced AI,"First.\nSecond."\n')
+    import_terms(agent, stream, "csv")
+    output = io.StringIO()
+    export_terms(agent.repository, output, "jsonl")
+    records = {record["term"]: record for record in map(json.loads, output.getvalue().splitlines())}
+    assert records["RAG"]["examples"] == ["First.", "Second."]
+    assert "Machine Learning" in records
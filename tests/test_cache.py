@@ -0,0 +1,79 @@
+import pytest
+
+from ai_agents.cache import LFUCache, LRUCache
+from ai_agents.models import DefinitionAgent
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    evicted = []
+    cache.eviction_listeners.append(evicted.append)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert evicted == ["b"]
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lfu_evicts_least_frequently_used_oldest_first():
+    cache = LFUCache(max_size=3)
+    for key in "abc":
+        cache.put(key, key)
+    cache.get("a")
+    cache.get("c")
+    cache.put("d", "d")
+    assert "b" not in cache
+    cache.put("e", "e")
+    # d and e were used once each; d is older
+    assert "d" not in cache
+    assert sorted(cache._entries) == ["a", "c", "e"]
+
+
+def test_lfu_pop_keeps_the_minimum_frequency():
+    cache = LFUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("b")
+    assert cache.pop("a") == 1
+    cache.put("c", 3)
+    cache.put("d", 4)
+    assert "b" in cache and "c" not in cache
+
+
+@pytest.mark.parametrize("cache_class", [LRUCache, LFUCache])
+def test_entries_expire_after_ttl(cache_class):
+    clock = Clock()
+    cache = cache_class(ttl=10.0, clock=clock)
+    cache.put("a", 1)
+    clock.now = 9.0
+    assert cache.get("a") == 1
+    clock.now = 10.0
+    assert "a" not in cache
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_max_size_must_be_positive():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
+
+
+def test_generated_terms_are_bounded():
+    agent = DefinitionAgent(generated_cache=LRUCache(max_size=2))
+    for term in ("Blorf", "Zap", "Quux"):
+        agent.get_definition(term)
+    assert len(agent.generated_terms) == 2
+    assert "blorf" not in agent.generated_terms
+    assert "machine learning" in agent.predefined_terms
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from ai_agents.concurrency import RWLock, SingleFlight
+from ai_agents.models import DefinitionAgent
+from ai_agents.repository import SQLiteFlight, SQLiteRepository
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5.0)
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def generate():
+        calls.append(1)
+        started.set()
+        release.wait(5.0)
+        return "value"
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("rag", generate)))
+    leader.start()
+    started.wait(5.0)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("rag", generate)))
+                 for _ in range(4)]
+    for follower in followers:
+        follower.start()
+    while flight.stats()["shared"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5.0)
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 1, "shared": 4, "in_flight": 0}
+
+
+def test_single_flight_shares_exceptions_and_forgets_the_key():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("model unavailable")
+
+    with pytest.raises(RuntimeError):
+        flight.do("rag", fail)
+    assert flight.do("rag", lambda: "retried") == "retried"
+
+
+def test_rwlock_writer_reenters_and_reads():
+    lock = RWLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        pass
+
+
+def test_rwlock_excludes_readers_while_writing():
+    lock = RWLock()
+    events = []
+
+    def reader():
+        with lock.read():
+            events.append("read")
+
+    with lock.write():
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        events.append("written")
+    thread.join(5.0)
+    assert events == ["written", "read"]
+
+
+def test_concurrent_definitions_generate_once():
+    class CountingBackend:
+        calls = 0
+
+        def define(self, term):
+            CountingBackend.calls += 1
+            time.sleep(0.05)
+            return f"{term} is a term a model defined."
+
+    agent = DefinitionAgent(generator=CountingBackend())
+    run_threads(8, lambda: agent.get_definition("Blorf"))
+    assert CountingBackend.calls == 1
+
+
+def test_sqlite_flight_reuses_a_stored_result(tmp_path):
+    path = str(tmp_path / "glossary.db")
+    first, second = SQLiteRepository(path), SQLiteRepository(path)
+    try:
+        assert SQLiteFlight(first).do("rag", lambda: "generated") == "generated"
+        other = SQLiteFlight(second)
+        assert other.do("rag", lambda: "generated again") == "generated"
+        assert (other.generated, other.shared) == (0, 1)
+    finally:
+        first.close()
+        second.close()
+
+
+def test_claim_binds_a_key_once(tmp_path):
+    repository = SQLiteRepository(str(tmp_path / "glossary.db"))
+    try:
+        agent = DefinitionAgent(repository=repository)
+        term = agent.predefined_terms["chatbot"]
+        assert repository.learned.claim("chatbot", term)
+        assert not repository.learned.claim("chatbot", term)
+    finally:
+        repository.close()
@@ -0,0 +1,68 @@
+import os
+
+from ai_agents.file_tools import DirectoryReadTool, FileCache, FileReadTool, InstructionIndex
+
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write(text)
+
+
+def test_cache_rereads_only_changed_files(tmp_path):
+    path = str(tmp_path / "notes.txt")
+    write(path, "first")
+    cache = FileCache()
+    assert cache.read(path) == "first"
+    assert cache.read(path) == "first"
+    write(path, "second version")
+    assert cache.read(path) == "second version"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_large_files_are_decoded_from_a_mapping(tmp_path):
+    path = str(tmp_path / "big.txt")
+    write(path, "é" * 600)
+    cache = FileCache(mmap_threshold=1000)
+    assert cache.read(path) == "é" * 600
+    assert cache.mapped == 1
+
+
+def test_cache_evicts_least_recently_read(tmp_path):
+    paths = [str(tmp_path / f"{name}.txt") for name in "abc"]
+    for path in paths:
+        write(path, "x" * 40)
+    cache = FileCache(max_bytes=100)
+    for path in paths:
+        cache.read(path)
+    assert cache.signature(paths[0]) is None
+    assert cache.signature(paths[2]) is not None
+    assert cache.stats()["bytes"] == 80
+
+
+def test_directory_listing_follows_new_files(tmp_path):
+    write(str(tmp_path / "a.md"), "a")
+    directory = DirectoryReadTool(str(tmp_path), pattern="*.md")
+    assert directory.files() == [str(tmp_path / "a.md")]
+    assert directory.files() == [str(tmp_path / "a.md")]
+    write(str(tmp_path / "b.md"), "b")
+    # A coarse filesystem clock may not tick within the test
+    os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 10 ** 9))
+    assert directory.files() == [str(tmp_path / "a.md"), str(tmp_path / "b.md")]
+    assert directory.stats() == {"files": 2, "scans": 2, "hits": 1}
+
+
+def test_file_read_tool_reports_missing_files(tmp_path):
+    assert FileReadTool()._run(str(tmp_path / "missing.txt")).startswith("Failed to read")
+
+
+def test_index_finds_passages_and_reindexes_changes(tmp_path):
+    path = str(tmp_path / "followup.md")
+    write(path, "Follow up after a demo within two days.\n\nAsk about pricing last.")
+    index = InstructionIndex(DirectoryReadTool(str(tmp_path)))
+    assert [passage.line for passage in index.search("demo follow up", k=1)] == [1]
+    assert index.search("pricing", k=1)[0].line == 3
+    write(path, "Send the pricing sheet first.")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10 ** 9))
+    assert index.search("pricing")[0].text == "Send the pricing sheet first."
+    assert index.search("demo") == []
+    assert index.reindexed == 2
@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+
+from ai_agents.generation import BatchingGenerator, GeneratorBackend, StubBackend, create_backend
+
+
+class RecordingBackend(GeneratorBackend):
+    """Records each batch and holds it until released."""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+
+    def generate(self, terms):
+        self.release.wait(5.0)
+        self.batches.append(list(terms))
+        return [f"{term} defined" for term in terms]
+
+
+class FailingBackend(GeneratorBackend):
+    def generate(self, terms):
+        raise RuntimeError("model unavailable")
+
+
+def test_stub_backend_is_deterministic():
+    backend = create_backend("stub")
+    assert isinstance(backend, StubBackend)
+    assert backend.define("RAG") == backend.generate(["RAG"])[0]
+    assert "placeholder" in backend.define("RAG")
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        create_backend("nope")
+
+
+def test_concurrent_requests_share_a_batch():
+    backend = RecordingBackend()
+    generator = BatchingGenerator(backend, max_batch_size=4, max_wait=0.5)
+    futures = [generator.submit(term) for term in ("a", "b", "a", "c", "d")]
+    backend.release.set()
+    assert [future.result(5.0) for future in futures] == [
+        "a defined", "b defined", "a defined", "c defined", "d defined"]
+    generator.close()
+    assert backend.batches == [["a", "b", "c", "d"]]
+    assert generator.stats() == {"requests": 5, "batches": 1, "mean_batch_size": 5.0}
+
+
+def test_batches_are_bounded_and_drained_on_close():
+    backend = RecordingBackend()
+    generator = BatchingGenerator(backend, max_batch_size=2, max_wait=0.0)
+    futures = [generator.submit(term) for term in "abcde"]
+    backend.release.set()
+    generator.close()
+    assert all(future.done() for future in futures)
+    assert all(len(batch) <= 2 for batch in backend.batches)
+    assert sorted(term for batch in backend.batches for term in batch) == list("abcde")
+    with pytest.raises(RuntimeError):
+        generator.submit("f")
+
+
+def test_backend_errors_reach_every_caller():
+    generator = BatchingGenerator(FailingBackend(), max_wait=0.0)
+    with pytest.raises(RuntimeError, match="model unavailable"):
+        generator.define("a", timeout=5.0)
+    generator.close()
@@ -0,0 +1,143 @@
+import time
+
+import pytest
+
+from ai_agents.jobs import HIGH, LOW, NORMAL, JobQueue
+from ai_agents.repository import SQLiteRepository
+
+
+class Recorder:
+    """on_done callback that records finished keys, failing the first few calls."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.done = []
+
+    def __call__(self, key, term, definition):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("store unavailable")
+        self.done.append(key)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = SQLiteRepository(str(tmp_path / "glossary.db"))
+    yield repository
+    repository.close()
+
+
+def busy_queue(recorder, **options):
+    """A one-worker queue whose worker is busy with "first" for a while."""
+    queue = JobQueue(recorder, workers=1, processes=False,
+                     backend_options={"batch_latency": 0.3}, **options)
+    queue.submit("first", "First")
+    time.sleep(0.1)
+    return queue
+
+
+def test_failed_jobs_are_retried_with_backoff():
+    recorder = Recorder(failures=2)
+    queue = JobQueue(recorder, workers=1, processes=False, retry_delay=0.05)
+    try:
+        started = time.monotonic()
+        assert queue.submit("rag", "RAG")
+        assert queue.wait("rag", 5.0)
+        assert time.monotonic() - started >= 0.05 + 0.1
+        assert recorder.done == ["rag"]
+        stats = queue.stats()
+        assert (stats["retried"], stats["completed"], stats["failed"]) == (2, 1, 0)
+    finally:
+        queue.close()
+
+
+def test_exhausted_jobs_cool_down_before_resubmission():
+    queue = JobQueue(Recorder(failures=10), workers=1, processes=False, max_attempts=2,
+                     retry_delay=0.01, failure_cooldown=0.2)
+    try:
+        assert queue.submit("rag", "RAG")
+        assert queue.wait("rag", 5.0)
+        assert queue.stats()["failed"] == 1
+        assert not queue.submit("rag", "RAG")
+        assert not queue.pending("rag")
+        time.sleep(0.2)
+        assert queue.submit("rag", "RAG")
+    finally:
+        queue.close()
+
+
+def test_expired_failures_are_forgotten():
+    queue = JobQueue(Recorder(failures=10), workers=1, processes=False, max_attempts=1,
+                     failure_cooldown=0.05)
+    try:
+        queue.submit("rag", "RAG")
+        assert queue.wait("rag", 5.0)
+        time.sleep(0.1)
+        queue.submit("llm", "LLM")
+        assert queue.wait("llm", 5.0)
+        assert list(queue._failed) == ["llm"]
+    finally:
+        queue.close()
+
+
+def test_jobs_run_in_priority_order():
+    recorder = Recorder()
+    queue = busy_queue(recorder)
+    try:
+        assert queue.submit("low", "Low", LOW)
+        assert queue.submit("normal", "Normal", NORMAL)
+        assert queue.submit("high", "High", HIGH)
+        assert queue.submit("low", "Low", HIGH)
+        assert not queue.submit("normal", "Normal", LOW)
+        for key in ("first", "low", "normal", "high"):
+            assert queue.wait(key, 5.0)
+        assert recorder.done == ["first", "high", "low", "normal"]
+    finally:
+        queue.close()
+
+
+def test_full_queue_rejects_new_keys():
+    queue = busy_queue(Recorder(), max_queued=2)
+    try:
+        assert queue.submit("rag", "RAG")
+        assert queue.submit("llm", "LLM")
+        assert not queue.submit("nlp", "NLP")
+        assert not queue.pending("nlp")
+        # Jobs already waiting can still move up
+        assert queue.submit("llm", "LLM", HIGH)
+        assert queue.stats()["rejected"] == 1
+    finally:
+        queue.close()
+
+
+def test_queued_jobs_survive_a_restart(repository):
+    queue = busy_queue(Recorder(), table=repository.jobs)
+    queue.submit("llm", "LLM", LOW)
+    queue.submit("rag", "RAG", HIGH)
+    queue.close()
+    assert [row[:3] for row in repository.jobs.pending()] == [("rag", "RAG", HIGH),
+                                                              ("llm", "LLM", LOW)]
+
+    recorder = Recorder()
+    restarted = JobQueue(recorder, workers=1, processes=False, table=repository.jobs)
+    try:
+        assert restarted.wait("rag", 5.0) and restarted.wait("llm", 5.0)
+        assert recorder.done == ["rag", "llm"]
+        assert repository.jobs.pending() == []
+    finally:
+        restarted.close()
+
+
+def test_exhausted_jobs_are_recorded_and_not_restored(repository):
+    queue = JobQueue(Recorder(failures=10), workers=1, processes=False, table=repository.jobs,
+                     max_attempts=2, retry_delay=0.01)
+    queue.submit("rag", "RAG")
+    assert queue.wait("rag", 5.0)
+    queue.close()
+    assert [row[:3] for row in repository.jobs.failed()] == [("rag", "RAG", 2)]
+
+    restarted = JobQueue(Recorder(), workers=1, processes=False, table=repository.jobs)
+    try:
+        assert not restarted.pending("rag")
+    finally:
+        restarted.close()
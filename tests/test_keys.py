@@ -0,0 +1,52 @@
+import sys
+
+import pytest
+
+from ai_agents.keys import AliasTable, canonical_key
+from ai_agents.models import GlossaryAgent
+
+
+def test_canonical_key_normalizes_case_width_and_whitespace():
+    assert canonical_key("  Machine \t Learning ") == "machine learning"
+    assert canonical_key("MACHINE LEARNING") == "machine learning"
+    assert canonical_key("ｍachine learning") == "machine learning"
+    assert canonical_key("Straße") == "strasse"
+
+
+def test_keys_are_interned_only_when_stored():
+    stored = sys.intern(f"probe {id(object())}")
+    assert canonical_key(stored.upper()) is not stored
+    aliases = AliasTable()
+    aliases.add(stored.upper(), "Chatbot")
+    assert next(iter(aliases)) is stored
+
+
+def test_aliases_resolve_in_one_hop():
+    aliases = AliasTable()
+    aliases.add("GenAI", "Generative AI")
+    aliases.add("Gen AI Models", "GenAI")
+    assert aliases.resolve("gen ai models") == "generative ai"
+    aliases.add("Generative AI", "Creative AI")
+    assert aliases.resolve("genai") == "creative ai"
+    assert aliases.resolve("gen ai models") == "creative ai"
+
+
+def test_alias_to_itself_is_ignored():
+    aliases = AliasTable()
+    aliases.add("Chatbot", "chatbot")
+    assert len(aliases) == 0
+
+
+def test_spellings_share_one_entry():
+    agent = GlossaryAgent()
+    agent.learn_term("machine learning")
+    agent.learn_term("MACHINE  LEARNING")
+    agent.learn_term("ML")
+    assert agent.list_terms() == ["Machine Learning"]
+    assert len(agent.glossary["machine learning"].examples) == 1
+
+
+def test_alias_cannot_shadow_a_curated_term():
+    agent = GlossaryAgent()
+    with pytest.raises(ValueError):
+        agent.definition_agent.add_alias("Chatbot", "Machine Learning")
@@ -0,0 +1,58 @@
+from ai_agents.listing import TermListing
+from ai_agents.models import GlossaryAgent
+
+TERMS = [
+    ("chatbot", "Chatbot", "Applications"),
+    ("agent", "Agent", "Applications"),
+    ("embedding", "Embedding", "Advanced AI"),
+    ("bias", "Bias", "Ethics"),
+    ("dataset", "Dataset", "Advanced AI"),
+]
+
+
+def test_pages_follow_cursors_to_the_end():
+    listing = TermListing(TERMS)
+    names, cursor = listing.page(limit=2)
+    assert (names, cursor) == (["Agent", "Bias"], "bias")
+    names, cursor = listing.page(after=cursor, limit=2)
+    assert (names, cursor) == (["Chatbot", "Dataset"], "dataset")
+    names, cursor = listing.page(after=cursor, limit=2)
+    assert (names, cursor) == (["Embedding"], None)
+
+
+def test_last_full_page_has_no_next_cursor():
+    assert TermListing(TERMS).page(limit=5) == (["Agent", "Bias", "Chatbot", "Dataset", "Embedding"], None)
+
+
+def test_cursor_stays_valid_while_terms_are_added():
+    listing = TermListing(TERMS)
+    _, cursor = listing.page(limit=2)
+    listing.add("attention", "Attention", "Advanced AI")
+    listing.add("blorf", "Blorf", "Other")
+    assert listing.page(after=cursor, limit=2) == (["Blorf", "Chatbot"], "chatbot")
+
+
+def test_category_pages_and_counts():
+    listing = TermListing(TERMS)
+    assert listing.page("Advanced AI") == (["Dataset", "Embedding"], None)
+    assert listing.page("Unknown") == ([], None)
+    assert listing.categories() == [("Advanced AI", 2), ("Applications", 2), ("Ethics", 1)]
+
+
+def test_changing_a_category_moves_the_term():
+    listing = TermListing(TERMS)
+    listing.add("bias", "Bias", "Advanced AI")
+    assert listing.page("Advanced AI")[0] == ["Bias", "Dataset", "Embedding"]
+    assert ("Ethics", 1) not in listing.categories()
+    assert len(listing) == 5
+
+
+def test_agent_pages_learned_terms():
+    agent = GlossaryAgent()
+    agent.learn_starter_terms()
+    first = agent.list_page(limit=1)
+    assert first["terms"] == ["Generative AI"]
+    second = agent.list_page(after=first["next"], limit=1)
+    assert second == {"terms": ["Machine Learning"], "next": None, "category": None}
+    agent.learn_term("Chatbot")
+    assert "Chatbot" in agent.list_page(limit=100)["terms"]
@@ -0,0 +1,67 @@
+from ai_agents.metrics import Histogram, Metrics
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    cumulative, total, count = histogram.snapshot()
+    assert cumulative == [2, 3, 4]
+    assert total == 2.65
+    assert count == 4
+
+
+def test_render_histograms_with_help_and_labels():
+    metrics = Metrics()
+    metrics.describe("request_seconds", "Time per request.")
+    metrics.observe("request_seconds", 0.002, route="/", method="GET")
+    with metrics.timer("request_seconds", route="/term", method="GET"):
+        pass
+    text = metrics.render()
+    assert "# HELP request_seconds Time per request.\n# TYPE request_seconds histogram\n" in text
+    assert 'request_seconds_bucket{method="GET",route="/",le="0.0025"} 1\n' in text
+    assert 'request_seconds_bucket{method="GET",route="/",le="0.001"} 0\n' in text
+    assert 'request_seconds_count{method="GET",route="/term"} 1\n' in text
+
+
+def test_label_values_are_escaped():
+    metrics = Metrics()
+    metrics.observe("seconds", 1.0, route='a"b\\c\nd')
+    assert 'seconds_count{route="a\\"b\\\\c\\nd"} 1\n' in metrics.render()
+
+
+def test_gauges_are_read_at_render_time():
+    metrics = Metrics()
+    sizes = {"curated": 1}
+    metrics.gauge("terms", "Terms by set.", lambda: {(("set", key),): value
+                                                      for key, value in sizes.items()})
+    metrics.gauge("queued", "Jobs waiting.", lambda: 3)
+    sizes["curated"] = 7
+    text = metrics.render()
+    assert 'terms{set="curated"} 7.0\n' in text
+    assert "# TYPE queued gauge\nqueued 3.0\n" in text
+
+
+def test_broken_gauge_is_skipped():
+    metrics = Metrics()
+    metrics.gauge("broken", "Fails.", lambda: 1 / 0)
+    metrics.gauge("fine", "Works.", lambda: 1)
+    text = metrics.render()
+    assert "broken" not in text
+    assert "fine 1.0\n" in text
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    metrics.observe("seconds", 1.0)
+    with metrics.timer("seconds"):
+        pass
+    assert metrics.render() == ""
+
+
+def test_clear_keeps_gauges():
+    metrics = Metrics()
+    metrics.observe("seconds", 1.0)
+    metrics.gauge("queued", "Jobs waiting.", lambda: 0)
+    metrics.clear()
+    assert metrics.render() == "# HELP queued Jobs waiting.\n# TYPE queued gauge\nqueued 0.0\n"
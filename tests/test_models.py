@@ -0,0 +1,187 @@
+import time
+
+from ai_agents.generation import BatchingGenerator, StubBackend
+from ai_agents.models import ExampleAgent, GlossaryAgent, GlossaryTerm
+
+
+class ModelBackend:
+    """Stands in for a real model: definitions that are not the stub's placeholder."""
+
+    def define(self, term):
+        return f"{term} is a term a model defined."
+
+
+def test_explain_curated_and_alias():
+    agent = GlossaryAgent()
+    explanation = agent.explain_term("ML")
+    assert explanation["term"] == "Machine Learning"
+    assert explanation["category"] == "Core AI"
+    assert explanation["examples"]
+    assert explanation["suggestions"] == []
+
+
+def test_explain_unknown_term_does_not_learn_it():
+    agent = GlossaryAgent()
+    explanation = agent.explain_term("Blorf")
+    assert explanation["category"] == "Unclassified"
+    assert "blorf" not in agent.definition_agent.predefined_terms
+    assert "blorf" not in agent.glossary
+
+
+def test_learn_curated_term():
+    agent = GlossaryAgent()
+    learned = agent.learn_term("Machine Learning")
+    assert agent.list_terms() == ["Machine Learning"]
+    assert len(learned.examples) == 1
+    agent.learn_term("ml")
+    assert len(agent.glossary["machine learning"].examples) == 1
+
+
+def test_placeholder_definitions_are_not_learned():
+    agent = GlossaryAgent()
+    learned = agent.learn_term("blorf zap")
+    assert agent.definition_agent.is_placeholder(learned)
+    assert "blorf zap" not in agent.definition_agent.predefined_terms
+    assert "blorf zap" not in agent.glossary
+    agent.related_terms
+    assert "Blorf Zap" not in agent.related("Machine Learning", k=10)
+
+
+def test_model_definitions_are_learned():
+    agent = GlossaryAgent(generator=ModelBackend())
+    learned = agent.learn_term("blorf zap")
+    assert not agent.definition_agent.is_placeholder(learned)
+    assert agent.glossary["blorf zap"].definition == "Blorf Zap is a term a model defined."
+    assert agent.search("blorf") == ["Blorf Zap"]
+
+
+def test_max_terms_bounds_learned_generated_terms():
+    agent = GlossaryAgent(generator=ModelBackend())
+    agent.max_terms = len(agent.definition_agent.predefined_terms) + 1
+    agent.learn_term("First New Term")
+    agent.learn_term("Second New Term")
+    agent.learn_term("Chatbot")
+    assert agent.list_terms() == ["First New Term", "Chatbot"]
+
+
+def test_is_placeholder():
+    agent = GlossaryAgent()
+    definitions = agent.definition_agent
+    stub = GlossaryTerm("Blorf", StubBackend().define("Blorf"), "Unclassified")
+    assert definitions.is_placeholder(stub)
+    assert definitions.is_placeholder(definitions.placeholder("blorf"))
+    assert not definitions.is_placeholder(GlossaryTerm("Blorf", "Real.", "Unclassified"))
+    assert not definitions.is_placeholder(definitions.lookup("chatbot"))
+
+
+def test_related_terms_are_built_off_the_request_path():
+    agent = GlossaryAgent()
+    with agent.lock.read():
+        # Requests only start the build; they never wait for it under the lock
+        term = agent.definition_agent.lookup("machine learning")
+        assert agent._related("machine learning", term, True, 5) == []
+    agent.refresh_related_terms(wait=True)
+    assert agent.explain_term("Machine Learning")["related"] == ["Generative AI"]
+
+
+def test_bulk_loads_update_related_terms_in_place():
+    agent = GlossaryAgent()
+    engine = agent.related_terms
+    agent.definition_agent.add_terms([
+        ("Deep Learning", "Machine learning with neural networks that learn from data.", "Core AI"),
+    ])
+    # The built terms keep being served while the new one is added to a copy
+    assert agent._related_terms is not None
+    agent.refresh_related_terms(wait=True)
+    assert agent._related_terms is not engine
+    assert "Deep Learning" not in engine.related("machine learning")
+    assert agent.related("Machine Learning")[0] == "Deep Learning"
+    assert "Machine Learning" in agent.related("Deep Learning")
+
+
+class SlowBackend:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def define(self, term):
+        time.sleep(self.delay)
+        return f"{term} is a term a slow model defined."
+
+
+def test_explain_terms_dedupes_and_yields_known_terms_first():
+    agent = GlossaryAgent(generator=ModelBackend())
+    results = list(agent.explain_terms(["Blorf", "ML", "machine learning", "Chatbot", "BLORF"]))
+    assert [result["query"] for result in results] == ["ML", "Chatbot", "Blorf"]
+    assert results[0]["term"] == "Machine Learning"
+    assert results[2]["definition"] == "Blorf is a term a model defined."
+
+
+def test_explain_terms_times_out_slow_generations():
+    agent = GlossaryAgent(generator=SlowBackend(1.0))
+    results = list(agent.explain_terms(["Chatbot", "Blorf"], deadline=0.05))
+    assert results[0]["term"] == "Chatbot"
+    assert results[1] == {"query": "Blorf", "error": "timed out"}
+
+
+def test_examples_are_deterministic_per_seed():
+    term = GlossaryTerm("Vector Database", "A database of embeddings.")
+    assert ExampleAgent().pool(term) == ExampleAgent().pool(term)
+    assert sorted(ExampleAgent(seed=1).pool(term)) == sorted(ExampleAgent().pool(term))
+    pools = [ExampleAgent(seed=seed).pool(term)[0] for seed in range(10)]
+    assert len(set(pools)) > 1
+
+
+def test_compose_examples_matches_each_pool():
+    examples = ExampleAgent()
+    terms = [GlossaryTerm(name, "") for name in ("RAG", "Chatbot", "Embedding")]
+    assert examples.compose_examples(terms, 2) == [examples.pool(term)[:2] for term in terms]
+
+
+def test_generated_examples_are_distinct_and_bounded():
+    examples = ExampleAgent(max_examples=3)
+    term = GlossaryTerm("Chatbot", "")
+    added = [examples.generate_example(term) for _ in range(5)]
+    assert added[3:] == [None, None]
+    assert term.examples == examples.pool(term)[:3]
+    assert not examples.accepts(term, "A new example.")
+
+
+def test_add_example_rejects_duplicates():
+    agent = GlossaryAgent()
+    agent.learn_starter_terms()
+    example = agent.glossary["machine learning"].examples[0]
+    assert not agent.add_example("ML", example)
+    assert agent.add_example("ML", "Forecasting demand for a bakery.")
+    assert agent.glossary["machine learning"].examples.count(example) == 1
+
+
+def test_warm_examples_fills_every_term_up_to_count():
+    agent = GlossaryAgent()
+    agent.learn_starter_terms()
+    added = agent.warm_examples(3)
+    # Learning a term already gave it its first example
+    assert added == 2 * len(agent.glossary)
+    for term in agent.glossary.values():
+        assert term.examples == tuple(agent.example_agent.pool(term)[:3])
+    assert agent.warm_examples(3) == 0
+
+
+def test_after_fork_replaces_inherited_threads():
+    generator = BatchingGenerator(StubBackend(), max_batch_size=4)
+    agent = GlossaryAgent(generator=generator)
+    inherited = agent.start_jobs(workers=1, processes=False)
+    try:
+        agent.after_fork()
+        assert agent.jobs is not inherited
+        assert agent.definition_agent.generator is not generator
+        assert agent.definition_agent.generator.max_batch_size == 4
+        assert agent.definition_agent.get_definition("Zap").term == "Zap"
+        agent.explain_term("Blorf")
+        # The restarted queue keeps the options the inherited one was started with
+        assert agent.jobs.wait("blorf", 5.0)
+        assert not agent.explain_term("Blorf")["pending"]
+    finally:
+        inherited.close()
+        agent.jobs.close()
+        generator.close()
+        agent.definition_agent.generator.close()
@@ -0,0 +1,76 @@
+from ai_agents.cache import LFUCache, LRUCache
+from ai_agents.page_cache import PageCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_put_and_get():
+    cache = PageCache()
+    cache.put("term", "rag", "<p>RAG</p>")
+    assert cache.get("term", "rag").body == b"<p>RAG</p>"
+    assert cache.get("term", "other") is None
+
+
+def test_invalidate_drops_the_page_and_home():
+    cache = PageCache()
+    cache.put("term", "rag", "old")
+    cache.put("home", PageCache.HOME, "listing")
+    cache.invalidate("rag")
+    assert cache.get("term", "rag") is None
+    assert cache.get("home", PageCache.HOME) is None
+
+
+def test_invalidate_without_home():
+    cache = PageCache()
+    cache.put("home", PageCache.HOME, "listing")
+    cache.invalidate("rag", home=False)
+    assert cache.get("home", PageCache.HOME) is not None
+
+
+def test_render_from_before_an_invalidation_is_not_stored():
+    cache = PageCache()
+    version = cache.version("rag")
+    cache.invalidate("rag")
+    cache.put("term", "rag", "stale", version)
+    assert cache.get("term", "rag") is None
+
+
+def test_versions_older_than_ttl_are_pruned():
+    clock = Clock()
+    cache = PageCache(ttl=300.0, clock=clock)
+    for number in range(1000):
+        cache.invalidate(f"term {number}")
+    assert cache.stats()["versions"] == 1001
+    clock.now = 301.0
+    cache.invalidate("latest")
+    assert cache.stats()["versions"] == 2
+    # Pages cached before the pruned invalidations have expired
+    cache.put("term", "term 1", "fresh")
+    assert cache.get("term", "term 1").body == b"fresh"
+
+
+def test_versions_without_ttl_are_bounded():
+    cache = PageCache(ttl=None, max_versions=10)
+    cache.put("term", "rag", "page")
+    for number in range(20):
+        cache.invalidate(f"term {number}")
+    assert cache.stats()["versions"] <= 11
+    assert cache.get("term", "rag") is None
+
+
+def test_eviction_listeners():
+    for cache in (LRUCache(max_size=2), LFUCache(max_size=2)):
+        evicted = []
+        cache.eviction_listeners.append(evicted.append)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.pop("b")
+        cache.put("c", 3)
+        cache.put("d", 4)
+        assert evicted == ["a"]
@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from ai_agents.pipeline import (INPUTS, Pipeline, StubLLM, StubSearchTool, Task,
+                                outreach_pipeline)
+
+
+def test_diamond_joins_results_per_item():
+    pipeline = Pipeline([
+        Task("split", lambda text: text.split(), fan_out=True),
+        Task("upper", str.upper, ["split"], workers=3),
+        Task("length", len, ["split"]),
+        Task("join", lambda results: f"{results['upper']}:{results['length']}",
+             ["upper", "length"], workers=2),
+    ], queue_size=2)
+    results = {result.key: result.value for result in pipeline.run(["a bb", "ccc"])}
+    assert results == {(0, 0): "A:1", (0, 1): "BB:2", (1, 0): "CCC:3"}
+    assert pipeline.stats()["join"] == {"processed": 3, "failed": 0}
+
+
+def test_failed_items_are_reported_and_go_no_further():
+    pipeline = Pipeline([Task("invert", lambda n: 1 / n), Task("double", lambda x: 2 * x, ["invert"])])
+    results = sorted(pipeline.run([1, 0, 4]), key=lambda result: result.key)
+    assert [(result.task, result.key) for result in results] == [
+        ("double", (0,)), ("invert", (1,)), ("double", (2,))]
+    assert isinstance(results[1].error, ZeroDivisionError)
+    assert results[2].value == 0.5
+
+
+def test_failing_inputs_end_the_run():
+    def inputs():
+        yield 1
+        yield 2
+        raise OSError("lost the connection")
+
+    results = list(Pipeline([Task("double", lambda x: 2 * x)]).run(inputs()))
+    assert sorted(result.value for result in results if result.error is None) == [2, 4]
+    failed = [result for result in results if result.error is not None]
+    assert [(result.task, result.key) for result in failed] == [(INPUTS, (2,))]
+    assert isinstance(failed[0].error, OSError)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_worker_killed_by_a_base_exception_still_closes_downstream():
+    def run(item):
+        if item == "stop":
+            raise KeyboardInterrupt
+        return item
+
+    pipeline = Pipeline([Task("first", run), Task("second", str.upper, ["first"])])
+    finished = []
+    thread = threading.Thread(target=lambda: finished.extend(pipeline.run(["a", "stop"])),
+                              daemon=True)
+    thread.start()
+    thread.join(5.0)
+    assert not thread.is_alive()
+    assert [result.value for result in finished] == ["A"]
+    # Let the killed worker finish unwinding, so its exception is reported in this test
+    for worker in threading.enumerate():
+        if worker.name.startswith("pipeline-first"):
+            worker.join(5.0)
+
+
+def test_cycles_and_unknown_dependencies_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        Pipeline([Task("a", str, ["b"]), Task("b", str, ["a"])])
+    with pytest.raises(ValueError, match="unknown"):
+        Pipeline([Task("a", str, ["missing"])])
+
+
+def test_outreach_pipeline_prepares_a_message_per_lead():
+    pipeline = outreach_pipeline(StubLLM(), StubSearchTool(results=3), research_workers=2,
+                                 outreach_workers=2, queue_size=4)
+    results = list(pipeline.run(["fintech", "retail"]))
+    assert len(results) == 6
+    assert all(result.error is None and result.value["message"] for result in results)
+    assert {result.value["sentiment"] for result in results} <= {"Positive", "Negative", "Neutral"}
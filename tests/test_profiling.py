@@ -0,0 +1,79 @@
+import threading
+import time
+
+from ai_agents.profiling import StackSampler
+
+
+def sampled(sampler):
+    # The background thread sleeps a minute before sampling, so only these calls count
+    sampler._sample()
+
+
+def other_caller(sampler):
+    sampler._sample()
+
+
+def test_samples_are_collapsed_per_endpoint():
+    sampler = StackSampler(interval=60)
+    sampler.start("views.home")
+    sampled(sampler)
+    sampled(sampler)
+    sampler.stop()
+    lines = sampler.collapsed().splitlines()
+    assert len(lines) == 1
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("views.home;")
+    sample_line = StackSampler._sample.__code__.co_firstlineno
+    assert stack.endswith(f";sampled (test_profiling.py:{sampled.__code__.co_firstlineno})"
+                          f";_sample (profiling.py:{sample_line})")
+    assert count == "2"
+    assert not sampler.collapsed("views.home").startswith("views.home;")
+    assert sampler.stats()["endpoints"] == {"views.home": {"requests": 1, "samples": 2}}
+
+
+def test_stacks_beyond_max_stacks_are_truncated():
+    sampler = StackSampler(interval=60, max_stacks=1)
+    sampler.start("views.home")
+    sampled(sampler)
+    other_caller(sampler)
+    sampler.stop()
+    lines = sampler.collapsed().splitlines()
+    assert len(lines) == 2
+    assert "views.home;[truncated] 1" in lines
+
+
+def test_stopped_threads_are_not_sampled():
+    sampler = StackSampler(interval=60)
+    sampler.start("views.home")
+    sampler.stop()
+    sampled(sampler)
+    assert sampler.collapsed() == ""
+    sampler.clear()
+    assert sampler.stats()["endpoints"] == {}
+
+
+def test_sampling_rate():
+    assert not StackSampler(rate=0.0).should_sample()
+    assert StackSampler(rate=1.0).should_sample()
+
+
+def test_background_thread_samples_active_requests():
+    sampler = StackSampler(interval=0.001)
+    done = threading.Event()
+
+    def request():
+        sampler.start("views.slow")
+        done.wait(5.0)
+        sampler.stop()
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    try:
+        for _ in range(500):
+            if sampler.stats()["endpoints"].get("views.slow", {}).get("samples"):
+                break
+            time.sleep(0.01)
+    finally:
+        done.set()
+        thread.join()
+    assert "request (test_profiling.py:" in sampler.collapsed("views.slow")
@@ -0,0 +1,65 @@
+import random
+
+import numpy as np
+
+from ai_agents.related import RelatedTerms
+
+WORDS = ("agent analytics chatbot churn cloud customer data embedding forecast fraud graph "
+         "language learning machine model network neural pricing prompt retrieval search "
+         "sentiment speech training vector vision").split()
+
+
+def synthetic_terms(count, rng, start=0):
+    return [(f"term-{index}", " ".join(rng.sample(WORDS, 2)),
+             " ".join(rng.choices(WORDS, k=rng.randint(4, 10))))
+            for index in range(start, start + count)]
+
+
+def expected_scores(engine, k):
+    # Top-k similarities of every row to every other, from the engine's own vectors
+    count = len(engine)
+    similarities = engine._vectors[:count] @ engine._vectors[:count].T
+    np.fill_diagonal(similarities, -np.inf)
+    return -np.sort(-similarities, axis=1)[:, :k]
+
+
+def test_add_many_matches_a_full_comparison():
+    rng = random.Random(3)
+    engine = RelatedTerms(dim=64, max_k=5, batch_size=16)
+    engine.build(synthetic_terms(40, rng))
+    engine.add_many(synthetic_terms(30, rng, start=40))
+    for key, name, definition in synthetic_terms(3, rng):
+        # Redefined terms
+        engine.add(key, name, definition)
+    np.testing.assert_allclose(engine._scores[:len(engine)], expected_scores(engine, 5),
+                               rtol=1e-5, atol=1e-6)
+
+
+def test_changed_term_leaves_no_stale_scores():
+    engine = RelatedTerms(dim=64, max_k=2)
+    engine.build([("a", "neural network", "neural network model"),
+                  ("b", "neural model", "neural network training"),
+                  ("c", "cloud pricing", "cloud pricing data")])
+    assert engine.related("a", 1) == ["neural model"]
+    engine.add("b", "fraud search", "fraud search speech")
+    assert engine.related("a", 2) == []
+    np.testing.assert_allclose(engine._scores[:3], expected_scores(engine, 2), atol=1e-6)
+
+
+def test_unrelated_terms_are_not_neighbours():
+    engine = RelatedTerms(dim=64)
+    engine.build([("a", "neural network", "neural network model"),
+                  ("b", "cloud pricing", "cloud pricing data"),
+                  ("c", "neural model", "neural model training")])
+    assert engine.related("a") == ["neural model"]
+    assert engine.related("b") == []
+
+
+def test_stale_after_the_documents_double():
+    rng = random.Random(5)
+    engine = RelatedTerms(dim=64)
+    engine.build(synthetic_terms(10, rng))
+    engine.add_many(synthetic_terms(10, rng, start=10))
+    assert not engine.stale
+    engine.add("term-20", "neural model", "neural model")
+    assert engine.stale
@@ -0,0 +1,123 @@
+import pytest
+
+from ai_agents.models import DefinitionAgent, GlossaryAgent, GlossaryTerm
+from ai_agents.repository import MemoryRepository, SQLiteRepository
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryRepository()
+    else:
+        repository = SQLiteRepository(str(tmp_path / "glossary.db"))
+        yield repository
+        repository.close()
+
+
+def test_new_repository_is_seeded(repository):
+    agent = DefinitionAgent(repository=repository)
+    assert agent.resolve_key("ML") == "machine learning"
+    assert agent.resolve_key("chat  bot") == "chatbot"
+    assert "generative ai" in agent.predefined_terms
+
+
+def test_add_many_and_examples(repository):
+    repository.add_many([("RAG", "Retrieval augmented generation.", "Advanced AI"),
+                         ("Embedding", "A vector for a piece of text.", "Core AI")])
+    repository.add_examples([("rag", "First."), ("rag", "Second.")])
+    assert repository.terms["rag"].examples == ("First.", "Second.")
+    assert repository.terms["embedding"].category == "Core AI"
+
+
+def test_add_many_redefines_in_place(repository):
+    repository.add_many([("RAG", "Old.", "Core AI")])
+    repository.add_examples([("rag", "Kept.")])
+    repository.learned.claim("rag", repository.terms["rag"])
+    repository.add_many([("RAG", "New.", "Advanced AI")])
+    assert repository.learned["rag"].definition == "New."
+    assert repository.learned["rag"].category == "Advanced AI"
+    assert repository.learned["rag"].examples == ("Kept.",)
+
+
+def test_assigning_a_term_twice_keeps_one_copy_of_each_example(repository):
+    repository.add_many([("RAG", "Old.", "Core AI")])
+    term = GlossaryTerm("RAG", "Retrieval augmented generation.", "Advanced AI")
+    term.add_example("First.")
+    repository.learned["rag"] = term
+    term.add_example("Second.")
+    repository.learned["rag"] = term
+    assert "rag" in repository.learned
+    assert repository.learned["rag"].definition == "Retrieval augmented generation."
+    assert repository.learned["rag"].examples == ("First.", "Second.")
+
+
+def test_reopening_drops_repeated_examples_from_older_databases(tmp_path):
+    path = str(tmp_path / "glossary.db")
+    repository = SQLiteRepository(path)
+    repository.add_many([("RAG", "Old.", "Core AI")], [("rag", "First.")])
+    repository.execute("DROP INDEX glossary_example_text")
+    repository.execute("INSERT INTO glossary_example (term_key, text) VALUES ('rag', 'First.')")
+    repository.close()
+
+    repository = SQLiteRepository(path)
+    assert repository.terms["rag"].examples == ("First.",)
+    repository.close()
+
+
+def test_curated_alias_replacement_survives_restart(tmp_path):
+    path = str(tmp_path / "glossary.db")
+    repository = SQLiteRepository(path)
+    agent = DefinitionAgent(repository=repository)
+    repository.execute("DELETE FROM glossary_alias WHERE alias = 'ml'")
+    agent.add_term("ML", "Markup language.", "Other")
+    repository.close()
+
+    repository = SQLiteRepository(path)
+    agent = DefinitionAgent(repository=repository)
+    assert not repository.created
+    assert agent.resolve_key("ML") == "ml"
+    assert agent.lookup("ml").definition == "Markup language."
+    repository.close()
+
+
+def test_deleted_seed_term_is_not_restored(tmp_path):
+    path = str(tmp_path / "glossary.db")
+    repository = SQLiteRepository(path)
+    agent = GlossaryAgent(repository=repository)
+    del agent.definition_agent.predefined_terms["chatbot"]
+    repository.close()
+
+    repository = SQLiteRepository(path)
+    agent = GlossaryAgent(repository=repository)
+    assert "chatbot" not in agent.definition_agent.predefined_terms
+    repository.close()
+
+
+def test_alias_is_not_seeded_over_a_term(repository):
+    repository.add_many([("GenAI", "A curated GenAI entry.", "Other")])
+    agent = DefinitionAgent(repository=repository)
+    assert agent.resolve_key("GenAI") == "genai"
+
+
+def test_add_many_writes_terms_and_examples_in_one_transaction(tmp_path):
+    repository = SQLiteRepository(str(tmp_path / "glossary.db"))
+
+    def examples():
+        yield "rag", "First."
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        repository.add_many([("RAG", "Retrieval augmented generation.", "Advanced AI")], examples())
+    assert "rag" not in repository.terms
+    repository.close()
+
+
+def test_sqlite_after_fork_opens_a_new_connection(tmp_path):
+    repository = SQLiteRepository(str(tmp_path / "glossary.db"))
+    inherited = repository._connection()
+    repository.after_fork()
+    assert repository._connection() is not inherited
+    repository.add_many([("RAG", "Retrieval augmented generation.", "Advanced AI")])
+    assert repository.terms["rag"].definition == "Retrieval augmented generation."
+    inherited.close()
+    repository.close()
@@ -0,0 +1,64 @@
+import random
+
+from ai_agents.search import SearchIndex, levenshtein
+
+TERMS = ["Machine Learning", "Machine Vision", "Generative AI", "Chatbot",
+         "Large Language Model", "Prompt Engineering"]
+
+
+def test_levenshtein():
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3
+    assert levenshtein("abc", "abc") == 0
+
+
+def test_prefix_is_alphabetical():
+    index = SearchIndex(TERMS)
+    assert index.prefix("mach") == ["Machine Learning", "Machine Vision"]
+    assert index.prefix("MACHINE  v") == ["Machine Vision"]
+    assert index.prefix("zzz") == []
+
+
+def test_fuzzy_whole_key():
+    index = SearchIndex(TERMS)
+    assert index.fuzzy("chatbto") == ["Chatbot"]
+    assert index.fuzzy("machne") == []
+
+
+def test_fuzzy_prefix():
+    index = SearchIndex(TERMS)
+    assert index.fuzzy_prefix("machne") == ["Machine Learning", "Machine Vision"]
+    assert index.fuzzy_prefix("mahcine l") == ["Machine Learning"]
+    assert index.fuzzy_prefix("maxhine v") == ["Machine Vision"]
+    assert index.fuzzy_prefix("prmpt") == ["Prompt Engineering"]
+    assert index.fuzzy_prefix("pxompt exgin") == []
+
+
+def test_search_matches_typos_in_a_partial_prefix():
+    index = SearchIndex(TERMS)
+    assert index.search("machne") == ["Machine Learning", "Machine Vision"]
+    assert index.search("genrative") == ["Generative AI"]
+
+
+def test_search_falls_back_to_two_edits_for_long_queries():
+    index = SearchIndex(TERMS)
+    assert index.search("machne lerning") == ["Machine Learning"]
+
+
+def test_search_prefers_prefix_matches():
+    index = SearchIndex(TERMS + ["Machne"])
+    # "machne" is a prefix of a term, so no fuzzy matches are added
+    assert index.search("machne") == ["Machne"]
+
+
+def test_search_skips_fuzzy_for_short_queries():
+    index = SearchIndex(TERMS)
+    assert index.search("mxc") == []
+
+
+def test_add_keeps_prefix_order():
+    index = SearchIndex(TERMS)
+    index.add("Machine Translation")
+    index.add("machine translation")
+    assert len(index) == len(TERMS) + 1
+    assert index.prefix("machine") == ["Machine Learning", "Machine Translation", "Machine Vision"]
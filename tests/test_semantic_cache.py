@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from ai_agents.models import DefinitionAgent
+from ai_agents.semantic_cache import SemanticCache, embed
+
+
+def test_embed_ignores_punctuation_plurals_and_word_order():
+    expected = embed("machine learning")
+    for paraphrase in ("machine-learning", "learning machines", "machine learnings"):
+        assert np.allclose(embed(paraphrase), expected)
+    assert np.linalg.norm(expected) == pytest.approx(1.0)
+    assert not np.allclose(embed("deep learning"), expected)
+
+
+def test_similar_keys_hit_and_unrelated_keys_miss():
+    cache = SemanticCache(max_size=4)
+    cache.put("machine learning", "ml")
+    assert cache.get("machine learning") == "ml"
+    assert cache.get("learning machines") == "ml"
+    assert cache.get("quantum computing") is None
+    stats = cache.stats()
+    assert (stats["exact_hits"], stats["similar_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_least_recently_used_key_is_evicted():
+    cache = SemanticCache(max_size=2)
+    cache.put("alpha", 1)
+    cache.put("beta", 2)
+    cache.get("alpha")
+    cache.put("gamma", 3)
+    assert "beta" not in cache
+    assert cache.get("beta") is None
+    assert cache.get("alpha") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_popped_and_cleared_keys_no_longer_match():
+    cache = SemanticCache(max_size=2)
+    cache.put("machine learning", "ml")
+    assert cache.pop("machine learning") == "ml"
+    assert cache.get("learning machines") is None
+    cache.put("neural network", "nn")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("neural networks") is None
+
+
+def test_max_size_must_be_positive():
+    with pytest.raises(ValueError):
+        SemanticCache(max_size=0)
+
+
+class ModelBackend:
+    def __init__(self):
+        self.calls = []
+
+    def define(self, term):
+        self.calls.append(term)
+        return f"{term} is a term a model defined."
+
+
+def test_paraphrase_reuses_the_generated_definition():
+    backend = ModelBackend()
+    agent = DefinitionAgent(generator=backend)
+    first = agent.get_definition("Blorf Engines")
+    assert agent.get_definition("blorf-engine") is first
+    assert backend.calls == ["Blorf Engines"]
+    assert agent.get_definition("blorf-engine", similar=False) is not first
+
+
+def test_curating_a_key_drops_its_paraphrases():
+    agent = DefinitionAgent(generator=ModelBackend())
+    agent.get_definition("Blorf Engines")
+    agent.add_term("Blorf Engines", "A curated definition.", "Other")
+    assert agent.lookup(agent.resolve_key("blorf engine")) is None
@@ -0,0 +1,40 @@
+from ai_agents.sentiment import SentimentAnalysisTool, compile_lexicon
+
+
+def test_original_word_lists():
+    tool = SentimentAnalysisTool(workers=1)
+    assert tool.analyze("Thanks, the demo was great!") == "Positive"
+    assert tool.analyze("Support was poor and the onboarding terrible.") == "Negative"
+    assert tool.analyze("Recent reviews mention slow delivery and a billing problem.") == "Neutral"
+
+
+def test_only_whole_words_count():
+    tool = SentimentAnalysisTool(workers=1)
+    assert tool.score("Goodbye, badminton fans") == 0
+    assert tool.score("good, GOOD; bad") == 1
+
+
+def test_word_in_both_lists_is_dropped():
+    assert compile_lexicon(["fine", "Good"], ["fine", "bad"]) == {"good": 1, "bad": -1}
+
+
+def test_batches_score_in_order():
+    tool = SentimentAnalysisTool(workers=1, chunk_size=2)
+    texts = ["great", "bad", "neither", "good good"]
+    assert tool.score_batch(iter(texts)) == [1, -1, 0, 2]
+    assert tool.analyze_batch(texts) == ["Positive", "Negative", "Neutral", "Positive"]
+
+
+def test_pooled_batches_match_single_process_scores():
+    texts = ["great", "bad", "neither", "good good", "shiny", "rusty rusty", "great but bad"] * 3
+    single = SentimentAnalysisTool(["great", "good", "shiny"], ["bad", "rusty"], workers=1)
+    pooled = SentimentAnalysisTool(["great", "good", "shiny"], ["bad", "rusty"],
+                                   workers=2, chunk_size=2)
+    try:
+        # Workers score with the tool's own lexicon, and chunks come back in order
+        assert pooled.score_batch(iter(texts)) == single.score_batch(texts)
+        assert pooled.score_batch(texts)[4:6] == [1, -2]
+        assert pooled.analyze_batch(texts[:4]) == ["Positive", "Negative", "Neutral", "Positive"]
+    finally:
+        pooled.close()
+    assert pooled._executor is None
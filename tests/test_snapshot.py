@@ -0,0 +1,194 @@
+import multiprocessing
+
+import pytest
+
+from ai_agents import snapshot
+from ai_agents.models import GlossaryAgent
+from ai_agents.snapshot import (SnapshotWatcher, load_snapshot, swap_in, write_at_exit,
+                                write_snapshot)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "glossary.snap")
+    agent = GlossaryAgent()
+    agent.learn_starter_terms()
+    agent.definition_agent.add_term("RAG", "Retrieval augmented generation.", "Advanced AI")
+    agent.search_index
+    write_snapshot(agent, path)
+
+    loaded = load_snapshot(path)
+    assert loaded.list_terms() == agent.list_terms()
+    assert loaded.glossary["machine learning"].examples == agent.glossary["machine learning"].examples
+    assert loaded.explain_term("RAG")["definition"] == "Retrieval augmented generation."
+    assert loaded.search("ragg") == ["RAG"]
+
+
+def test_loaded_aliases_are_not_reseeded(tmp_path):
+    path = str(tmp_path / "glossary.snap")
+    agent = GlossaryAgent()
+    del agent.definition_agent.aliases._targets["ml"]
+    agent.definition_agent.add_term("ML", "Markup language.", "Other")
+    write_snapshot(agent, path)
+
+    loaded = load_snapshot(path)
+    assert loaded.explain_term("ML")["definition"] == "Markup language."
+
+
+class ModelBackend:
+    def define(self, term):
+        return f"{term} is a term a model defined."
+
+
+def published(path, term, definition):
+    # Another process loads the snapshot, adds a term and publishes it again
+    agent = load_snapshot(path)
+    agent.definition_agent.add_term(term, definition, "Other")
+    write_snapshot(agent, path)
+
+
+def test_swap_in_keeps_what_the_worker_learned(tmp_path):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    worker = load_snapshot(path, generator=ModelBackend())
+    worker.learn_term("Vector Database")
+    published(path, "RAG", "Retrieval augmented generation.")
+
+    swapped = swap_in(path, worker)
+    assert swapped.explain_term("RAG")["definition"] == "Retrieval augmented generation."
+    assert "Vector Database" in swapped.list_terms()
+    assert swapped.glossary["vector database"].examples == worker.glossary["vector database"].examples
+    assert swapped.search("vector") == ["Vector Database"]
+
+
+def test_exit_snapshot_merges_into_a_newer_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    monkeypatch.setattr(snapshot, "_exit_snapshots", {})
+    monkeypatch.setattr(snapshot.atexit, "register", lambda function: function)
+    worker = load_snapshot(path, generator=ModelBackend())
+    write_at_exit(worker, path)
+    worker.learn_term("Vector Database")
+    published(path, "RAG", "Retrieval augmented generation.")
+
+    snapshot._write_exit_snapshots()
+    loaded = load_snapshot(path)
+    assert loaded.explain_term("RAG")["definition"] == "Retrieval augmented generation."
+    assert "Vector Database" in loaded.list_terms()
+
+
+def exit_with_term(path, term, barrier):
+    # One process: loads the snapshot, adds a term, and writes at exit with another
+    agent = load_snapshot(path)
+    write_at_exit(agent, path)
+    agent.definition_agent.add_term(term, f"{term} defined.", "Other")
+    barrier.wait()
+    snapshot._write_exit_snapshots()
+
+
+@pytest.mark.skipif(snapshot.fcntl is None, reason="exit writes are only locked with fcntl")
+def test_processes_exiting_together_keep_each_others_terms(tmp_path, monkeypatch):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    monkeypatch.setattr(snapshot, "_exit_snapshots", {})
+    monkeypatch.setattr(snapshot.atexit, "register", lambda function: function)
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(2)
+    processes = [context.Process(target=exit_with_term, args=(path, term, barrier))
+                 for term in ("RAG", "Embedding")]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+        assert process.exitcode == 0
+
+    loaded = load_snapshot(path)
+    assert loaded.explain_term("RAG")["definition"] == "RAG defined."
+    assert loaded.explain_term("Embedding")["definition"] == "Embedding defined."
+
+
+def test_watcher_reports_each_replaced_file_once(tmp_path):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    watcher = SnapshotWatcher(path, interval=0)
+    assert not watcher.changed()
+    published(path, "RAG", "Retrieval augmented generation.")
+    assert watcher.changed()
+    assert not watcher.changed()
+
+
+def test_watcher_checks_at_most_once_per_interval(tmp_path):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    watcher = SnapshotWatcher(path, interval=60)
+    published(path, "RAG", "Retrieval augmented generation.")
+    assert not watcher.changed()
+
+
+def test_read_only_process_does_not_write_at_exit(tmp_path, monkeypatch):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    monkeypatch.setattr(snapshot, "_exit_snapshots", {})
+    monkeypatch.setattr(snapshot.atexit, "register", lambda function: function)
+    reader = load_snapshot(path)
+    write_at_exit(reader, path)
+    reader.explain_term("ML")
+    published(path, "RAG", "Retrieval augmented generation.")
+
+    snapshot._write_exit_snapshots()
+    assert load_snapshot(path).explain_term("RAG")["definition"] == "Retrieval augmented generation."
+
+
+def test_generated_definitions_do_not_count_as_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    monkeypatch.setattr(snapshot, "_exit_snapshots", {})
+    monkeypatch.setattr(snapshot.atexit, "register", lambda function: function)
+    reader = load_snapshot(path)
+    write_at_exit(reader, path)
+    jobs = reader.start_jobs(workers=1, processes=False)
+    try:
+        reader.explain_term("Blorf")
+        assert jobs.wait("blorf", 5.0)
+    finally:
+        jobs.close()
+    published(path, "RAG", "Retrieval augmented generation.")
+    identity = snapshot._stat(path)
+
+    snapshot._write_exit_snapshots()
+    assert not snapshot._changes[reader]
+    assert snapshot._stat(path) == identity
+
+
+def test_forked_worker_starts_with_nothing_to_write(tmp_path, monkeypatch):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    monkeypatch.setattr(snapshot, "_exit_snapshots", {})
+    monkeypatch.setattr(snapshot.atexit, "register", lambda function: function)
+    parent = load_snapshot(path, generator=ModelBackend())
+    write_at_exit(parent, path, changed=True)
+    parent.learn_term("Vector Database")
+    parent.after_fork()
+    identity = snapshot._stat(path)
+
+    snapshot._write_exit_snapshots()
+    assert snapshot._stat(path) == identity
+    parent.learn_term("Knowledge Graph")
+    snapshot._write_exit_snapshots()
+    assert "Knowledge Graph" in load_snapshot(path).list_terms()
+
+
+def test_swap_in_takes_over_the_job_queue(tmp_path):
+    path = str(tmp_path / "glossary.snap")
+    write_snapshot(GlossaryAgent(), path)
+    worker = load_snapshot(path)
+    jobs = worker.start_jobs(workers=1, processes=False)
+    try:
+        published(path, "RAG", "Retrieval augmented generation.")
+        swapped = swap_in(path, worker)
+        assert swapped.jobs is jobs
+        assert swapped.example_agent is worker.example_agent
+        swapped.explain_term("Blorf")
+        assert jobs.wait("blorf", 5.0)
+        assert swapped.definition_agent.generated_terms.get("blorf") is not None
+    finally:
+        jobs.close()
@@ -0,0 +1,93 @@
+"""Many threads sharing one GlossaryAgent, checked against its invariants.
+
+Short by default; set GLOSSARY_STRESS_OPERATIONS (per thread) and
+GLOSSARY_STRESS_THREADS for a longer run. benchmarks/stress_agent.py runs
+the same mix as a benchmark.
+"""
+import os
+import random
+import sys
+import threading
+
+import pytest
+
+from ai_agents.models import GlossaryAgent
+from ai_agents.repository import SQLiteRepository
+
+THREADS = int(os.environ.get("GLOSSARY_STRESS_THREADS", 8))
+OPERATIONS = int(os.environ.get("GLOSSARY_STRESS_OPERATIONS", 150))
+
+
+class ModelBackend:
+    def define(self, term):
+        return f"{term} is a term defined for the stress test."
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def agent(request, tmp_path):
+    repository = None
+    if request.param == "sqlite":
+        repository = SQLiteRepository(str(tmp_path / "stress.db"))
+    yield GlossaryAgent(repository=repository, generator=ModelBackend())
+    if repository is not None:
+        repository.close()
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    # Switching threads often makes races likely within a short run
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_learn_explain_search(agent):
+    contested = [f"Contested Term {number}" for number in range(20)]
+    learned, errors = [], []
+    barrier = threading.Barrier(THREADS)
+
+    def worker(number):
+        rng = random.Random(number)
+        barrier.wait()
+        try:
+            for operation in range(OPERATIONS):
+                roll = rng.random()
+                if roll < 0.5:
+                    term = rng.choice(["Machine Learning", "GenAI", "Chatbot",
+                                       f"Unknown {rng.randrange(100)}", rng.choice(contested)])
+                    explanation = agent.explain_term(term)
+                    assert explanation["definition"] and explanation["examples"]
+                elif roll < 0.7:
+                    for name in agent.search(rng.choice(["mach", "contested", "thread", "chatbto"])):
+                        assert agent.definition_agent.resolve_key(name) in agent.definition_agent.predefined_terms
+                elif roll < 0.85:
+                    agent.learn_term(rng.choice(contested))
+                else:
+                    term = f"Thread {number} Term {operation}"
+                    agent.learn_term(term)
+                    learned.append(term)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+    definitions = agent.definition_agent
+    learned += [term for term in contested if definitions.resolve_key(term) in agent.glossary]
+    assert learned
+    for term in learned:
+        key = definitions.resolve_key(term)
+        stored = definitions.predefined_terms.get(key)
+        assert stored is not None, term
+        assert key in agent.glossary, term
+        assert len(stored.examples) == 1, term
+        assert key not in definitions.generated_terms, term
+        assert agent.search(term, limit=1) == [stored.term]
+    names = agent.list_terms()
+    assert len(names) == len(set(names)) == len(agent.glossary)
+    assert sum(count for _, count in agent.categories()) == len(agent.glossary)
@@ -0,0 +1,100 @@
+from array import array
+
+import pytest
+
+from ai_agents.models import GlossaryAgent, GlossaryTerm
+from ai_agents.term_store import StringColumn, TermIndex, TermStore
+
+
+def test_add_and_view():
+    store = TermStore()
+    index = TermIndex(store)
+    view = index.add("rag", "RAG", "Retrieval augmented generation.", "Advanced AI")
+    view.add_example("An example.")
+    assert index["rag"].term == "RAG"
+    assert index["rag"].definition == "Retrieval augmented generation."
+    assert index["rag"].category == "Advanced AI"
+    assert index["rag"].examples == ("An example.",)
+
+
+def test_indexes_share_rows():
+    store = TermStore()
+    terms, learned = TermIndex(store), TermIndex(store)
+    learned["rag"] = terms.add("rag", "RAG", "Old.", "Core AI")
+    assert len(store) == 1
+    assert learned["rag"] == terms["rag"]
+
+
+def test_redefinition_updates_the_row_in_place():
+    store = TermStore()
+    terms, learned = TermIndex(store), TermIndex(store)
+    learned["rag"] = terms.add("rag", "RAG", "Old.", "Core AI")
+    terms["rag"].add_example("Kept.")
+    terms.add("rag", "RAG", "New.", "Advanced AI")
+    assert len(store) == 1
+    assert learned["rag"].definition == "New."
+    assert learned["rag"].category == "Advanced AI"
+    assert learned["rag"].examples == ("Kept.",)
+
+
+def test_assigning_over_a_bound_key_adds_examples():
+    store = TermStore()
+    terms = TermIndex(store)
+    terms.add("rag", "RAG", "Old.", "Core AI").add_example("First.")
+    replacement = GlossaryTerm("RAG", "New.", "Core AI")
+    replacement.add_example("Second.")
+    terms["rag"] = replacement
+    assert len(store) == 1
+    assert terms["rag"].definition == "New."
+    assert terms["rag"].examples == ("First.", "Second.")
+
+
+def test_claim_binds_once():
+    store = TermStore()
+    terms, learned = TermIndex(store), TermIndex(store)
+    view = terms.add("rag", "RAG", "Old.")
+    assert learned.claim("rag", view)
+    assert not learned.claim("rag", view)
+    del learned["rag"]
+    assert "rag" not in learned and "rag" in terms
+
+
+def test_redefined_learned_term_is_listed_under_its_new_category():
+    agent = GlossaryAgent()
+    agent.learn_term("Machine Learning")
+    agent.categories()
+    examples = agent.glossary["machine learning"].examples
+    agent.definition_agent.add_term("Machine Learning", "NEW DEF", "Renamed")
+    assert agent.glossary["machine learning"].definition == "NEW DEF"
+    assert agent.glossary["machine learning"].category == "Renamed"
+    assert agent.glossary["machine learning"].examples == examples
+    assert agent.categories() == [("Renamed", 1)]
+
+
+def test_string_column_never_writes_to_its_initial_buffer():
+    base = bytes("abcé", "utf-8")
+    column = StringColumn(base, array("Q", [0, 2, 5]))
+    column.append("new")
+    column.append("")
+    assert [column[index] for index in range(len(column))] == ["ab", "cé", "new", ""]
+    assert base == bytes("abcé", "utf-8")
+    data, offsets = column.buffers()
+    assert bytes(data) == bytes("abcénew", "utf-8")
+    assert list(offsets) == [0, 2, 5, 8, 8]
+
+
+def test_view_examples_are_read_only():
+    store = TermStore()
+    view = store.view(store.add("RAG", "Retrieval augmented generation."))
+    with pytest.raises(AttributeError):
+        view.examples.append("Lost.")
+    view.add_example("Kept.")
+    assert view.examples == ("Kept.",)
+    assert view.to_dict()["examples"] == ["Kept."]
+
+
+def test_more_categories_than_fit_in_16_bits():
+    store = TermStore()
+    for number in range(70_000):
+        term_id = store.add(f"Term {number}", "A definition.", f"Category {number}")
+    assert store.category(term_id) == "Category 69999"
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+
+from ai_agents import create_app, views
+from ai_agents.cache import LRUCache
+from ai_agents.metrics import metrics
+from ai_agents.models import GlossaryAgent
+from ai_agents.profiling import profiler
+
+
+@pytest.fixture
+def agent():
+    return GlossaryAgent()
+
+
+@pytest.fixture
+def client(agent):
+    app = create_app()
+    app.config["TESTING"] = True
+    views.use_agent(agent)
+    agent.learn_starter_terms()
+    return app.test_client()
+
+
+def test_home_lists_learned_terms(client):
+    response = client.get("/")
+    assert response.status_code == 200
+    assert b"Machine Learning" in response.data
+
+
+def test_term_page_is_cached_and_conditional(client):
+    first = client.get("/term?term=ML")
+    assert first.status_code == 200
+    assert b"Machine Learning" in first.data
+    assert "public" in first.headers["Cache-Control"]
+    again = client.get("/term?term=ML", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_autocomplete(client):
+    assert client.get("/autocomplete?q=machne").get_json()["results"] == ["Machine Learning"]
+    assert client.get("/autocomplete?q=").get_json()["results"] == []
+
+
+@pytest.mark.parametrize("limit", [0, -5])
+def test_autocomplete_returns_at_least_one_result(client, limit):
+    response = client.get(f"/autocomplete?q=machne&limit={limit}")
+    assert response.get_json()["results"] == ["Machine Learning"]
+
+
+def test_evicted_generated_term_page_is_invalidated(agent):
+    agent.definition_agent.generated_terms = LRUCache(max_size=1)
+    app = create_app()
+    views.use_agent(agent)
+    client = app.test_client()
+    client.get("/term?term=Blorf")
+    assert views.page_cache.get("term", "blorf") is not None
+    client.get("/term?term=Zap")
+    assert views.page_cache.get("term", "blorf") is None
+
+
+def test_post_learns_curated_terms(client, agent):
+    response = client.post("/term", data={"term": "Chatbot"})
+    assert response.status_code == 303
+    assert "Chatbot" in agent.list_terms()
+
+
+def test_post_does_not_keep_placeholder_definitions(client, agent):
+    client.post("/term", data={"term": "blorf zap"})
+    assert "blorf zap" not in agent.definition_agent.predefined_terms
+    assert "Blorf Zap" not in agent.list_terms()
+
+
+def test_pending_placeholder_is_not_cached(client, agent):
+    jobs = agent.start_jobs(workers=1, processes=False, backend_options={"batch_latency": 0.5})
+    try:
+        pending = client.get("/term?term=Blorf")
+        assert b"placeholder" in pending.data
+        assert pending.headers["Cache-Control"] == "no-store"
+        assert "ETag" not in pending.headers
+        assert views.page_cache.get("term", "blorf") is None
+        assert jobs.wait("blorf", 5.0)
+        ready = client.get("/term?term=Blorf")
+        assert "public" in ready.headers["Cache-Control"]
+        assert views.page_cache.get("term", "blorf") is not None
+    finally:
+        jobs.close()
+
+
+def test_batch_explain_streams_ndjson(client):
+    response = client.post("/api/terms/batch",
+                           json={"terms": ["ML", " machine learning ", "Chatbot", ""]})
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line["query"] for line in lines] == ["ML", "Chatbot"]
+
+
+def test_batch_explain_rejects_bad_and_oversized_bodies(client):
+    assert client.post("/api/terms/batch", json={"terms": "ML"}).status_code == 400
+    assert client.post("/api/terms/batch", json=[1, 2]).status_code == 400
+    assert client.post("/api/terms/batch", json=["term"] * 501).status_code == 413
+
+
+def test_home_pages_by_category_and_cursor(client):
+    client.application.config["HOME_PAGE_SIZE"] = 1
+    first = client.get("/")
+    assert b"Generative AI" in first.data
+    assert b"Machine Learning" not in first.data
+    assert b"after=generative+ai" in first.data
+    second = client.get("/?after=generative+ai")
+    assert b"Machine Learning" in second.data
+    assert b"Next page" not in second.data
+    core = client.get("/?category=Core+AI")
+    assert b"Machine Learning" in core.data
+    assert b"Generative AI</a></li>" not in core.data
+
+
+def test_metrics_report_request_latency_and_gauges(client):
+    client.get("/autocomplete?q=ml")
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'glossary_request_seconds_count{method="GET",route="/autocomplete"}' in text
+    assert 'glossary_terms{set="learned"} 2.0\n' in text
+    assert "glossary_jobs_queued 0.0\n" in text
+
+
+def test_metrics_page_is_hidden_when_disabled(client, monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", False)
+    assert client.get("/metrics").status_code == 404
+
+
+def test_profile_requires_the_token(client):
+    assert client.get("/admin/profile").status_code == 404
+    client.application.config["PROFILE_TOKEN"] = "secret"
+    assert client.get("/admin/profile").status_code == 403
+    wrong = {"Authorization": "Bearer guess"}
+    assert client.get("/admin/profile", headers=wrong).status_code == 403
+    assert client.delete("/admin/profile", headers=wrong).status_code == 403
+
+
+def test_profile_serves_and_clears_samples(client, monkeypatch):
+    client.application.config["PROFILE_TOKEN"] = "secret"
+    authorized = {"Authorization": "Bearer secret"}
+    monkeypatch.setattr(profiler, "interval", 60)
+    profiler.clear()
+    profiler.start("views.home")
+    profiler._sample()
+    profiler.stop()
+
+    collapsed = client.get("/admin/profile", headers=authorized)
+    assert collapsed.mimetype == "text/plain"
+    assert collapsed.get_data(as_text=True).startswith("views.home;")
+    only = client.get("/admin/profile?endpoint=views.home", headers=authorized)
+    assert not only.get_data(as_text=True).startswith("views.home;")
+    stats = client.get("/admin/profile?format=json", headers=authorized).get_json()
+    assert stats["endpoints"]["views.home"] == {"requests": 1, "samples": 1}
+
+    assert client.delete("/admin/profile", headers=authorized).status_code == 204
+    assert client.get("/admin/profile", headers=authorized).get_data() == b""